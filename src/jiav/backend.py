@@ -1,20 +1,25 @@
 #!/usr/bin/env python
 
+import importlib
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, NamedTuple
+from typing import Any, Dict, List, NamedTuple, Type, Union
 
-import jsonschema
 import jsonschema.exceptions
 from importlib_metadata import entry_points
 from referencing.jsonschema import Schema
 
-from jiav import exceptions
+from jiav import exceptions, logger
+from jiav.schema import validate
+
+jiav_logger = logger.subscribe_to_logger()
 
 
 class Result(NamedTuple):
     successful: bool
     output: List[str]
     errors: List[str]
+    timed_out: bool = False
 
 
 class BaseBackend(ABC):
@@ -29,9 +34,20 @@ class BaseBackend(ABC):
         schema - json_schema to be used to verify that the supplied setp
                  is valid according to the backends's requirments
         step   - Instructions to perform according to backend
+
+    Class attributes:
+        ISSUE_FIELDS - Issue fields the backend reads from Jira issues, only
+                       these fields are requested from Jira, and they are
+                       also requested when fetching the verified issues
+        IDEMPOTENT   - Whether executing a step again during the same run
+                       produces the same result without side effects,
+                       identical steps of idempotent backends are executed
+                       once per run
     """
 
     # SCHEMA: Dict = {}
+    ISSUE_FIELDS: List[str] = []
+    IDEMPOTENT: bool = True
 
     def __init__(self, name: str, schema: Schema, step: Dict) -> None:
         self.name = name if name else "placeholder"
@@ -47,7 +63,7 @@ class BaseBackend(ABC):
         Returns True if backend schema is valid
         """
         try:
-            jsonschema.validate(instance=self.step, schema=self.schema)
+            validate(instance=self.step, schema=self.schema)
         except jsonschema.exceptions.ValidationError as e:
             raise exceptions.InvalidManifestException(e)
         return True
@@ -65,20 +81,89 @@ class BaseBackend(ABC):
         pass
 
 
+# Backends discovered from entry points, discovered once per process
+_backends: Union[Dict[str, Dict[str, Any]], None] = None
+# Backend classes resolved so far
+_backend_classes: Dict[str, Type[BaseBackend]] = {}
+_registry_lock = threading.Lock()
+
+
 def import_backends() -> Dict[str, Dict[str, Any]]:
     """
     Imports all valid backends from jiav/api/backends directory
 
-    All valid backends are inherited from BaseBackend object
+    All valid backends are inherited from BaseBackend object, entry points
+    are only scanned by the first call
 
     Returns:
         exposed_backends - List of valid backend objects based on inherited
         from BaseBackend object
     """
-    discovered_backends = entry_points(group="jiav.backend")
-    exposed_backends: Dict[str, Dict[str, Any]] = {}
-    for backend in discovered_backends:
-        exposed_backends.update(
-            {backend.name: {"version": backend.dist.version, "class": backend.value}}
-        )
-    return exposed_backends
+    global _backends
+    with _registry_lock:
+        if _backends is None:
+            discovered_backends = entry_points(group="jiav.backend")
+            exposed_backends: Dict[str, Dict[str, Any]] = {}
+            for backend in discovered_backends:
+                exposed_backends.update(
+                    {
+                        backend.name: {
+                            "version": backend.dist.version,
+                            "class": backend.value,
+                        }
+                    }
+                )
+            _backends = exposed_backends
+        return dict(_backends)
+
+
+def load_backend(name: str) -> Type[BaseBackend]:
+    """
+    Loads the class of a backend, the module of a backend is imported only
+    the first time the backend is loaded
+
+    Arguments:
+        name - Backend name
+
+    Returns:
+        backend_class - Backend class
+    """
+    if name in _backend_classes:
+        return _backend_classes[name]
+    backends = import_backends()
+    if name not in backends:
+        raise exceptions.InvalidBackend(name)
+    # Entry points reference classes as 'module.Class' or 'module:Class'
+    module_name, _, class_name = (
+        backends[name]["class"].replace(":", ".").rpartition(".")
+    )
+    backend_class: Type[BaseBackend] = getattr(
+        importlib.import_module(module_name), class_name
+    )
+    with _registry_lock:
+        _backend_classes[name] = backend_class
+    return backend_class
+
+
+def get_issue_fields() -> List[str]:
+    """
+    Collects the issue fields declared by all backends in their ISSUE_FIELDS
+    attribute, every backend is loaded
+
+    Backends which fail to load are skipped, they fail again once a manifest
+    uses them
+
+    Returns:
+        issue_fields - Issue fields declared by backends
+    """
+    issue_fields: List[str] = []
+    for name in import_backends():
+        try:
+            backend_class = load_backend(name)
+        except (ImportError, AttributeError) as e:
+            jiav_logger.debug(f"Failed to load backend '{name}': {e}")
+            continue
+        for field in backend_class.ISSUE_FIELDS:
+            if field not in issue_fields:
+                issue_fields.append(field)
+    return issue_fields
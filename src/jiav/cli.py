@@ -1,16 +1,24 @@
 #!/usr/bin/env python
 
 import importlib.metadata
+import signal
+import threading
+import time
 from logging import Logger
-from typing import Any, List, Tuple
+from types import FrameType
+from typing import Any, Callable, Iterator, List, Tuple, Union
 
 import rich_click as click
-from jira import Issue
+from jira import Issue, JIRAError
 
-from jiav import exceptions, logger, summary, verification
+from jiav import exceptions
+from jiav import incremental as checkpoints
+from jiav import logger, summary, verification, watch, webhook
 from jiav.backend import import_backends
-from jiav.jira import JiraConnection
+from jiav.jira import HANDSHAKE_CACHE_TTL, JQL_PAGE_SIZE, JiraConnection
+from jiav.ledger import Ledger
 from jiav.manifest import Manifest
+from jiav.manifest_cache import manifest_cache
 
 click.rich_click.COLOR_SYSTEM = "truecolor"
 click.rich_click.SHOW_METAVARS_COLUMN = False
@@ -19,17 +27,93 @@ click.rich_click.OPTION_GROUPS = {
     "jiav verify": [
         {
             "name": "Main options",
-            "options": ["--jira", "--access-token", "--username"],
+            "options": [
+                "--jira",
+                "--access-token",
+                "--username",
+                "--handshake-cache-ttl",
+                "--transitions-cache-ttl",
+                "--max-requests-per-second",
+                "--manifest-cache-ttl",
+            ],
         },
         {
             "name": "Issue options",
-            "options": ["--issue", "--query"],
+            "options": [
+                "--issue",
+                "--query",
+                "--incremental",
+                "--page-size",
+                "--workers",
+                "--manifest-timeout",
+            ],
+        },
+        {
+            "name": "Transport options",
+            "options": ["--record", "--replay"],
         },
         {
             "name": "Dangerous options",
             "options": ["--upload-attachment", "--allow-public-comments"],
         },
-    ]
+    ],
+    "jiav watch": [
+        {
+            "name": "Main options",
+            "options": [
+                "--jira",
+                "--access-token",
+                "--username",
+                "--handshake-cache-ttl",
+                "--transitions-cache-ttl",
+                "--max-requests-per-second",
+                "--manifest-cache-ttl",
+            ],
+        },
+        {
+            "name": "Watch options",
+            "options": [
+                "--query",
+                "--interval",
+                "--heartbeat-file",
+                "--page-size",
+                "--workers",
+                "--manifest-timeout",
+            ],
+        },
+        {
+            "name": "Dangerous options",
+            "options": ["--upload-attachment", "--allow-public-comments"],
+        },
+    ],
+    "jiav serve": [
+        {
+            "name": "Main options",
+            "options": [
+                "--jira",
+                "--access-token",
+                "--username",
+                "--handshake-cache-ttl",
+                "--transitions-cache-ttl",
+                "--max-requests-per-second",
+                "--manifest-cache-ttl",
+            ],
+        },
+        {
+            "name": "Webhook options",
+            "options": [
+                "--host",
+                "--port",
+                "--debounce",
+                "--workers",
+                "--manifest-timeout",
+            ],
+        },
+        {
+            "name": "Dangerous options",
+            "options": ["--upload-attachment", "--allow-public-comments"],
+        },
+    ],
 }
 
 jiav_logger: Logger = logger.configure_logger()
@@ -37,10 +121,11 @@ jiav_logger: Logger = logger.configure_logger()
 
 class MutuallyExclusiveOption(click.Option):
     def __init__(self, *args: Any, **kwargs: Any):
-        self.mutually_exclusive = set(kwargs.pop("mutually_exclusive", []))
+        mutually_exclusive = kwargs.pop("mutually_exclusive", [])
+        self.mutually_exclusive = set(mutually_exclusive)
         help = kwargs.get("help", "")
         if self.mutually_exclusive:
-            opt = ", ".join(self.mutually_exclusive)
+            opt = ", ".join(mutually_exclusive)
             kwargs["help"] = help + (
                 " NOTE: This argument is mutually exclusive with"
                 " arguments: [" + opt + "]."
@@ -105,28 +190,295 @@ def validate_manifest(from_file: click.File) -> None:
         raise SystemExit(5)
 
 
-@click.command()
-@click.option("-j", "--jira", type=str, help="Jira URL.", required=True)
-@click.option(
-    "-a",
-    "--access-token",
-    type=str,
-    help=(
-        " ".join(
-            [
-                "Personal Access Token (PAT) for self-hosted instances or ",
-                "an API token for cloud instances.",
-            ]
-        )
-    ),
-    required=True,
+def _add_options(options: List[Callable[..., Any]]) -> Callable[..., Any]:
+    """
+    Build a decorator adding options shared between subcommands
+    """
+
+    def decorator(command: Callable[..., Any]) -> Callable[..., Any]:
+        for option in reversed(options):
+            command = option(command)
+        return command
+
+    return decorator
+
+
+connection_options = _add_options(
+    [
+        click.option("-j", "--jira", type=str, help="Jira URL.", required=True),
+        click.option(
+            "-a",
+            "--access-token",
+            type=str,
+            help=(
+                " ".join(
+                    [
+                        "Personal Access Token (PAT) for self-hosted instances or ",
+                        "an API token for cloud instances.",
+                    ]
+                )
+            ),
+            required=True,
+        ),
+        click.option(
+            "-u",
+            "--username",
+            type=str,
+            help="Cloud Jira username NOTE: Not required for self-hosted instances.",
+        ),
+        click.option(
+            "--handshake-cache-ttl",
+            type=click.IntRange(min=0),
+            default=HANDSHAKE_CACHE_TTL,
+            show_default=True,
+            help=(
+                " ".join(
+                    [
+                        "Seconds to reuse a cached handshake with the Jira instance",
+                        "between runs, 0 disables the cache.",
+                    ]
+                )
+            ),
+        ),
+        click.option(
+            "--transitions-cache-ttl",
+            type=click.IntRange(min=0),
+            default=0,
+            show_default=True,
+            help=(
+                " ".join(
+                    [
+                        "Seconds to reuse cached workflow transitions between runs,",
+                        "0 caches transitions for the current run only.",
+                    ]
+                )
+            ),
+        ),
+        click.option(
+            "--max-requests-per-second",
+            type=click.FloatRange(min=0),
+            default=0,
+            show_default=True,
+            help=(
+                " ".join(
+                    [
+                        "Requests per second sent to Jira, throttled requests are",
+                        "retried regardless, 0 disables limiting.",
+                    ]
+                )
+            ),
+        ),
+    ]
 )
-@click.option(
-    "-u",
-    "--username",
-    type=str,
-    help="Cloud Jira username NOTE: Not required for self-hosted instances.",
+
+page_size_option = click.option(
+    "--page-size",
+    type=click.IntRange(min=1),
+    default=JQL_PAGE_SIZE,
+    show_default=True,
+    help="Amount of issues to fetch per page of JQL results.",
 )
+
+verification_options = _add_options(
+    [
+        click.option(
+            "--workers",
+            type=click.IntRange(min=1),
+            default=1,
+            show_default=True,
+            help="Amount of issues to verify concurrently.",
+        ),
+        click.option(
+            "--manifest-cache-ttl",
+            type=click.IntRange(min=0),
+            default=0,
+            show_default=True,
+            help=(
+                " ".join(
+                    [
+                        "Seconds to reuse parsed manifests between runs,",
+                        "0 caches manifests for the current run only.",
+                    ]
+                )
+            ),
+        ),
+        click.option(
+            "--manifest-timeout",
+            type=click.FloatRange(min=0),
+            default=0,
+            show_default=True,
+            help=(
+                " ".join(
+                    [
+                        "Seconds a manifest may execute for, steps still executing",
+                        "are abandoned and fail, 0 disables the timeout.",
+                    ]
+                )
+            ),
+        ),
+        click.option(
+            "--upload-attachment",
+            help=(
+                " ".join(
+                    [
+                        "Uploads attachment of execution, this is not safe since all",
+                        "users who can access the ticket will be able to view it;",
+                        "refer to https://jira.atlassian.com/browse/JRASERVER-3893",
+                    ]
+                )
+            ),
+            flag_value=True,
+        ),
+        click.option(
+            "--allow-public-comments",
+            help=(
+                " ".join(
+                    [
+                        "Allows to read manifest from non-private comments; this is",
+                        "potentially dangerous since unexpected users will be able to",
+                        "provide a manifest.",
+                    ]
+                )
+            ),
+            flag_value=True,
+        ),
+        click.option(
+            "--no-comment-on-failure",
+            help="Do not post a comment on failed manifest execution.",
+            flag_value=True,
+        ),
+        click.option(
+            "--force",
+            help="Execute manifests that were already executed by previous runs.",
+            flag_value=True,
+        ),
+        click.option(
+            "--dry-run",
+            help="Execute manifest without updating issues.",
+            flag_value=True,
+        ),
+        click.option(
+            "--debug",
+            help="Enable debug logging.",
+            flag_value=True,
+        ),
+        click.option(
+            "--format",
+            type=click.Choice(["table", "json", "yaml"], case_sensitive=False),
+            help="Output format.",
+        ),
+    ]
+)
+
+
+def _warn_about_options(
+    upload_attachment: bool,
+    allow_public_comments: bool,
+    no_comment_on_failure: bool,
+    dry_run: bool,
+) -> None:
+    """
+    Warn about options changing the behaviour of the verification
+    """
+    # If user requested to upload attachment, warn them
+    if upload_attachment:
+        jiav_logger.warn(
+            "".join(
+                [
+                    "Will upload attachment of the execution, this might leak ",
+                    "sensetive information, "
+                    "refer to: https://jira.atlassian.com/browse/JRASERVER-3893",
+                ]
+            )
+        )
+    # If user requested to include public comments, warn them
+    if allow_public_comments:
+        jiav_logger.warn("Will include public comments in search!")
+    if no_comment_on_failure:
+        jiav_logger.warn("Comment will not be posted of failed manifest execution")
+    if dry_run:
+        jiav_logger.info("Will not update issues, running as a dry run")
+
+
+def _connect_to_jira(
+    jira: str,
+    access_token: str,
+    username: str,
+    handshake_cache_ttl: int,
+    transitions_cache_ttl: int,
+    max_requests_per_second: float,
+    workers: int,
+    record_dir: str = "",
+    replay_dir: str = "",
+) -> JiraConnection:
+    """
+    Connect to Jira, exits if the connection failed
+    """
+    try:
+        jira_connection: JiraConnection = JiraConnection(
+            url=jira,
+            username=username,
+            access_token=access_token,
+            handshake_cache_ttl=handshake_cache_ttl,
+            transitions_cache_ttl=transitions_cache_ttl,
+            max_requests_per_second=max_requests_per_second,
+            record_dir=record_dir,
+            replay_dir=replay_dir,
+        )
+    except exceptions.NoJiraRestAPIEndpoint as e:
+        jiav_logger.exception(e)
+        jiav_logger.critical("Provided URL does not contain a valid JIRA endpoint")
+        raise SystemExit(1)
+    except exceptions.JiraUnhandledException as e:
+        jiav_logger.exception(e)
+        jiav_logger.critical(
+            "An unhandled exception occurred while trying to connect to Jira"
+        )
+        raise SystemExit(1)
+    except exceptions.JiraAuthenticationFailed as e:
+        jiav_logger.exception(e)
+        jiav_logger.critical(
+            " ".join(
+                [
+                    "Authentication with the Jira insatance failed,",
+                    "please check your credentials",
+                ]
+            )
+        )
+        raise SystemExit(2)
+    except exceptions.JiraMissingCredentials as e:
+        jiav_logger.exception(e)
+        jiav_logger.critical(
+            "Missing username, please provide a username to a Jira cloud instance"
+        )
+        raise SystemExit(2)
+    except exceptions.ExchangeNotRecorded as e:
+        jiav_logger.exception(e)
+        jiav_logger.critical("Request was not recorded, please re-record the cassette")
+        raise SystemExit(7)
+    # Workers and the page prefetch share connections to Jira
+    if workers > 1:
+        jira_connection.set_max_connections(workers + 1)
+    return jira_connection
+
+
+def _stop_on_signals() -> threading.Event:
+    """
+    Build an event set when the process is requested to stop
+    """
+    stop = threading.Event()
+
+    def _stop(signum: int, frame: Union[FrameType, None]) -> None:
+        jiav_logger.info(f"Received signal {signum}, stopping")
+        stop.set()
+
+    signal.signal(signal.SIGTERM, _stop)
+    signal.signal(signal.SIGINT, _stop)
+    return stop
+
+
+@click.command()
+@connection_options
 @click.option(
     "-i",
     "--issue",
@@ -144,102 +496,126 @@ def validate_manifest(from_file: click.File) -> None:
     mutually_exclusive=["issue"],
 )
 @click.option(
-    "--upload-attachment",
+    "--incremental",
     help=(
         " ".join(
             [
-                "Uploads attachment of execution, this is not safe since all",
-                "users who can access the ticket will be able to view it;",
-                "refer to https://jira.atlassian.com/browse/JRASERVER-3893",
+                "Only verify issues updated since the last successful run of",
+                "the same query, requires --query.",
             ]
         )
     ),
     flag_value=True,
 )
+@page_size_option
+@click.option(
+    "--record",
+    type=click.Path(file_okay=False, writable=True),
+    help="Directory to record HTTP exchanges with Jira to.",
+    cls=MutuallyExclusiveOption,
+    mutually_exclusive=["replay"],
+)
 @click.option(
-    "--allow-public-comments",
+    "--replay",
+    type=click.Path(exists=True, file_okay=False),
     help=(
         " ".join(
             [
-                "Allows to read manifest from non-private comments; this is",
-                "potentially dangerous since unexpected users will be able to",
-                "provide a manifest.",
+                "Directory to replay recorded HTTP exchanges from instead of",
+                "contacting Jira, updates of issues are not sent.",
             ]
         )
     ),
-    flag_value=True,
-)
-@click.option(
-    "--no-comment-on-failure",
-    help="Do not post a comment on failed manifest execution.",
-    flag_value=True,
-)
-@click.option(
-    "--dry-run",
-    help="Execute manifest without updating issues.",
-    flag_value=True,
-)
-@click.option(
-    "--debug",
-    help="Enable debug logging.",
-    flag_value=True,
-)
-@click.option(
-    "--format",
-    type=click.Choice(["table", "json", "yaml"], case_sensitive=False),
-    help="Output format.",
+    cls=MutuallyExclusiveOption,
+    mutually_exclusive=["record", "incremental"],
 )
+@verification_options
 def verify(
     jira: str,
     access_token: str,
     username: str,
+    handshake_cache_ttl: int,
+    transitions_cache_ttl: int,
+    max_requests_per_second: float,
     issue: List[str],
     query: str,
+    incremental: bool,
+    page_size: int,
+    record: str,
+    replay: str,
+    workers: int,
+    manifest_cache_ttl: int,
+    manifest_timeout: float,
     upload_attachment: bool,
     allow_public_comments: bool,
     no_comment_on_failure: bool,
+    force: bool,
     dry_run: bool,
     debug: bool,
     format: str,
 ) -> None:
     """Verifies issues in Jira."""
-    issues: List[Issue] = []
+    run_started: float = time.time()
+    issues: Iterator[Issue] = iter([])
     verifeid_issues: List[Issue] = []
     jiav_logger: Logger = logger.configure_logger(debug)
-    # If user requested to upload attachment, warn them
-    if upload_attachment:
-        jiav_logger.warn(
-            "".join(
-                [
-                    "Will upload attachment of the execution, this might leak ",
-                    "sensetive information, "
-                    "refer to: https://jira.atlassian.com/browse/JRASERVER-3893",
-                ]
-            )
-        )
-    # If user requested to include public comments, warn them
-    if allow_public_comments:
-        jiav_logger.warn("Will include public comments in search!")
-    if no_comment_on_failure:
-        jiav_logger.warn("Comment will not be posted of failed manifest execution")
-    if dry_run:
-        jiav_logger.info("Will not update issues, running as a dry run")
+    _warn_about_options(
+        upload_attachment, allow_public_comments, no_comment_on_failure, dry_run
+    )
+    if incremental and not query:
+        raise click.UsageError("Illegal usage: `incremental` requires `query`.")
+    # Also covers options provided using environment variables
+    if incremental and replay:
+        raise click.UsageError("Illegal usage: `incremental` conflicts with `replay`.")
+    jira_connection = _connect_to_jira(
+        jira=jira,
+        access_token=access_token,
+        username=username,
+        handshake_cache_ttl=handshake_cache_ttl,
+        transitions_cache_ttl=transitions_cache_ttl,
+        max_requests_per_second=max_requests_per_second,
+        workers=workers,
+        record_dir=record,
+        replay_dir=replay,
+    )
+    # Restrict query to issues updated since the last successful run
+    jql: str = query
+    if incremental:
+        checkpoint = checkpoints.get_checkpoint(jira, query)
+        if checkpoint:
+            jql = checkpoints.build_query(query, checkpoint, now=run_started)
+            jiav_logger.info(f"Looking for issues updated since last run: {jql}")
+    # Fetch issues from authenticated Jira instance, iterate over valid issues
+    # and attempt to update and verify them
+    # NOTE: Pages of query results following the first page are fetched while
+    #       issues are verified, the same errors are expected from both
     try:
-        jira_connection: JiraConnection = JiraConnection(
-            url=jira,
-            username=username,
-            access_token=access_token,
-        )
-    except exceptions.NoJiraRestAPIEndpoint as e:
-        jiav_logger.exception(e)
-        jiav_logger.critical("Provided URL does not contain a valid JIRA endpoint")
-        raise SystemExit(1)
-    except exceptions.JiraUnhandledException as e:
-        jiav_logger.exception(e)
-        jiav_logger.critical(
-            "An unhandled exception occurred while trying to connect to Jira"
+        issues = jira_connection.fetch_issues(
+            issues=issue, jql=jql, page_size=page_size
         )
-        raise SystemExit(1)
+        # Recorded and replayed runs do not depend on previous runs
+        execution_ledger = Ledger(":memory:" if record or replay else None)
+        if manifest_cache_ttl and not (record or replay):
+            manifest_cache.load(manifest_cache_ttl)
+        try:
+            verifeid_issues = verification.verify_issues(
+                issues=issues,
+                jira_connection=jira_connection,
+                upload_attachment=upload_attachment,
+                allow_public_comments=allow_public_comments,
+                no_comment_on_failure=no_comment_on_failure,
+                dry_run=dry_run,
+                workers=workers,
+                execution_ledger=execution_ledger,
+                force=force,
+                manifest_timeout=manifest_timeout,
+            )
+        finally:
+            execution_ledger.close()
+            manifest_cache.save()
+    except exceptions.JiraMissingCredentials:
+        pass
+    # Credentials of a cached handshake are validated by the first request
     except exceptions.JiraAuthenticationFailed as e:
         jiav_logger.exception(e)
         jiav_logger.critical(
@@ -251,27 +627,25 @@ def verify(
             )
         )
         raise SystemExit(2)
-    except exceptions.JiraMissingCredentials as e:
+    except (exceptions.JiraUnhandledException, JIRAError) as e:
         jiav_logger.exception(e)
         jiav_logger.critical(
-            "Missing username, please provide a username to a Jira cloud instance"
+            "An unhandled exception occurred while trying to fetch or verify issues"
         )
         raise SystemExit(2)
-    # Fetch issues from authenticated Jira instance
-    try:
-        issues = jira_connection.fetch_issues(issues=issue, jql=query)
-    except exceptions.JiraMissingCredentials:
-        pass
-    except exceptions.JiraUnhandledException as e:
+    except exceptions.ExchangeNotRecorded as e:
         jiav_logger.exception(e)
-        jiav_logger.critical(
-            "An unhandled exception occurred while trying to fetch issues"
-        )
-        raise SystemExit(2)
+        jiav_logger.critical("Request was not recorded, please re-record the cassette")
+        raise SystemExit(7)
     except exceptions.InvalidKeyInJQL:
         jiav_logger.critical("Invalid key in JQL")
         raise SystemExit(3)
     except exceptions.JQLReturnedNothing as e:
+        if incremental:
+            if not dry_run:
+                checkpoints.set_checkpoint(jira, query, run_started)
+            jiav_logger.info("No issues were updated since last run")
+            raise SystemExit(6)
         jiav_logger.exception(e)
         jiav_logger.critical("Query returned no issues")
         raise SystemExit(3)
@@ -282,15 +656,9 @@ def verify(
     except exceptions.NoIssuesFound:
         jiav_logger.critical("No issues found")
         raise SystemExit(4)
-    # Iterate over valid issues and attempt to update and verify them
-    verifeid_issues = verification.verify_issues(
-        issues=issues,
-        jira_connection=jira_connection,
-        upload_attachment=upload_attachment,
-        allow_public_comments=allow_public_comments,
-        no_comment_on_failure=no_comment_on_failure,
-        dry_run=dry_run,
-    )
+    jiav_logger.debug(f"Jira requests: {jira_connection.rate_limiter.stats()}")
+    if incremental and not dry_run:
+        checkpoints.set_checkpoint(jira, query, run_started)
     # Print summary if issues were verified
     if verifeid_issues:
         summary.prepare_summary(issues=verifeid_issues, format=format)
@@ -299,8 +667,203 @@ def verify(
         raise SystemExit(6)
 
 
+@click.command(name="watch")
+@connection_options
+@click.option("-q", "--query", help="JQL query.", required=True)
+@click.option(
+    "--interval",
+    type=click.IntRange(min=1),
+    default=watch.WATCH_INTERVAL,
+    show_default=True,
+    help="Seconds between polls of the query.",
+)
+@click.option(
+    "--heartbeat-file",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Path to a file updated after every poll, used to supervise the watcher.",
+)
+@page_size_option
+@verification_options
+def watch_query(
+    jira: str,
+    access_token: str,
+    username: str,
+    handshake_cache_ttl: int,
+    transitions_cache_ttl: int,
+    max_requests_per_second: float,
+    query: str,
+    interval: int,
+    heartbeat_file: Union[str, None],
+    page_size: int,
+    workers: int,
+    manifest_cache_ttl: int,
+    manifest_timeout: float,
+    upload_attachment: bool,
+    allow_public_comments: bool,
+    no_comment_on_failure: bool,
+    force: bool,
+    dry_run: bool,
+    debug: bool,
+    format: str,
+) -> None:
+    """Continuously verifies issues matching a query in Jira."""
+    jiav_logger: Logger = logger.configure_logger(debug)
+    _warn_about_options(
+        upload_attachment, allow_public_comments, no_comment_on_failure, dry_run
+    )
+    jira_connection = _connect_to_jira(
+        jira=jira,
+        access_token=access_token,
+        username=username,
+        handshake_cache_ttl=handshake_cache_ttl,
+        transitions_cache_ttl=transitions_cache_ttl,
+        max_requests_per_second=max_requests_per_second,
+        workers=workers,
+    )
+    backends = import_backends()
+    jiav_logger.debug(f"Loaded backends: {', '.join(backends)}")
+    # Stop after the current poll when requested by a supervisor
+    stop = _stop_on_signals()
+    execution_ledger = Ledger()
+    if manifest_cache_ttl:
+        manifest_cache.load(manifest_cache_ttl)
+    try:
+        watch.watch_query(
+            jira_connection=jira_connection,
+            query=query,
+            verify=lambda issues: verification.verify_issues(
+                issues=issues,
+                jira_connection=jira_connection,
+                upload_attachment=upload_attachment,
+                allow_public_comments=allow_public_comments,
+                no_comment_on_failure=no_comment_on_failure,
+                dry_run=dry_run,
+                workers=workers,
+                execution_ledger=execution_ledger,
+                force=force,
+                manifest_timeout=manifest_timeout,
+            ),
+            stop=stop,
+            interval=interval,
+            page_size=page_size,
+            heartbeat_file=heartbeat_file,
+            persist_checkpoint=not dry_run,
+            on_verified=lambda issues: summary.prepare_summary(
+                issues=issues, format=format
+            ),
+        )
+    except exceptions.JiraAuthenticationFailed as e:
+        jiav_logger.exception(e)
+        jiav_logger.critical(
+            "Authentication with the Jira insatance failed while watching"
+        )
+        raise SystemExit(2)
+    finally:
+        execution_ledger.close()
+        manifest_cache.save()
+
+
+@click.command()
+@connection_options
+@click.option(
+    "--host",
+    type=str,
+    default="127.0.0.1",
+    show_default=True,
+    help="Address to listen on for webhooks.",
+)
+@click.option(
+    "--port",
+    type=click.IntRange(min=0, max=65535),
+    default=8080,
+    show_default=True,
+    help="Port to listen on for webhooks.",
+)
+@click.option(
+    "--debounce",
+    type=click.FloatRange(min=0),
+    default=webhook.WEBHOOK_DEBOUNCE,
+    show_default=True,
+    help="Seconds to wait for more events of an issue before verifying it.",
+)
+@verification_options
+def serve(
+    jira: str,
+    access_token: str,
+    username: str,
+    handshake_cache_ttl: int,
+    transitions_cache_ttl: int,
+    max_requests_per_second: float,
+    host: str,
+    port: int,
+    debounce: float,
+    workers: int,
+    manifest_cache_ttl: int,
+    manifest_timeout: float,
+    upload_attachment: bool,
+    allow_public_comments: bool,
+    no_comment_on_failure: bool,
+    force: bool,
+    dry_run: bool,
+    debug: bool,
+    format: str,
+) -> None:
+    """Verifies issues in Jira when receiving comment webhooks."""
+    jiav_logger: Logger = logger.configure_logger(debug)
+    _warn_about_options(
+        upload_attachment, allow_public_comments, no_comment_on_failure, dry_run
+    )
+    jira_connection = _connect_to_jira(
+        jira=jira,
+        access_token=access_token,
+        username=username,
+        handshake_cache_ttl=handshake_cache_ttl,
+        transitions_cache_ttl=transitions_cache_ttl,
+        max_requests_per_second=max_requests_per_second,
+        workers=workers,
+    )
+    backends = import_backends()
+    jiav_logger.debug(f"Loaded backends: {', '.join(backends)}")
+    stop = _stop_on_signals()
+    execution_ledger = Ledger()
+    if manifest_cache_ttl:
+        manifest_cache.load(manifest_cache_ttl)
+    try:
+        webhook.serve(
+            jira_connection=jira_connection,
+            verify=lambda issues: verification.verify_issues(
+                issues=issues,
+                jira_connection=jira_connection,
+                upload_attachment=upload_attachment,
+                allow_public_comments=allow_public_comments,
+                no_comment_on_failure=no_comment_on_failure,
+                dry_run=dry_run,
+                execution_ledger=execution_ledger,
+                force=force,
+                manifest_timeout=manifest_timeout,
+            ),
+            stop=stop,
+            host=host,
+            port=port,
+            debounce=debounce,
+            workers=workers,
+            on_verified=lambda issues: summary.prepare_summary(
+                issues=issues, format=format
+            ),
+        )
+    except OSError as e:
+        jiav_logger.exception(e)
+        jiav_logger.critical(f"Failed to listen on {host}:{port}")
+        raise SystemExit(1)
+    finally:
+        execution_ledger.close()
+        manifest_cache.save()
+
+
 jiav.add_command(validate_manifest)
 jiav.add_command(verify)
+jiav.add_command(watch_query)
+jiav.add_command(serve)
 
 if __name__ == "__main__":
     jiav()
@@ -1,10 +1,19 @@
 #!/usr/bin/env python
 
+import os
 import tempfile
 from datetime import datetime
-from typing import IO, Any, List
+from typing import IO, Iterable
 
-from iteration_utilities import deepflatten  # type:ignore
+# Bytes of output kept in memory before spooling it to disk
+OUTPUT_SPOOL_SIZE: int = 1024 * 1024
+# Bytes of output kept, output exceeding it is truncated so it is accepted by
+# the default attachment size limit of Jira
+OUTPUT_MAX_SIZE: int = 10 * 1024 * 1024
+# Bytes of output copied at once between outputs
+OUTPUT_CHUNK_SIZE: int = 64 * 1024
+# Appended to truncated output
+TRUNCATION_MARKER: str = "\n[Output was truncated]\n"
 
 
 def get_current_timestamp() -> str:
@@ -19,26 +28,103 @@ def get_current_timestamp() -> str:
     return current_timestamp
 
 
-def write_content_to_tempfile(content: List[Any]) -> IO:
+class OutputSink:
     """
-    Write content to temporary file
+    Output written to a spooled temporary file, kept in memory until it
+    exceeds spool_size and truncated once it would exceed max_size
 
-    Arguments:
-        content - Content to write
-
-    Returns:
-        temp_file - temporary file
+    Attributes:
+        spool_size - Bytes kept in memory before spooling to disk
+        max_size   - Maximum size of the output in bytes, including the
+                     truncation marker
+        size       - Bytes written
+        truncated  - Whether output was truncated
     """
-    # If we receive an output that contains a list
-    # flatten it to a single list
-    if isinstance(content, list):
-        content = list(deepflatten(content, depth=1))
-    # Create temporary file
-    temp_file = tempfile.NamedTemporaryFile(
-        prefix=f"jiav_{get_current_timestamp()}_", suffix=".txt", mode="w+t"
-    )
-    # Write content to temporary file
-    temp_file.writelines(content)
-    # Commit changes to file
-    temp_file.seek(0)
-    return temp_file
+
+    def __init__(
+        self, spool_size: int = OUTPUT_SPOOL_SIZE, max_size: int = OUTPUT_MAX_SIZE
+    ) -> None:
+        self.spool_size = spool_size
+        self.max_size = max_size
+        self.size = 0
+        self.truncated = False
+        self._file = tempfile.SpooledTemporaryFile(
+            max_size=spool_size,
+            mode="w+b",
+            prefix=f"jiav_{get_current_timestamp()}_",
+            suffix=".txt",
+        )
+
+    def write(self, text: str) -> None:
+        """
+        Write text, text exceeding the maximum size is dropped and replaced
+        by a truncation marker
+
+        Arguments:
+            text - Text to write
+        """
+        self._write(text.encode("utf-8", "surrogateescape"))
+
+    def _write(self, data: bytes) -> None:
+        if self.truncated:
+            return
+        marker = TRUNCATION_MARKER.encode()
+        if self.size + len(data) > self.max_size - len(marker):
+            room = max(0, self.max_size - len(marker) - self.size)
+            # Avoid splitting a multi-byte character
+            data = data[:room].decode("utf-8", "ignore").encode() + marker
+            self.truncated = True
+        # Output may have been read since the last write
+        self._file.seek(0, os.SEEK_END)
+        self._file.write(data)
+        self.size += len(data)
+
+    def write_lines(self, lines: Iterable[str]) -> None:
+        """
+        Write lines, each line is terminated by a newline
+
+        Arguments:
+            lines - Lines to write
+        """
+        for line in lines:
+            self.write(line if line.endswith("\n") else f"{line}\n")
+
+    def append(self, output: "OutputSink") -> None:
+        """
+        Write the contents of another output, copied in chunks so it is not
+        read into memory at once
+
+        Arguments:
+            output - Output to write
+        """
+        source = output.file()
+        while True:
+            data = source.read(OUTPUT_CHUNK_SIZE)
+            if not data:
+                break
+            self._write(data)
+
+    def file(self) -> IO[bytes]:
+        """
+        Get the file containing the output, positioned at its start
+
+        Returns:
+            file - Spooled temporary file
+        """
+        self._file.seek(0)
+        return self._file
+
+    def getvalue(self) -> str:
+        """
+        Get the output
+
+        Returns:
+            output - Text written so far
+        """
+        return self.file().read().decode("utf-8", "surrogateescape")
+
+    def close(self) -> None:
+        """
+        Close the output, spooled output is removed from disk
+        """
+        self._file.close()
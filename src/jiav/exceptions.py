@@ -1,5 +1,7 @@
 #!/usr/bin/env python
 
+from typing import Union
+
 from jsonschema.exceptions import ValidationError
 
 
@@ -129,7 +131,7 @@ class InvalidManifestException(jiavException):
     Raised when an invalid manifest is supplied
     """
 
-    def __init__(self, py_err: ValidationError) -> None:
+    def __init__(self, py_err: Union[ValidationError, str]) -> None:
         super().__init__(str(py_err))
 
 
@@ -139,6 +141,7 @@ class InvalidBackend(jiavException):
     """
 
     def __init__(self, backend: str) -> None:
+        self.backend = backend
         message = f"'{backend}' is not a supported backend"
         super().__init__(message)
 
@@ -151,3 +154,13 @@ class BackendExecutionFailed(jiavException):
     def __init__(self, backend: str) -> None:
         message = f"'{backend}' execution failed"
         super().__init__(message)
+
+
+class ExchangeNotRecorded(jiavException):
+    """
+    Raised when a replayed request was not recorded
+    """
+
+    def __init__(self, method: str, url: str) -> None:
+        message = f"No recorded response for {method} {url}"
+        super().__init__(message)
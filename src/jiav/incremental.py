@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+
+import math
+import re
+import time
+from typing import Union
+
+from jiav import logger, storage
+
+jiav_logger = logger.subscribe_to_logger()
+
+# File used to persist checkpoints of incremental queries
+CHECKPOINTS_FILE: str = "checkpoints.json"
+# Minutes added to the checkpoint window to tolerate clock skew with Jira
+CHECKPOINT_OVERLAP_MINUTES: int = 2
+
+ORDER_BY_REGEX = re.compile(r"(?:^|\s+)order\s+by\s+.*$", re.IGNORECASE | re.DOTALL)
+
+
+def _checkpoint_key(url: str, jql: str) -> str:
+    return storage.fingerprint(url.rstrip("/"), jql.strip())
+
+
+def get_checkpoint(url: str, jql: str) -> Union[float, None]:
+    """
+    Get the checkpoint of a query
+
+    Arguments:
+        url - Jira URL
+        jql - Jira Query Language query
+
+    Returns:
+        checkpoint - Epoch time of the last successful run, None if the
+                     query was never run incrementally
+    """
+    checkpoint = storage.get_cached(
+        CHECKPOINTS_FILE, _checkpoint_key(url, jql), math.inf
+    )
+    return float(checkpoint) if checkpoint is not None else None
+
+
+def set_checkpoint(url: str, jql: str, checkpoint: float) -> None:
+    """
+    Persist the checkpoint of a query
+
+    Arguments:
+        url        - Jira URL
+        jql        - Jira Query Language query
+        checkpoint - Epoch time the successful run started at
+    """
+    storage.set_cached(CHECKPOINTS_FILE, _checkpoint_key(url, jql), checkpoint)
+    jiav_logger.debug(f"Saved checkpoint {checkpoint} of query '{jql}'")
+
+
+def build_query(jql: str, checkpoint: float, now: Union[float, None] = None) -> str:
+    """
+    Restricts a query to issues updated since the checkpoint
+
+    The restriction is relative ('-<minutes>m') so it does not depend on the
+    timezone of the Jira user
+
+    Arguments:
+        jql        - Jira Query Language query
+        checkpoint - Epoch time of the last successful run
+        now        - Current epoch time
+
+    Returns:
+        jql - Restricted Jira Query Language query
+    """
+    now = time.time() if now is None else now
+    minutes = max(0, math.ceil((now - checkpoint) / 60)) + CHECKPOINT_OVERLAP_MINUTES
+    order_by = ORDER_BY_REGEX.search(jql)
+    query = jql[: order_by.start()] if order_by else jql
+    restriction = f'updated >= "-{minutes}m"'
+    if query.strip():
+        restriction = f"({query.strip()}) AND {restriction}"
+    return f"{restriction} {order_by.group(0).strip()}" if order_by else restriction
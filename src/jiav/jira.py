@@ -2,137 +2,711 @@
 
 from __future__ import annotations
 
+import threading
 from abc import ABC
-from typing import Any, List, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain
+from typing import IO, Any, Dict, Iterable, Iterator, List, Tuple, Union
 
 from jira import JIRA, Issue, JIRAError
+from jira.resources import Comment
+from requests import Response
 from requests.exceptions import ConnectionError
 
-from jiav import exceptions, logger
+from jiav import backend, exceptions, logger, storage
+from jiav.ratelimit import RateLimitedAdapter, RateLimiter
+from jiav.transport import Cassette, RecordingAdapter, ReplayAdapter
 
 jiav_logger = logger.subscribe_to_logger()
 
+# File used to cache the handshake with Jira instances
+HANDSHAKE_CACHE_FILE: str = "handshake.json"
+# Seconds to reuse a cached handshake with a Jira instance
+HANDSHAKE_CACHE_TTL: int = 86400
+# File used to persist workflow transitions of Jira instances
+TRANSITIONS_CACHE_FILE: str = "transitions.json"
+# Default amount of connections kept open to Jira
+DEFAULT_MAX_CONNECTIONS: int = 10
+# Maximum amount of issue keys to request in a single 'key in (...)' query
+ISSUE_KEYS_CHUNK_SIZE: int = 50
+# Amount of issues to request per page of JQL results
+JQL_PAGE_SIZE: int = 50
+# Issue fields read by jiav, only these fields are requested from Jira
+ISSUE_FIELDS: List[str] = [
+    "status",
+    "summary",
+    "assignee",
+    "reporter",
+    "project",
+    "issuetype",
+]
+# Issue fields reloaded after verification, used by jiav.summary
+SUMMARY_FIELDS: List[str] = ["comment"]
+# Amount of comments to request per page, newest comments are requested first
+COMMENTS_PAGE_SIZE: int = 50
+# Issue expansions requested from Jira (none are required by jiav)
+ISSUE_EXPAND: Union[str, None] = None
+
 
 class JiraConnection(ABC):
     """
     Jira connection
 
     Attributes:
-        jira - jira.JIRA object if authenticated successfully.
+        jira                  - jira.JIRA object if authenticated successfully.
+        rate_limiter          - Rate limiter shared by all requests to Jira
+        issue_fields          - Issue fields requested when fetching issues
+        transitions_cache_ttl - Seconds to persist cached workflow transitions
     """
 
     _instance = None
+    # Guards the singleton and its caches when used from several threads
+    _lock = threading.RLock()
 
     def __new__(cls, *args: Any, **kwargs: Any) -> "JiraConnection":
-        if not cls._instance:
-            cls._instance = super(JiraConnection, cls).__new__(cls)
+        with cls._lock:
+            if not cls._instance:
+                cls._instance = super(JiraConnection, cls).__new__(cls)
         return cls._instance
 
-    def __init__(self, url: str, username: str, access_token: str):
+    def __init__(
+        self,
+        url: str = "",
+        username: str = "",
+        access_token: str = "",
+        handshake_cache_ttl: int = HANDSHAKE_CACHE_TTL,
+        transitions_cache_ttl: int = 0,
+        max_requests_per_second: float = 0,
+        record_dir: str = "",
+        replay_dir: str = "",
+    ):
         """
         Attempts to authenticate with Jira API
 
+        When a cached handshake for the same URL and credentials exists, the
+        authenticated client is built directly and credentials are validated
+        by the first request performed
+
         Arguments:
-            url           - Jira URL
-            instance_type - Instance type (cloud or hosted)
-            access_token  - Personal Access Token to authenticate with
+            url                   - Jira URL
+            username              - Username (cloud instances only)
+            access_token          - Personal Access Token to authenticate with
+            handshake_cache_ttl   - Seconds to reuse a cached handshake,
+                                    0 disables the cache
+            transitions_cache_ttl - Seconds to reuse cached workflow
+                                    transitions between runs, 0 caches
+                                    transitions for the current run only
+            max_requests_per_second - Requests per second sent to Jira,
+                                      0 disables limiting
+            record_dir            - Directory to record HTTP exchanges to
+            replay_dir            - Directory to replay HTTP exchanges from,
+                                    no requests are sent to Jira
         """
-        # Initiall connection is used to discover details about the Jira instance
-        if not hasattr(self, "jira"):
-            try:
-                self.jira = JIRA(server=url)
-            except JIRAError as e:
-                if "JiraError HTTP 404 url" in str(e):
-                    raise exceptions.NoJiraRestAPIEndpoint(url) from None
+        with self._lock:
+            if hasattr(self, "jira"):
+                return
+            self.issue_fields: List[str] = list(ISSUE_FIELDS)
+            self.register_issue_fields(backend.get_issue_fields())
+            self.url = url
+            self._username = username
+            self._access_token = access_token
+            self._handshake_cache_key = storage.fingerprint(
+                url, username or "", access_token
+            )
+            self._handshake_cache_ttl = handshake_cache_ttl
+            self._validated = False
+            self.transitions_cache_ttl = transitions_cache_ttl
+            self._transitions: Dict[str, Dict[str, str]] = {}
+            self.rate_limiter = RateLimiter(rate=max_requests_per_second)
+            self._max_connections = DEFAULT_MAX_CONNECTIONS
+            self.cassette: Union[Cassette, None] = None
+            self._replay = bool(replay_dir)
+            if record_dir or replay_dir:
+                self.cassette = Cassette(replay_dir or record_dir)
+                if replay_dir:
+                    self.cassette.load()
                 else:
-                    raise exceptions.JiraUnhandledException()
-            # NOTE: Failed to contact the server enitrely, perhaps should
-            #       raise a unique exception for this case
-            except ConnectionError:
-                raise exceptions.NoJiraRestAPIEndpoint(url) from None
-            instance_type = self.jira.deploymentType
-            # Authenticate with a Jira cloud instance
-            if instance_type == "Cloud":
-                if not username:
-                    raise exceptions.JiraMissingCredentials("Username") from None
-                self.jira = JIRA(server=url, basic_auth=(username, access_token))
-            # Authenticate with a self-hosted Jira instance
-            elif instance_type == "Server":
-                if username:
-                    jiav_logger.warning(
-                        "Username argument is omitted for self-hosted Jira instances"
+                    self.cassette.reset()
+                # Cached handshakes and transitions would hide exchanges
+                handshake_cache_ttl = 0
+                self._handshake_cache_ttl = 0
+                self.transitions_cache_ttl = 0
+            server_info: Union[Dict[str, Any], None] = None
+            if handshake_cache_ttl:
+                server_info = storage.get_cached(
+                    HANDSHAKE_CACHE_FILE,
+                    self._handshake_cache_key,
+                    handshake_cache_ttl,
+                )
+            if server_info:
+                self.jira = self._build_client(server_info)
+                jiav_logger.info(
+                    " ".join(
+                        [
+                            "Reusing cached handshake with Jira instance",
+                            f"'{url}' of type '{self.jira.deploymentType}'",
+                        ]
                     )
-                self.jira = JIRA(server=url, token_auth=access_token)
-            # Check if authentication was successful
-            try:
-                self.jira.myself()
-            except JIRAError as e:
-                if "JiraError HTTP 401 url" in str(e):
-                    raise exceptions.JiraAuthenticationFailed(url) from None
-                else:
-                    raise exceptions.JiraUnhandledException()
-            jiav_logger.info(
-                " ".join(
-                    [
-                        f"Successfully authenticated with Jira instance '{url}' of",
-                        f"type '{instance_type}'",
-                    ]
                 )
+            else:
+                self._handshake()
+
+    def _handshake(self) -> None:
+        """
+        Discovers details about the Jira instance, authenticates with it and
+        caches the discovered details
+        """
+        url = self.url
+        # Initiall connection is used to discover details about the Jira instance
+        try:
+            anonymous_client = JIRA(server=url, get_server_info=False, max_retries=0)
+            self._mount_adapter(anonymous_client)
+            server_info = anonymous_client.server_info()
+        except JIRAError as e:
+            if "JiraError HTTP 404 url" in str(e):
+                raise exceptions.NoJiraRestAPIEndpoint(url) from None
+            else:
+                raise exceptions.JiraUnhandledException()
+        # NOTE: Failed to contact the server enitrely, perhaps should
+        #       raise a unique exception for this case
+        except ConnectionError:
+            raise exceptions.NoJiraRestAPIEndpoint(url) from None
+        self.jira = self._build_client(server_info)
+        self._validated = True
+        # Check if authentication was successful
+        try:
+            self.jira.myself()
+        except JIRAError as e:
+            if "JiraError HTTP 401 url" in str(e):
+                raise exceptions.JiraAuthenticationFailed(url) from None
+            else:
+                raise exceptions.JiraUnhandledException()
+        if self._handshake_cache_ttl:
+            storage.set_cached(
+                HANDSHAKE_CACHE_FILE,
+                self._handshake_cache_key,
+                server_info,
+                ttl=self._handshake_cache_ttl,
+            )
+        jiav_logger.info(
+            " ".join(
+                [
+                    f"Successfully authenticated with Jira instance '{url}' of",
+                    f"type '{self.jira.deploymentType}'",
+                ]
+            )
+        )
+
+    def _build_client(self, server_info: Dict[str, Any]) -> JIRA:
+        """
+        Builds a Jira client according to the instance type without
+        requesting the server details again
+
+        Throttled requests are retried by jiav.ratelimit.RateLimitedAdapter,
+        retries of the client itself are disabled
+
+        Arguments:
+            server_info - Jira server details
+
+        Returns:
+            client - jira.JIRA object
+        """
+        url = self.url
+        instance_type = server_info.get("deploymentType")
+        # Authenticate with a Jira cloud instance
+        if instance_type == "Cloud":
+            if not self._username:
+                raise exceptions.JiraMissingCredentials("Username") from None
+            client = JIRA(
+                server=url,
+                basic_auth=(self._username, self._access_token),
+                get_server_info=False,
+                max_retries=0,
+            )
+        # Authenticate with a self-hosted Jira instance
+        elif instance_type == "Server":
+            if self._username:
+                jiav_logger.warning(
+                    "Username argument is omitted for self-hosted Jira instances"
+                )
+            client = JIRA(
+                server=url,
+                token_auth=self._access_token,
+                get_server_info=False,
+                max_retries=0,
+            )
+        else:
+            client = JIRA(server=url, get_server_info=False, max_retries=0)
+        client.deploymentType = instance_type
+        client._version = tuple(server_info["versionNumbers"])
+        client._session.hooks["response"].append(self._validate_response)
+        self._mount_adapter(client)
+        return client
+
+    def _mount_adapter(self, client: JIRA) -> None:
+        """
+        Routes all requests of a client through the shared rate limiter, or
+        through the cassette when recording or replaying
+
+        Arguments:
+            client - jira.JIRA object
+        """
+        adapter: Union[RateLimitedAdapter, ReplayAdapter]
+        if self.cassette and self._replay:
+            adapter = ReplayAdapter(self.cassette)
+        elif self.cassette:
+            adapter = RecordingAdapter(
+                self.cassette, self.rate_limiter, pool_maxsize=self._max_connections
+            )
+        else:
+            adapter = RateLimitedAdapter(
+                self.rate_limiter, pool_maxsize=self._max_connections
+            )
+        client._session.mount("http://", adapter)
+        client._session.mount("https://", adapter)
+
+    def _validate_response(
+        self, response: Response, *args: Any, **kwargs: Any
+    ) -> Union[Response, None]:
+        """
+        Validates credentials of a client built from a cached handshake
+        using the first response received from Jira
+
+        If the first response is unauthorized, the cached handshake is
+        discarded, the full handshake is performed and the request is resent
+
+        Arguments:
+            response - Response received from Jira
+
+        Returns:
+            response - Response of the resent request if the cached handshake
+                       was discarded
+        """
+        if self._validated:
+            return None
+        with self._lock:
+            if self._validated:
+                return None
+            self._validated = True
+            if response.status_code != 401:
+                return None
+            jiav_logger.warning(
+                "Cached handshake was rejected by Jira, performing a full handshake"
             )
+            storage.invalidate_cached(HANDSHAKE_CACHE_FILE, self._handshake_cache_key)
+            self._handshake()
+        request = response.request.copy()
+        request.headers.pop("Authorization", None)
+        request.prepare_auth(self.jira._session.auth)
+        return self.jira._session.send(request)
+
+    def set_max_connections(self, max_connections: int) -> None:
+        """
+        Sets the amount of connections kept open to Jira, should match the
+        amount of threads sharing the connection
+
+        Arguments:
+            max_connections - Maximum amount of connections
+        """
+        self._max_connections = max_connections
+        self._mount_adapter(self.jira)
+
+    def register_issue_fields(self, fields: Iterable[str]) -> None:
+        """
+        Registers additional issue fields to request when fetching issues,
+        fields declared by backends in their ISSUE_FIELDS attribute are
+        registered when the connection is created
+
+        Arguments:
+            fields - Issue fields
+        """
+        for field in fields:
+            if field not in self.issue_fields:
+                self.issue_fields.append(field)
 
-    def fetch_issues(self, issues: List[str], jql: str) -> List[Issue]:
+    def fetch_issues(
+        self, issues: List[str], jql: str, page_size: int = JQL_PAGE_SIZE
+    ) -> Iterator[Issue]:
         """
         Attempt to fetch issues from Jira
         Requires jira attribute to contain jira.JIRA
         (successful authentication using authenticate method)
 
+        JQL results are streamed page by page, only the first page is fetched
+        before returning, following pages are fetched while the returned
+        iterator is consumed
+
         Arguments:
-            issues - List of Jira issues
-            jql    - Jira Query Language query
+            issues    - List of Jira issues
+            jql       - Jira Query Language query
+            page_size - Amount of issues to request per page of JQL results
 
         Returns:
-            remote_issues - Fetched Jira issues
+            remote_issues - Iterator over fetched Jira issues
         """
         remote_issues: List[Issue] = []
 
-        # Iterate over provided issues
+        # Fetch provided issues in batches
         if issues:
-            for issue in issues:
-                try:
-                    remote_issue = self.jira.issue(issue)
-                    remote_issues.append(remote_issue)
-                except JIRAError as e:
-                    if "You do not have the permission to see " in e.text:
-                        jiav_logger.error(
-                            f"You do not have permissions to view {issue}"
-                        )
-                    # NOTE: In Jira cloud instances, the returned output is
-                    #       'Issue does not exist',
-                    #       While self-hosted instances, the otuput is:
-                    #       'Issue Does Not Exist'
-                    elif "Issue does not exist".lower() in e.text.lower():
-                        jiav_logger.error(f"Issue '{issue}' does not exist")
-                    else:
-                        raise exceptions.JiraUnhandledException()
+            remote_issues = self.fetch_issues_by_key(issues)
+            if remote_issues:
+                jiav_logger.info(f"Discovered issues: {remote_issues}")
         # Perform JQL query
         elif jql:
-            try:
-                remote_issues = self.jira.search_issues(jql, json_result=False)  # type: ignore # noqa: E501
-            except JIRAError as e:
-                if "Error in the JQL Query:" in e.text:
-                    raise exceptions.JQLError(jql, e.text) from None
-                elif "for field" and "is invalid" in e.text:
-                    raise exceptions.InvalidKeyInJQL(jql, e.text) from None
-                else:
-                    raise exceptions.JiraUnhandledException()
+            pages = self.search_issue_pages(jql, page_size)
+            # Fetch the first page eagerly to surface query errors
+            remote_issues = next(pages, [])
             if not remote_issues:
                 raise exceptions.JQLReturnedNothing(jql)
+            return chain(remote_issues, chain.from_iterable(pages))
 
         if not remote_issues:
             raise exceptions.NoIssuesFound()
-        else:
-            jiav_logger.info(f"Discovered issues: {remote_issues}")
-        return remote_issues
+        return iter(remote_issues)
+
+    def search_issue_pages(
+        self, jql: str, page_size: int = JQL_PAGE_SIZE
+    ) -> Iterator[List[Issue]]:
+        """
+        Walks over the pages of a JQL query, the following page is prefetched
+        in the background while the current page is being consumed
+
+        Arguments:
+            jql       - Jira Query Language query
+            page_size - Amount of issues to request per page
+
+        Returns:
+            pages - Iterator over pages of Jira issues
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future: Union[Future[Tuple[List[Issue], Union[int, str, None]]], None] = (
+                executor.submit(self._search_issues_page, jql, page_size, 0)
+            )
+            while future:
+                page, next_page = future.result()
+                future = None
+                if next_page is not None:
+                    future = executor.submit(
+                        self._search_issues_page, jql, page_size, next_page
+                    )
+                if page:
+                    jiav_logger.info(f"Discovered issues: {page}")
+                    yield page
+
+    def _search_jql(
+        self, jql: str, page_size: int, next_page_token: Union[str, None] = None
+    ) -> Dict[str, Any]:
+        """
+        Requests a page of JQL results from the 'search/jql' endpoint of Jira
+        cloud instances
+
+        NOTE: The endpoint is requested directly since older releases of the
+              jira package do not support it
+
+        Arguments:
+            jql             - Jira Query Language query
+            page_size       - Amount of issues to request
+            next_page_token - 'nextPageToken' of the page, None for the first
+                              page
+
+        Returns:
+            result - Raw JQL results
+        """
+        params: Dict[str, Any] = {
+            "jql": jql,
+            "maxResults": page_size,
+            "fields": ",".join(self.issue_fields),
+            "expand": ISSUE_EXPAND,
+        }
+        if next_page_token:
+            params["nextPageToken"] = next_page_token
+        result: Dict[str, Any] = self.jira._get_json("search/jql", params=params)
+        return result
+
+    def _search_issues_page(
+        self, jql: str, page_size: int, page: Union[int, str]
+    ) -> Tuple[List[Issue], Union[int, str, None]]:
+        """
+        Fetches a single page of JQL results
+
+        Jira cloud instances paginate using 'nextPageToken', while
+        self-hosted instances paginate using 'startAt'
+
+        Arguments:
+            jql       - Jira Query Language query
+            page_size - Amount of issues to request
+            page      - 'startAt' offset or 'nextPageToken' of the page
+
+        Returns:
+            remote_issues - Jira issues in page
+            next_page     - 'startAt' offset or 'nextPageToken' of the next
+                            page, None if this is the last page
+        """
+        next_page: Union[int, str, None] = None
+        try:
+            if self.jira._is_cloud:
+                result = self._search_jql(
+                    jql, page_size, page if isinstance(page, str) else None
+                )
+                if not result.get("isLast", True):
+                    next_page = result.get("nextPageToken")
+            else:
+                result = self.jira.search_issues(
+                    jql,
+                    startAt=int(page),
+                    maxResults=page_size,
+                    fields=self.issue_fields,
+                    expand=ISSUE_EXPAND,
+                    json_result=True,
+                )
+                received = int(page) + len(result["issues"])
+                if result["issues"] and received < result.get("total", 0):
+                    next_page = received
+        except JIRAError as e:
+            if "Error in the JQL Query:" in e.text:
+                raise exceptions.JQLError(jql, e.text) from None
+            elif "for field" and "is invalid" in e.text:
+                raise exceptions.InvalidKeyInJQL(jql, e.text) from None
+            else:
+                raise exceptions.JiraUnhandledException()
+        remote_issues: List[Issue] = [
+            Issue(self.jira._options, self.jira._session, raw=raw_issue)
+            for raw_issue in result["issues"]
+        ]
+        return remote_issues, next_page
+
+    def fetch_issues_by_key(self, issues: List[str]) -> List[Issue]:
+        """
+        Fetches issues by their keys using chunked 'key in (...)' JQL queries
+        instead of requesting each issue individually
+
+        Keys that were not returned by the queries are requested individually
+        in order to report why they could not be fetched
+
+        Arguments:
+            issues - List of Jira issues
+
+        Returns:
+            remote_issues - Fetched Jira issues, ordered as requested
+        """
+        # Drop duplicate keys while preserving the requested order
+        requested_keys: List[str] = list(dict.fromkeys(issues))
+        fetched_issues: Dict[str, Issue] = {}
+        for start in range(0, len(requested_keys), ISSUE_KEYS_CHUNK_SIZE):
+            chunk = requested_keys[start : start + ISSUE_KEYS_CHUNK_SIZE]
+            for remote_issue in self._search_issues_by_key(chunk):
+                fetched_issues[remote_issue.key.upper()] = remote_issue
+        # Compare requested keys with the keys returned by Jira
+        for issue in requested_keys:
+            if issue.upper() in fetched_issues:
+                continue
+            jiav_logger.debug(f"Issue '{issue}' was not returned by query")
+            missing_issue = self.fetch_issue(issue)
+            if missing_issue:
+                fetched_issues[issue.upper()] = missing_issue
+        return [
+            fetched_issues[issue.upper()]
+            for issue in requested_keys
+            if issue.upper() in fetched_issues
+        ]
+
+    def _search_issues_by_key(self, keys: List[str]) -> List[Issue]:
+        """
+        Searches for a chunk of issue keys
+
+        An invalid key fails the entire query with a '400 Bad Request'
+        response, in that case the chunk is bisected until the invalid keys
+        are isolated, those keys are left for
+        jiav.jira.JiraConnection.fetch_issue to report
+
+        Arguments:
+            keys - Chunk of Jira issue keys
+
+        Returns:
+            remote_issues - Jira issues returned by the query
+        """
+        jql = "key in ({})".format(
+            ", ".join(['"{}"'.format(key.replace('"', '\\"')) for key in keys])
+        )
+        try:
+            if self.jira._is_cloud:
+                return [
+                    Issue(self.jira._options, self.jira._session, raw=raw_issue)
+                    for raw_issue in self._search_jql(jql, len(keys))["issues"]
+                ]
+            return list(
+                self.jira.search_issues(
+                    jql,
+                    maxResults=len(keys),
+                    validate_query=False,
+                    fields=self.issue_fields,
+                    expand=ISSUE_EXPAND,
+                    json_result=False,
+                )
+            )
+        except JIRAError as e:
+            if e.status_code != 400:
+                raise exceptions.JiraUnhandledException()
+            if len(keys) == 1:
+                return []
+        middle = len(keys) // 2
+        return self._search_issues_by_key(keys[:middle]) + self._search_issues_by_key(
+            keys[middle:]
+        )
+
+    def fetch_issue(
+        self, issue: str, fields: Union[List[str], None] = None
+    ) -> Union[Issue, None]:
+        """
+        Fetches a single issue by its key
+
+        Arguments:
+            issue  - Jira issue
+            fields - Issue fields to request, defaults to the issue_fields
+                     attribute
+
+        Returns:
+            remote_issue - Fetched Jira issue, None if it can not be viewed
+        """
+        try:
+            return self.jira.issue(
+                issue,
+                fields=",".join(self.issue_fields if fields is None else fields),
+                expand=ISSUE_EXPAND,
+            )
+        except JIRAError as e:
+            if "You do not have the permission to see " in e.text:
+                jiav_logger.error(f"You do not have permissions to view {issue}")
+            # NOTE: In Jira cloud instances, the returned output is
+            #       'Issue does not exist',
+            #       While self-hosted instances, the otuput is:
+            #       'Issue Does Not Exist'
+            elif "Issue does not exist".lower() in e.text.lower():
+                jiav_logger.error(f"Issue '{issue}' does not exist")
+            else:
+                raise exceptions.JiraUnhandledException()
+        return None
+
+    def iter_comments(
+        self, issue: Issue, page_size: int = COMMENTS_PAGE_SIZE
+    ) -> Iterator[Comment]:
+        """
+        Iterates over comments of an issue from the newest to the oldest,
+        pages of comments are requested only when the previous page was
+        consumed
+
+        Arguments:
+            issue     - Jira issue
+            page_size - Amount of comments to request per page
+
+        Returns:
+            comments - Iterator over comments
+        """
+        start_at = 0
+        while True:
+            # NOTE: The comments endpoint is requested directly since older
+            #       releases of the jira package do not support paging it
+            try:
+                result = self.jira._get_json(
+                    f"issue/{issue.key}/comment",
+                    params={
+                        "startAt": start_at,
+                        "maxResults": page_size,
+                        "orderBy": "-created",
+                    },
+                )
+            except JIRAError:
+                raise exceptions.JiraUnhandledException()
+            page: List[Comment] = [
+                Comment(self.jira._options, self.jira._session, raw=raw_comment)
+                for raw_comment in result["comments"]
+            ]
+            jiav_logger.debug(
+                f"Fetched {len(page)} comments of '{issue}' starting at {start_at}"
+            )
+            yield from page
+            start_at += len(page)
+            if len(page) < page_size or start_at >= result.get("total", 0):
+                return
+
+    def _transitions_cache_key(self, issue: Issue) -> Union[str, None]:
+        """
+        Issues of the same project and issue type in the same status share
+        their workflow transitions
+
+        Arguments:
+            issue - Jira issue
+
+        Returns:
+            cache_key - Key of the issue transitions in the transitions cache,
+                        None if the issue lacks the required fields
+        """
+        try:
+            return "/".join(
+                [
+                    str(issue.fields.project.key),
+                    str(issue.fields.issuetype.id),
+                    str(issue.fields.status.id),
+                ]
+            )
+        except AttributeError:
+            return None
+
+    def get_transitions(self, issue: Issue) -> Dict[str, str]:
+        """
+        Get workflow transitions available for an issue, transitions are
+        cached per project, issue type and status for the duration of the
+        run, and persisted between runs if transitions_cache_ttl is set
+
+        Arguments:
+            issue - Jira issue
+
+        Returns:
+            transitions - Mapping of status names to workflow transition IDs
+        """
+        cache_key = self._transitions_cache_key(issue)
+        persisted_key = f"{self._handshake_cache_key}/{cache_key}"
+        if cache_key is not None:
+            if cache_key in self._transitions:
+                return self._transitions[cache_key]
+            if self.transitions_cache_ttl:
+                cached_transitions = storage.get_cached(
+                    TRANSITIONS_CACHE_FILE, persisted_key, self.transitions_cache_ttl
+                )
+                if cached_transitions is not None:
+                    self._transitions[cache_key] = cached_transitions
+                    return self._transitions[cache_key]
+        transitions: Dict[str, str] = {
+            status["name"]: status["id"] for status in self.jira.transitions(issue)
+        }
+        if cache_key is not None:
+            self._transitions[cache_key] = transitions
+            if self.transitions_cache_ttl:
+                with self._lock:
+                    storage.set_cached(
+                        TRANSITIONS_CACHE_FILE,
+                        persisted_key,
+                        transitions,
+                        ttl=self.transitions_cache_ttl,
+                    )
+        return transitions
+
+    def invalidate_transitions(self, issue: Issue) -> None:
+        """
+        Removes cached workflow transitions of an issue
+
+        Arguments:
+            issue - Jira issue
+        """
+        cache_key = self._transitions_cache_key(issue)
+        if cache_key is None:
+            return
+        self._transitions.pop(cache_key, None)
+        if self.transitions_cache_ttl:
+            with self._lock:
+                storage.invalidate_cached(
+                    TRANSITIONS_CACHE_FILE, f"{self._handshake_cache_key}/{cache_key}"
+                )
 
     def check_if_status_is_valid(
         self, issue: Issue, desired_status: str
@@ -148,23 +722,28 @@ class JiraConnection(ABC):
             transition_id - Workflow transition ID to use when updating
                             the status of the issue
         """
-        transition_id: Union[None, str] = None
-        issue_transitions = self.jira.transitions(issue)
-        for status in issue_transitions:
-            if desired_status == status["name"]:
-                transition_id = status["id"]
-        return transition_id
+        return self.get_transitions(issue).get(desired_status)
 
-    def upload_attachment(self, issue: Issue, file_path: str) -> None:
+    def upload_attachment(
+        self,
+        issue: Issue,
+        attachment: Union[str, IO[bytes]],
+        filename: Union[str, None] = None,
+    ) -> None:
         """
         Uploads an attachment to issue
 
         Arguments:
-            issue    - Jira issue
-            filename - Path of the file to add as an attachment
+            issue      - Jira issue
+            attachment - Path of the file or file object to add as an
+                         attachment, file objects are read from their start
+            filename   - Name of the attachment, defaults to the name of the
+                         file
         """
         try:
-            self.jira.add_attachment(issue=issue, attachment=file_path)
+            self.jira.add_attachment(
+                issue=issue, attachment=attachment, filename=filename
+            )
             jiav_logger.info(f"Uploaded attachment to issue '{issue}'")
         except JIRAError:
             raise exceptions.JiraUnhandledException()
@@ -180,8 +759,28 @@ class JiraConnection(ABC):
                             the status of the issue
         """
         try:
-            self.jira.transition_issue(issue, transition=transition_id)
-            issue.update()
+            try:
+                self.jira.transition_issue(issue, transition=transition_id)
+            except JIRAError:
+                # Transition ID might originate from a stale cache entry,
+                # invalidate it and retry with the current transitions
+                desired_status = {
+                    v: k for k, v in self.get_transitions(issue).items()
+                }.get(transition_id)
+                self.invalidate_transitions(issue)
+                if not desired_status:
+                    raise
+                fresh_transition_id = self.check_if_status_is_valid(
+                    issue, desired_status
+                )
+                if not fresh_transition_id or fresh_transition_id == transition_id:
+                    raise
+                self.jira.transition_issue(issue, transition=fresh_transition_id)
+            # Reload the issue to reflect its new status
+            issue.find(
+                issue.key,
+                params={"fields": ",".join(self.issue_fields + SUMMARY_FIELDS)},
+            )
             jiav_logger.info(f"Updated status for '{issue}'")
         except JIRAError:
             raise exceptions.JiraUnhandledException()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, NamedTuple, Union
+
+from jiav import logger, storage
+
+jiav_logger = logger.subscribe_to_logger()
+
+# File used to persist the ledger of executed manifests
+LEDGER_FILE: str = "ledger.sqlite3"
+
+
+class StepStats(NamedTuple):
+    """
+    Statistics of the executions of a step
+
+    Attributes:
+        executions - Amount of times the step was executed
+        failures   - Amount of times the step failed or timed out
+        seconds    - Total seconds the step executed for
+    """
+
+    executions: int
+    failures: int
+    seconds: float
+
+
+class Ledger:
+    """
+    Ledger of executed manifests and of the timings of their steps
+
+    A manifest is identified by the issue, the comment containing it and the
+    time the comment was last updated, editing the comment produces a new
+    manifest
+
+    A step is identified by its backend and arguments, regardless of the
+    manifests containing it
+
+    Attributes:
+        path      - Path of the SQLite database
+        opened_at - Time the ledger was opened, outcomes recorded since then
+                    were recorded by the current process
+    """
+
+    def __init__(self, path: Union[str, None] = None) -> None:
+        self.path = path if path else os.path.join(storage.get_cache_dir(), LEDGER_FILE)
+        self.opened_at = time.time()
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                " ".join(
+                    [
+                        "CREATE TABLE IF NOT EXISTS executions (",
+                        "issue TEXT NOT NULL,",
+                        "comment_id TEXT NOT NULL,",
+                        "comment_updated TEXT NOT NULL,",
+                        "successful INTEGER NOT NULL,",
+                        "executed_at REAL NOT NULL,",
+                        "PRIMARY KEY (issue, comment_id, comment_updated))",
+                    ]
+                )
+            )
+            self._connection.execute(
+                " ".join(
+                    [
+                        "CREATE TABLE IF NOT EXISTS steps (",
+                        "step TEXT PRIMARY KEY,",
+                        "executions INTEGER NOT NULL,",
+                        "failures INTEGER NOT NULL,",
+                        "seconds REAL NOT NULL,",
+                        "executed_at REAL NOT NULL)",
+                    ]
+                )
+            )
+
+    def get_outcome(
+        self, issue: str, comment_id: str, comment_updated: str, since: float = 0
+    ) -> Union[bool, None]:
+        """
+        Get the outcome of a previously executed manifest
+
+        Arguments:
+            issue           - Jira issue key
+            comment_id      - ID of the comment containing the manifest
+            comment_updated - Time the comment was last updated
+            since           - Ignore outcomes recorded before this time
+
+        Returns:
+            successful - Whether the manifest executed successfully, None if
+                         the manifest was not executed
+        """
+        with self._lock:
+            row = self._connection.execute(
+                " ".join(
+                    [
+                        "SELECT successful FROM executions",
+                        "WHERE issue = ? AND comment_id = ? AND comment_updated = ?",
+                        "AND executed_at >= ?",
+                    ]
+                ),
+                (issue, comment_id, comment_updated, since),
+            ).fetchone()
+        return bool(row[0]) if row else None
+
+    def record(
+        self, issue: str, comment_id: str, comment_updated: str, successful: bool
+    ) -> None:
+        """
+        Record the outcome of an executed manifest
+
+        Arguments:
+            issue           - Jira issue key
+            comment_id      - ID of the comment containing the manifest
+            comment_updated - Time the comment was last updated
+            successful      - Whether the manifest executed successfully
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO executions VALUES (?, ?, ?, ?, ?)",
+                (issue, comment_id, comment_updated, int(successful), time.time()),
+            )
+        jiav_logger.debug(
+            f"Recorded execution of comment '{comment_id}' in issue '{issue}'"
+        )
+
+    def get_step_stats(self, steps: List[str]) -> Dict[str, StepStats]:
+        """
+        Get the statistics of previously executed steps
+
+        Arguments:
+            steps - Keys of the steps
+
+        Returns:
+            stats - Statistics of the steps which were executed, by step key
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                " ".join(
+                    [
+                        "SELECT step, executions, failures, seconds FROM steps",
+                        f"WHERE step IN ({', '.join('?' for _ in steps)})",
+                    ]
+                ),
+                steps,
+            ).fetchall()
+        return {row[0]: StepStats(*row[1:]) for row in rows}
+
+    def record_step(self, step: str, seconds: float, successful: bool) -> None:
+        """
+        Record the execution of a step
+
+        Arguments:
+            step       - Key of the step
+            seconds    - Seconds the step executed for
+            successful - Whether the step executed successfully
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                " ".join(
+                    [
+                        "INSERT INTO steps VALUES (?, 1, ?, ?, ?)",
+                        "ON CONFLICT (step) DO UPDATE SET",
+                        "executions = executions + 1,",
+                        "failures = failures + excluded.failures,",
+                        "seconds = seconds + excluded.seconds,",
+                        "executed_at = excluded.executed_at",
+                    ]
+                ),
+                (step, int(not successful), seconds, time.time()),
+            )
+
+    def close(self) -> None:
+        """
+        Close the ledger
+        """
+        with self._lock:
+            self._connection.close()
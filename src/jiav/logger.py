@@ -1,11 +1,31 @@
 #!/usr/bin/env python
 
 import logging
-from logging import Logger
+import threading
+from contextlib import contextmanager
+from logging import Logger, LogRecord
+from typing import Iterator, List, Union
 
 from rich.console import Console
 from rich.logging import RichHandler
 
+# Log records buffered by the current thread
+_thread_buffer = threading.local()
+
+
+class ThreadBufferFilter(logging.Filter):
+    """
+    Diverts log records emitted by threads that requested buffering, allows
+    to emit logs of concurrent work in a deterministic order
+    """
+
+    def filter(self, record: LogRecord) -> bool:
+        records = getattr(_thread_buffer, "records", None)
+        if records is None:
+            return True
+        records.append(record)
+        return False
+
 
 def subscribe_to_logger() -> Logger:
     """
@@ -43,3 +63,61 @@ def configure_logger(debug: bool = False) -> Logger:
     if debug:
         logger.setLevel(logging.DEBUG)
     return logger
+
+
+@contextmanager
+def buffer_records() -> Iterator[List[LogRecord]]:
+    """
+    Buffers log records emitted by the current thread instead of emitting
+    them, buffered records are emitted using replay_records
+
+    Returns:
+        records - Buffered log records
+    """
+    records: List[LogRecord] = []
+    _thread_buffer.records = records
+    try:
+        yield records
+    finally:
+        _thread_buffer.records = None
+
+
+def current_records() -> Union[List[LogRecord], None]:
+    """
+    Gets the log records buffered by the current thread
+
+    Returns:
+        records - Buffered log records, None if the thread does not buffer
+    """
+    return getattr(_thread_buffer, "records", None)
+
+
+@contextmanager
+def share_records(records: Union[List[LogRecord], None]) -> Iterator[None]:
+    """
+    Buffers log records emitted by the current thread along with records
+    buffered by another thread, used by work started on behalf of that thread
+
+    Arguments:
+        records - Log records returned by current_records of the other thread
+    """
+    _thread_buffer.records = records
+    try:
+        yield
+    finally:
+        _thread_buffer.records = None
+
+
+def replay_records(records: List[LogRecord]) -> None:
+    """
+    Emits buffered log records
+
+    Arguments:
+        records - Log records buffered using buffer_records
+    """
+    logger = subscribe_to_logger()
+    for record in records:
+        logger.handle(record)
+
+
+subscribe_to_logger().addFilter(ThreadBufferFilter())
@@ -1,21 +1,67 @@
 #!/usr/bin/env python
 
-import importlib
+import copy
+import math
+import queue
+import re
+import threading
+import time
 from abc import ABC
-from typing import Any, Dict, List, Type, Union
+from typing import Any, Dict, List, Tuple, Type, Union
 
-import jsonschema
 import jsonschema.exceptions
 import yaml
 import yaml.composer
 import yaml.parser
 import yaml.scanner
 
-from jiav import exceptions, logger
-from jiav.backend import BaseBackend, import_backends
+from jiav import content, exceptions, logger
+from jiav.backend import BaseBackend, Result, import_backends, load_backend
+from jiav.ledger import Ledger
+from jiav.manifest_cache import (
+    INVALID,
+    INVALID_BACKEND,
+    VALID,
+    manifest_cache,
+)
+from jiav.schema import validate
+from jiav.step_results import StepResults, step_key
 
 jiav_logger = logger.subscribe_to_logger()
 
+# Use libyaml to parse manifests when it is available
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+# Lines wrapping a manifest pasted in a Jira code block
+CODE_BLOCK_REGEX = re.compile(
+    r"^[ \t]*\{(?:code|noformat)(?::[^}\n]*)?\}[ \t]*\r?$", re.MULTILINE
+)
+# A manifest contains a top-level 'jiav' key (in block, flow or explicit key
+# style), the whole manifest may be indented so nested 'jiav' keys match as
+# well and are rejected when the manifest is parsed
+MANIFEST_KEY_REGEX = re.compile(
+    r"^[ \t]*(?:\{\s*)?(?:\?[ \t]*[\"']?jiav[\"']?|[\"']?jiav[\"']?[ \t]*:)",
+    re.MULTILINE,
+)
+# Maximum amount of steps of a manifest executed concurrently
+STEP_WORKERS: int = 8
+
+
+def extract_manifest_text(text: str) -> Union[str, None]:
+    """
+    Cheaply checks if text may contain a manifest, without parsing it
+
+    Arguments:
+        text - Comment body
+
+    Returns:
+        manifest_text - Text without Jira code block wrappers, None if text
+                        can not contain a manifest
+    """
+    if "jiav" not in text:
+        return None
+    text = CODE_BLOCK_REGEX.sub("", text)
+    return text if MANIFEST_KEY_REGEX.search(text) else None
+
 
 class Manifest(ABC):
     """
@@ -27,6 +73,13 @@ class Manifest(ABC):
         verified_status    - Jira status to transition to
         verification_steps - Verification steps to perform
         backend_steps      - Parsed backend steps to execute
+        order_independent  - Whether steps may be executed in any order
+        step_dependencies  - Indexes of the steps each backend step waits for,
+                             None if the step waits for every step executed
+                             before it
+        step_timeouts      - Seconds each backend step may execute for, 0
+                             disables the timeout
+        timed_out          - Whether a step was abandoned after timing out
     """
 
     # A JSON schema for jiav manifest
@@ -40,6 +93,7 @@ class Manifest(ABC):
                 "properties": {
                     "verification_steps": {"type": "array"},
                     "verified_status": {"type": "string"},
+                    "order_independent": {"type": "boolean"},
                 },
             }
         },
@@ -48,18 +102,73 @@ class Manifest(ABC):
     STEP_SCHEMA = {
         "type": "object",
         "required": ["name", "backend"],
-        "properties": {"name": {"type": "string"}, "backend": {"type": "string"}},
+        "properties": {
+            "name": {"type": "string"},
+            "backend": {"type": "string"},
+            "depends_on": {"type": "array", "items": {"type": "string"}},
+            "parallel": {"type": "boolean"},
+            "timeout": {"type": "number", "exclusiveMinimum": 0},
+        },
     }
 
     def __init__(self, manifest_text: str) -> None:
-        self.manifest: Dict = self.validiate_text_contains_manifest(manifest_text)
         self.successful: bool = False
+        self.backend_steps: List[BaseBackend] = []
+        self.step_dependencies: List[Union[List[int], None]] = []
+        self.step_timeouts: List[float] = []
+        self.timed_out: bool = False
+        # Comments which can not contain a manifest are neither parsed nor
+        # cached
+        extracted_text = extract_manifest_text(manifest_text)
+        if extracted_text is None:
+            raise exceptions.InvalidManifestException(
+                "Comment does not contain a 'jiav' key"
+            )
+        # Comments parsed before are not parsed and validated again, comments
+        # differing only by their code block wrappers share an entry
+        cache_key = manifest_cache.key(extracted_text)
+        cached = manifest_cache.get(cache_key)
+        if cached is None:
+            try:
+                self.manifest: Dict = self.validiate_text_contains_manifest(
+                    extracted_text
+                )
+                # Steps are modified while validated
+                parsed_manifest = copy.deepcopy(self.manifest)
+                self._load_manifest()
+                self.validate_verifications_steps()
+            except exceptions.InvalidManifestException as e:
+                manifest_cache.set(cache_key, INVALID, str(e))
+                raise
+            except exceptions.InvalidBackend as e:
+                manifest_cache.set(cache_key, INVALID_BACKEND, e.backend)
+                raise
+            manifest_cache.set(cache_key, VALID, parsed_manifest)
+            return
+        outcome, payload = cached
+        if outcome == INVALID:
+            raise exceptions.InvalidManifestException(payload)
+        if outcome == INVALID_BACKEND:
+            raise exceptions.InvalidBackend(payload)
+        self.manifest = copy.deepcopy(payload)
+        self._load_manifest()
+        step_names: List[str] = []
+        for step in self.verification_steps:
+            self.step_dependencies.append(
+                self.resolve_step_dependencies(step, step_names)
+            )
+            self.step_timeouts.append(float(step.get("timeout", 0)))
+            step_names.append(step["name"])
+            self.backend_steps.append(self.build_verification_step(step))
+
+    def _load_manifest(self) -> None:
         self.verified_status: str = self.manifest["jiav"]["verified_status"]
+        self.order_independent: bool = self.manifest["jiav"].get(
+            "order_independent", False
+        )
         self.verification_steps: List[Dict[str, str]] = self.manifest["jiav"][
             "verification_steps"
         ]
-        self.backend_steps: List[BaseBackend] = []
-        self.validate_verifications_steps()
 
     def validiate_text_contains_manifest(self, text: str) -> Dict[Any, Any]:
         """
@@ -68,8 +177,12 @@ class Manifest(ABC):
         """
         # Attempt to parse YAML from comment
         m: Dict[Any, Any] = {}
+        manifest_text = extract_manifest_text(text)
         try:
-            m = yaml.safe_load(text)
+            if manifest_text is None:
+                jiav_logger.debug("Comment does not contain a 'jiav' key")
+            else:
+                m = yaml.load(manifest_text, Loader=YAML_LOADER)
         except yaml.scanner.ScannerError:
             jiav_logger.debug("Comment can not be parsed as YAML")
         except yaml.parser.ParserError:
@@ -78,7 +191,7 @@ class Manifest(ABC):
             jiav_logger.debug("Comment can not be parsed as YAML")
         # Attempt to validate YAML according to schema
         try:
-            jsonschema.validate(instance=m, schema=self.ROOT_JIAV_SCHEMA)
+            validate(instance=m, schema=self.ROOT_JIAV_SCHEMA)
         except jsonschema.exceptions.ValidationError as e:
             raise exceptions.InvalidManifestException(e) from None
         return m
@@ -92,61 +205,305 @@ class Manifest(ABC):
 
         Returns a boolean value if the requested backed is installed
         """
-        return backend in import_backends().keys()
+        return backend in import_backends()
 
-    def validate_verification_step(self, step: Dict[str, Any]) -> bool:
+    def build_verification_step(self, step: Dict[str, Any]) -> BaseBackend:
         """
-        Validates a verification step
+        Builds the backend executing a verification step
 
         Arguments:
             step - Verification step
 
-        Returns True if successfully validated verification step
+        Returns:
+            backend_instance - Backend executing the step
         """
         backend_name: str = step["backend"]
-        backend_class_name: str = import_backends()[backend_name]["class"]
-        backend_module = importlib.import_module(backend_class_name.split(".")[0])
-        backend_module_class: str = backend_class_name.split(".")[1]
-        backend_class: Type[BaseBackend] = getattr(backend_module, backend_module_class)
+        backend_class: Type[BaseBackend] = load_backend(backend_name)
         # Construct initial class
         backend_instance = backend_class()  # type: ignore
         # Remove unnecessary keys for schema validation
         del step["backend"]
         del step["name"]
+        step.pop("depends_on", None)
+        step.pop("parallel", None)
+        step.pop("timeout", None)
         backend_instance.step = step
+        return backend_instance
+
+    def resolve_step_dependencies(
+        self, step: Dict[str, Any], step_names: List[str]
+    ) -> Union[List[int], None]:
+        """
+        Resolves the steps a verification step waits for
+
+        A step waits for the steps listed in 'depends_on', a 'parallel' step
+        without 'depends_on' does not wait, any other step waits for all
+        steps executed before it
+
+        Arguments:
+            step       - Verification step
+            step_names - Names of the steps declared before the step
+
+        Returns:
+            dependencies - Indexes of the steps the step waits for, None if
+                           the step waits for all steps executed before it
+        """
+        if "depends_on" not in step:
+            return [] if step.get("parallel") else None
+        dependencies: List[int] = []
+        for dependency in step["depends_on"]:
+            if dependency not in step_names:
+                raise exceptions.InvalidManifestException(
+                    " ".join(
+                        [
+                            f"Step '{step['name']}' depends on '{dependency}'",
+                            "which is not declared before it",
+                        ]
+                    )
+                )
+            dependencies.extend(
+                index for index, name in enumerate(step_names) if name == dependency
+            )
+        return sorted(set(dependencies))
+
+    def validate_verification_step(self, step: Dict[str, Any]) -> bool:
+        """
+        Validates a verification step
+
+        Arguments:
+            step - Verification step
+
+        Returns True if successfully validated verification step
+        """
+        backend_instance = self.build_verification_step(step)
         # Validate backend schema
         backend_instance.validate_schema()
         self.backend_steps.append(backend_instance)
         return True
 
-    def execute_manifest(self) -> None:
+    def execution_order(self, step_stats: Union[Ledger, None] = None) -> List[int]:
+        """
+        Orders the steps for execution, steps of order independent manifests
+        are ordered by their recorded timings so cheap steps likely to fail
+        are executed first
+
+        Arguments:
+            step_stats - Ledger containing the timings of executed steps
+
+        Returns:
+            order - Indexes of the steps in the order they are executed
+        """
+        order = list(range(len(self.backend_steps)))
+        if not self.order_independent or step_stats is None:
+            return order
+        keys = [step_key(step) for step in self.backend_steps]
+        stats = step_stats.get_step_stats(keys)
+
+        def cost(index: int) -> float:
+            recorded = stats.get(keys[index])
+            # Steps without timings are executed first to record them
+            if recorded is None:
+                return 0
+            # Expected seconds spent per failure detected by the step
+            failure_rate = (recorded.failures + 1) / (recorded.executions + 2)
+            return recorded.seconds / recorded.executions / failure_rate
+
+        # Steps are executed after the steps listed in their 'depends_on'
+        remaining = sorted(order, key=cost)
+        order = []
+        while remaining:
+            index = next(
+                index
+                for index in remaining
+                if all(i in order for i in self.step_dependencies[index] or [])
+            )
+            remaining.remove(index)
+            order.append(index)
+        return order
+
+    def execute_step(
+        self, step: BaseBackend, step_results: Union[StepResults, None] = None
+    ) -> bool:
+        """
+        Executes a backend step
+
+        Arguments:
+            step         - Backend step
+            step_results - Results of steps executed during the run, reused
+                           by identical steps
+
+        Returns:
+            executed - False if the result of an identical step was reused
+        """
+        jiav_logger.debug("Executing backend '{}'".format(step.name))
+        if step_results is None:
+            step.execute_backend()
+            return True
+        return step_results.execute(step)
+
+    def execute_manifest(
+        self,
+        timeout: float = 0,
+        step_results: Union[StepResults, None] = None,
+        step_stats: Union[Ledger, None] = None,
+    ) -> None:
         """
-        Executes manifest
+        Executes manifest, steps are executed once the steps they depend on
+        were executed successfully
+
+        Steps exceeding their timeout or the timeout of the manifest are
+        abandoned and fail with a timed out result
+
+        Arguments:
+            timeout      - Seconds the manifest may execute for, 0 disables
+                           the timeout
+            step_results - Results of steps executed during the run, reused
+                           by identical steps
+            step_stats   - Ledger recording the timings of executed steps
 
         Returns:
             execution_output - jiav manifest execution output
         """
-        # Init variables
-        execution_output: List[Union[str, List[str]]] = []
-        # Iterate over steps in manifest
-        for step in self.backend_steps:
-            jiav_logger.debug("Executing backend '{}'".format(step.name))
-            execution_output.append("Output of backend '{}':\n".format(step.name))
-            try:
-                step.execute_backend()
-            except Exception:
-                raise exceptions.BackendExecutionFailed(step.name)
-            if step.result.successful:
-                execution_output.append(step.result.output)
-            # If one of the steps failed, immediately fail and don't continue
+        # Results of the executed steps, by step index
+        results: Dict[int, Result] = {}
+        crashed: Dict[int, BaseException] = {}
+        # Exceptions raised by steps, including abandoned steps
+        errors: Dict[int, BaseException] = {}
+        waiting: List[int] = self.execution_order(step_stats)
+        dependencies: Dict[int, List[int]] = {}
+        for position, index in enumerate(waiting):
+            step_dependencies = self.step_dependencies[index]
+            dependencies[index] = (
+                waiting[:position] if step_dependencies is None else step_dependencies
+            )
+        # Seconds each step executed for, by step index
+        durations: Dict[int, float] = {}
+        # Deadlines of the running steps, by step index
+        running: Dict[int, Tuple[float, float]] = {}
+        completed: "queue.Queue[int]" = queue.Queue()
+        # Output of the executed steps, by step index, written as each step
+        # completes
+        step_outputs: Dict[int, content.OutputSink] = {}
+        records = logger.current_records()
+        manifest_deadline = time.monotonic() + timeout if timeout else math.inf
+
+        def collect(index: int, result: Result) -> None:
+            results[index] = result
+            step_output = step_outputs[index] = content.OutputSink()
+            step_output.write(
+                "Output of backend '{}':\n".format(self.backend_steps[index].name)
+            )
+            # If stderr contains output of a failed step, log it
+            if not result.successful and result.errors:
+                step_output.write_lines(result.errors)
             else:
-                # If stderr contains output, log it
-                if step.result.errors:
-                    execution_output.append(step.result.errors)
+                step_output.write_lines(result.output)
+
+        def execute(index: int) -> None:
+            with logger.share_records(records):
+                try:
+                    started = time.perf_counter()
+                    if self.execute_step(self.backend_steps[index], step_results):
+                        durations[index] = time.perf_counter() - started
+                except Exception as e:
+                    errors[index] = e
+                finally:
+                    completed.put(index)
+
+        try:
+            while waiting or running:
+                failed = crashed or not all(
+                    result.successful for result in results.values()
+                )
+                # If one of the steps failed, don't start outstanding steps
+                if not failed:
+                    for index in [
+                        index
+                        for index in waiting
+                        if all(
+                            i in results and results[i].successful
+                            for i in dependencies[index]
+                        )
+                    ][: STEP_WORKERS - len(running)]:
+                        waiting.remove(index)
+                        step_started = time.monotonic()
+                        step_timeout = self.step_timeouts[index]
+                        running[index] = (
+                            step_started,
+                            min(
+                                manifest_deadline,
+                                (
+                                    step_started + step_timeout
+                                    if step_timeout
+                                    else math.inf
+                                ),
+                            ),
+                        )
+                        # Abandoned steps do not prevent the process from exiting
+                        threading.Thread(
+                            target=execute, args=(index,), daemon=True
+                        ).start()
+                if not running:
+                    break
+                deadline = min(deadline for _, deadline in running.values())
+                try:
+                    index = completed.get(
+                        timeout=(
+                            None
+                            if deadline == math.inf
+                            else max(0, deadline - time.monotonic())
+                        )
+                    )
+                except queue.Empty:
+                    now = time.monotonic()
+                    for index, (step_started, step_deadline) in list(running.items()):
+                        if step_deadline > now:
+                            continue
+                        del running[index]
+                        message = " ".join(
+                            [
+                                f"Backend '{self.backend_steps[index].name}' timed out",
+                                f"after {now - step_started:.1f} seconds",
+                            ]
+                        )
+                        jiav_logger.error(message)
+                        collect(index, Result(False, [], [message], timed_out=True))
+                        if step_stats:
+                            step_stats.record_step(
+                                step_key(self.backend_steps[index]),
+                                now - step_started,
+                                False,
+                            )
+                    continue
+                # Steps completing after being abandoned are ignored
+                if running.pop(index, None) is None:
+                    continue
+                if index in errors:
+                    crashed[index] = errors[index]
                 else:
-                    execution_output.append(step.result.output)
-                break
-            self.successful = True
+                    collect(index, self.backend_steps[index].result)
+                    if step_stats and index in durations:
+                        step_stats.record_step(
+                            step_key(self.backend_steps[index]),
+                            durations[index],
+                            results[index].successful,
+                        )
+            if crashed:
+                index = min(crashed)
+                raise exceptions.BackendExecutionFailed(
+                    self.backend_steps[index].name
+                ) from crashed[index]
+            # Join output in declaration order of the executed steps
+            execution_output = content.OutputSink()
+            for index in sorted(step_outputs):
+                execution_output.append(step_outputs[index])
+        finally:
+            for step_output in step_outputs.values():
+                step_output.close()
+        self.successful = len(results) == len(self.backend_steps) > 0 and all(
+            result.successful for result in results.values()
+        )
+        self.timed_out = any(result.timed_out for result in results.values())
         self.execution_output = execution_output
         if self.successful:
             jiav_logger.info("Manifest was executed successfully")
@@ -158,15 +515,21 @@ class Manifest(ABC):
         Validates verification_steps from jiav manifest
         """
         steps = self.verification_steps
+        step_names: List[str] = []
         # Iterate over steps in manifest
         for step in steps:
             step_backend = step.get("backend")
             # Attempt to validate step according to schema
             try:
-                jsonschema.validate(instance=step, schema=self.STEP_SCHEMA)
+                validate(instance=step, schema=self.STEP_SCHEMA)
             except jsonschema.exceptions.ValidationError as e:
                 raise exceptions.InvalidManifestException(e)
 
             if not self.backend_is_valid(str(step_backend)):
                 raise exceptions.InvalidBackend(str(step_backend))
+            self.step_dependencies.append(
+                self.resolve_step_dependencies(step, step_names)
+            )
+            self.step_timeouts.append(float(step.get("timeout", 0)))
+            step_names.append(step["name"])
             self.validate_verification_step(step)
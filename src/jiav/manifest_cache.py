@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Tuple, Union
+
+from jiav import logger, storage
+from jiav.backend import import_backends
+
+jiav_logger = logger.subscribe_to_logger()
+
+# File used to persist parsed manifests between runs
+MANIFESTS_CACHE_FILE: str = "manifests.json"
+# Maximum amount of parsed manifests kept in memory
+MANIFEST_CACHE_SIZE: int = 1024
+
+# Outcomes of parsing a comment
+VALID: str = "valid"
+INVALID: str = "invalid"
+INVALID_BACKEND: str = "invalid_backend"
+
+
+class ManifestCache:
+    """
+    Least recently used cache of parsed comments, keyed by a hash of the
+    comment body and of the installed backend versions
+
+    A parsed comment is either a validated manifest structure (VALID), the
+    message of the validation error (INVALID) or the unsupported backend
+    (INVALID_BACKEND)
+
+    Attributes:
+        maxsize - Maximum amount of cached comments
+        ttl     - Seconds to persist cached comments between runs, 0 keeps
+                  them in memory only
+    """
+
+    def __init__(self, maxsize: int = MANIFEST_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.ttl: float = 0
+        self._entries: "OrderedDict[str, Tuple[str, Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._backends_fingerprint: Union[str, None] = None
+
+    def key(self, text: str) -> str:
+        """
+        Compute the key of a comment body
+
+        Arguments:
+            text - Comment body
+
+        Returns:
+            key - Hex digest of the body and installed backend versions
+        """
+        if self._backends_fingerprint is None:
+            self._backends_fingerprint = storage.fingerprint(
+                *[
+                    f"{name}={backend['version']}"
+                    for name, backend in sorted(import_backends().items())
+                ]
+            )
+        digest = hashlib.sha256(self._backends_fingerprint.encode())
+        digest.update(text.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Union[Tuple[str, Any], None]:
+        """
+        Get a parsed comment
+
+        Arguments:
+            key - Key of the comment
+
+        Returns:
+            outcome - Tuple of the outcome and its payload, None if the
+                      comment was not parsed yet
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+        return entry[0], entry[1]
+
+    def set(
+        self, key: str, outcome: str, payload: Any, timestamp: Union[float, None] = None
+    ) -> None:
+        """
+        Cache a parsed comment, evicts the least recently used comment when
+        the cache is full
+
+        Arguments:
+            key       - Key of the comment
+            outcome   - VALID, INVALID or INVALID_BACKEND
+            payload   - Manifest structure, error message or backend name
+            timestamp - Time the comment was parsed at
+        """
+        with self._lock:
+            self._entries[key] = (outcome, payload, timestamp or time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def load(self, ttl: float) -> None:
+        """
+        Load comments persisted by previous runs, comments are persisted by
+        save from now on
+
+        Arguments:
+            ttl - Seconds to persist cached comments between runs
+        """
+        self.ttl = ttl
+        now = time.time()
+        persisted = [
+            (entry["timestamp"], key, entry["value"])
+            for key, entry in storage.read_json(MANIFESTS_CACHE_FILE).items()
+            if isinstance(entry, dict) and now - entry.get("timestamp", 0) <= ttl
+        ]
+        # Most recent comments are inserted last
+        for timestamp, key, (outcome, payload) in sorted(persisted)[-self.maxsize :]:
+            self.set(key, outcome, payload, timestamp)
+        jiav_logger.debug(f"Loaded {len(self._entries)} cached manifests")
+
+    def save(self) -> None:
+        """
+        Persist cached comments, does nothing unless load was called
+        """
+        if not self.ttl:
+            return
+        content = {}
+        with self._lock:
+            entries = list(self._entries.items())
+        for key, (outcome, payload, timestamp) in entries:
+            # YAML may produce values which can not be persisted as JSON
+            try:
+                json.dumps(payload)
+            except (TypeError, ValueError):
+                continue
+            content[key] = {"timestamp": timestamp, "value": [outcome, payload]}
+        storage.write_json(MANIFESTS_CACHE_FILE, content)
+        jiav_logger.debug(f"Saved {len(content)} cached manifests")
+
+    def clear(self) -> None:
+        """
+        Remove all cached comments from memory
+        """
+        with self._lock:
+            self._entries.clear()
+        self._backends_fingerprint = None
+
+
+# Cache shared by all manifests parsed by the process
+manifest_cache = ManifestCache()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+
+import random
+import threading
+import time
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Union
+
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+
+from jiav import logger
+
+jiav_logger = logger.subscribe_to_logger()
+
+# HTTP status codes returned by Jira when requests are throttled
+THROTTLED_STATUS_CODES = (429, 503)
+# Maximum amount of retries of a throttled request
+MAX_RETRIES: int = 5
+# Initial delay in seconds between retries of a throttled request
+BACKOFF_BASE: float = 1.0
+# Maximum delay in seconds between retries of a throttled request
+BACKOFF_MAX: float = 60.0
+
+
+class RateLimiter:
+    """
+    Client-side token bucket limiter shared by all requests sent to Jira
+
+    When Jira throttles a request, the limiter pauses all requests until the
+    delay requested by Jira (or an exponential backoff with jitter) passes,
+    and halves the request rate; the rate recovers gradually on successful
+    requests
+
+    Attributes:
+        rate  - Configured requests per second, 0 disables limiting
+        burst - Maximum amount of requests sent at once
+    """
+
+    def __init__(self, rate: float = 0, burst: int = 0) -> None:
+        self.rate = rate
+        self.burst = burst if burst else max(1, int(rate))
+        self._lock = threading.Lock()
+        self._current_rate = rate
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._counters: Dict[str, float] = {
+            "requests": 0,
+            "throttled": 0,
+            "retries": 0,
+            "waited_seconds": 0.0,
+        }
+
+    def acquire(self) -> None:
+        """
+        Blocks until a request is allowed to be sent
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                delay = self._paused_until - now
+                if delay <= 0 and self._current_rate:
+                    self._tokens = min(
+                        float(self.burst),
+                        self._tokens + (now - self._updated) * self._current_rate,
+                    )
+                    self._updated = now
+                    if self._tokens < 1:
+                        delay = (1 - self._tokens) / self._current_rate
+                    else:
+                        self._tokens -= 1
+                if delay <= 0:
+                    self._counters["requests"] += 1
+                    return
+                self._counters["waited_seconds"] += delay
+            time.sleep(delay)
+
+    def throttled(self, response: Response, attempt: int) -> float:
+        """
+        Registers a throttled response and pauses requests
+
+        Arguments:
+            response - Throttled response
+            attempt  - Amount of times the request was attempted
+
+        Returns:
+            delay - Seconds to wait before retrying the request
+        """
+        delay = self._requested_delay(response)
+        if delay is None:
+            delay = min(BACKOFF_MAX, BACKOFF_BASE * 2**attempt)
+        # Apply jitter to avoid retrying all requests at once
+        delay += random.uniform(0, delay / 2)
+        with self._lock:
+            self._counters["throttled"] += 1
+            self._counters["retries"] += 1
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+            if self._current_rate:
+                self._current_rate = max(self.rate / 16, self._current_rate / 2)
+        jiav_logger.debug(
+            f"Jira throttled request to '{response.url}', retrying in {delay:.2f}s"
+        )
+        return delay
+
+    def observe(self, response: Response) -> None:
+        """
+        Adapts to the rate limit headers of a successful response
+
+        Arguments:
+            response - Response received from Jira
+        """
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        with self._lock:
+            if self._current_rate and self._current_rate < self.rate:
+                self._current_rate = min(self.rate, self._current_rate + self.rate / 20)
+            if remaining is not None and remaining.strip() == "0":
+                delay = self._requested_delay(response)
+                if delay:
+                    self._paused_until = max(
+                        self._paused_until, time.monotonic() + delay
+                    )
+
+    def _requested_delay(self, response: Response) -> Union[float, None]:
+        """
+        Parses the delay requested by Jira from 'Retry-After' or
+        'X-RateLimit-Reset' headers, the reset time is accepted as seconds
+        since the epoch, an HTTP date or an ISO 8601 timestamp
+
+        Arguments:
+            response - Response received from Jira
+
+        Returns:
+            delay - Requested delay in seconds, None if not requested
+        """
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass
+        reset = response.headers.get("X-RateLimit-Reset")
+        if reset:
+            try:
+                # Seconds since the epoch
+                return max(0.0, float(reset) - time.time())
+            except ValueError:
+                pass
+            try:
+                return max(0.0, parsedate_to_datetime(reset).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+            try:
+                # Jira cloud returns an ISO 8601 timestamp
+                return max(
+                    0.0,
+                    datetime.fromisoformat(reset.replace("Z", "+00:00")).timestamp()
+                    - time.time(),
+                )
+            except ValueError:
+                pass
+        return None
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get limiter counters
+
+        Returns:
+            stats - Amount of requests sent, throttled responses, retries,
+                    seconds spent waiting and the current requests per second
+        """
+        with self._lock:
+            return dict(self._counters, current_rate=self._current_rate)
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """
+    Transport adapter passing every request through a RateLimiter and
+    retrying throttled requests, requests with streamed bodies (such as
+    attachments) are not retried
+
+    Attributes:
+        limiter - Shared rate limiter
+    """
+
+    def __init__(self, limiter: RateLimiter, **kwargs: Any) -> None:
+        self.limiter = limiter
+        super().__init__(**kwargs)
+
+    def send(  # type: ignore[override]
+        self, request: PreparedRequest, **kwargs: Any
+    ) -> Response:
+        attempt = 0
+        retriable = isinstance(request.body, (bytes, str, type(None)))
+        while True:
+            self.limiter.acquire()
+            response = super().send(request, **kwargs)
+            if (
+                response.status_code not in THROTTLED_STATUS_CODES
+                or not retriable
+                or attempt >= MAX_RETRIES
+                # 503 without a requested delay is an outage, not throttling
+                or (
+                    response.status_code == 503
+                    and "Retry-After" not in response.headers
+                )
+            ):
+                self.limiter.observe(response)
+                return response
+            attempt += 1
+            # Following requests are paused by the limiter
+            self.limiter.throttled(response, attempt)
+            response.close()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+
+import threading
+from typing import Any, Dict, Tuple
+
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
+from referencing.jsonschema import Schema
+
+# Validators compiled so far, keyed by the identity of their schema
+_validators: Dict[int, Tuple[Schema, Validator]] = {}
+_validators_lock = threading.Lock()
+
+
+def get_validator(schema: Schema) -> Validator:
+    """
+    Get the validator of a schema, the schema is checked and its validator is
+    built only the first time it is requested
+
+    Schemas are expected to be constants (such as the SCHEMA of a backend),
+    a schema modified after its first use keeps its original validator
+
+    Arguments:
+        schema - JSON schema
+
+    Returns:
+        validator - Validator of the schema
+    """
+    cached = _validators.get(id(schema))
+    if cached and cached[0] is schema:
+        return cached[1]
+    validator_class = validator_for(schema)
+    validator_class.check_schema(schema)  # type: ignore[arg-type]
+    validator = validator_class(schema)
+    with _validators_lock:
+        # The schema is referenced to keep its identity from being reused
+        _validators[id(schema)] = (schema, validator)
+    return validator
+
+
+def validate(instance: Any, schema: Schema) -> None:
+    """
+    Validate an instance against a schema, behaves like jsonschema.validate
+    using the cached validator of the schema
+
+    Arguments:
+        instance - Instance to validate
+        schema   - JSON schema
+
+    Raises:
+        jsonschema.exceptions.ValidationError - The most relevant error if the
+                                                instance is invalid
+    """
+    error = best_match(get_validator(schema).iter_errors(instance))
+    if error is not None:
+        raise error
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+
+import hashlib
+import json
+import threading
+from typing import Dict, Union
+
+from jiav import logger
+from jiav.backend import BaseBackend, Result
+
+jiav_logger = logger.subscribe_to_logger()
+
+
+def step_key(step: BaseBackend) -> str:
+    """
+    Compute the key of a step
+
+    Arguments:
+        step - Backend step
+
+    Returns:
+        key - Hex digest of the backend and arguments of the step
+    """
+    backend = f"{type(step).__module__}.{type(step).__qualname__}"
+    arguments = json.dumps(step.step, sort_keys=True, default=str)
+    return hashlib.sha256(f"{backend}\0{arguments}".encode()).hexdigest()
+
+
+class _Execution:
+    """
+    Execution of a step shared by identical steps
+
+    Attributes:
+        done   - Set once the step was executed
+        result - Result of the step
+        error  - Exception raised by the step
+    """
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Result
+        self.error: Union[Exception, None] = None
+
+
+class StepResults:
+    """
+    Results of the steps executed during a run, identical steps of different
+    manifests are executed once and share their result
+
+    Steps are identical if they are executed by the same backend with the
+    same arguments, steps of backends which are not idempotent are always
+    executed
+    """
+
+    def __init__(self) -> None:
+        self._executions: Dict[str, _Execution] = {}
+        self._lock = threading.Lock()
+
+    def execute(self, step: BaseBackend) -> bool:
+        """
+        Execute a step, waits for an identical step executing in another
+        thread instead of executing the step again
+
+        Arguments:
+            step - Backend step
+
+        Returns:
+            executed - False if the result of an identical step was reused
+        """
+        if not step.IDEMPOTENT:
+            step.execute_backend()
+            return True
+        key = step_key(step)
+        with self._lock:
+            execution = self._executions.get(key)
+            owner = execution is None
+            if execution is None:
+                execution = self._executions[key] = _Execution()
+        if owner:
+            try:
+                step.execute_backend()
+                execution.result = step.result
+            except Exception as e:
+                execution.error = e
+                raise
+            finally:
+                execution.done.set()
+        else:
+            jiav_logger.debug(f"Reusing result of identical '{step.name}' step")
+            execution.done.wait()
+            if execution.error is not None:
+                raise execution.error
+        step.result = execution.result
+        return owner
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Any, Dict, Union
+
+from jiav import logger
+
+jiav_logger = logger.subscribe_to_logger()
+
+
+def get_cache_dir() -> str:
+    """
+    Get the directory used to persist jiav data between runs
+
+    The directory can be overridden using the 'JIAV_CACHE_DIR' environment
+    variable, otherwise '$XDG_CACHE_HOME/jiav' (or '~/.cache/jiav') is used
+
+    Returns:
+        cache_dir - Path of the cache directory
+    """
+    cache_dir = os.environ.get("JIAV_CACHE_DIR") or os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "jiav"
+    )
+    os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+    return cache_dir
+
+
+def fingerprint(*values: str) -> str:
+    """
+    Compute a fingerprint of values without storing the values themselves
+
+    Arguments:
+        values - Values to fingerprint (URLs, credentials, queries)
+
+    Returns:
+        fingerprint - Hex digest of the values
+    """
+    return hashlib.sha256("\0".join(values).encode()).hexdigest()
+
+
+def read_json(name: str) -> Dict[str, Any]:
+    """
+    Read a JSON file from the cache directory
+
+    Arguments:
+        name - File name in the cache directory
+
+    Returns:
+        content - File content, an empty dictionary if the file does not
+                  exist or can not be parsed
+    """
+    try:
+        with open(os.path.join(get_cache_dir(), name)) as f:
+            content = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return content if isinstance(content, dict) else {}
+
+
+def write_json(name: str, content: Dict[str, Any]) -> None:
+    """
+    Atomically write a JSON file to the cache directory
+
+    Arguments:
+        name    - File name in the cache directory
+        content - Content to write
+    """
+    cache_dir = get_cache_dir()
+    try:
+        fd, temp_path = tempfile.mkstemp(dir=cache_dir, prefix=f".{name}.")
+        with os.fdopen(fd, "w") as f:
+            json.dump(content, f)
+        os.replace(temp_path, os.path.join(cache_dir, name))
+    except OSError as e:
+        jiav_logger.warning(f"Failed to write '{name}' to cache: {e}")
+
+
+def get_cached(name: str, key: str, ttl: float) -> Union[Any, None]:
+    """
+    Get a cached value if it did not expire
+
+    Arguments:
+        name - File name in the cache directory
+        key  - Key of the cached value
+        ttl  - Time to live of the cached value in seconds
+
+    Returns:
+        value - Cached value, None if missing or expired
+    """
+    entry = read_json(name).get(key)
+    if not isinstance(entry, dict) or time.time() - entry.get("timestamp", 0) > ttl:
+        return None
+    return entry.get("value")
+
+
+def set_cached(name: str, key: str, value: Any, ttl: float = 0) -> None:
+    """
+    Cache a value
+
+    Arguments:
+        name  - File name in the cache directory
+        key   - Key of the cached value
+        value - Value to cache, must be JSON serializable
+        ttl   - Entries older than ttl seconds are pruned when set,
+                0 disables pruning
+    """
+    now = time.time()
+    content = read_json(name)
+    if ttl:
+        content = {
+            k: v
+            for k, v in content.items()
+            if isinstance(v, dict) and now - v.get("timestamp", 0) <= ttl
+        }
+    content[key] = {"timestamp": now, "value": value}
+    write_json(name, content)
+
+
+def invalidate_cached(name: str, key: str) -> None:
+    """
+    Remove a cached value
+
+    Arguments:
+        name - File name in the cache directory
+        key  - Key of the cached value
+    """
+    content = read_json(name)
+    if content.pop(key, None) is not None:
+        write_json(name, content)
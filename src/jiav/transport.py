@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+
+import base64
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, List, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from jiav import exceptions, logger
+from jiav.ratelimit import RateLimitedAdapter, RateLimiter
+
+jiav_logger = logger.subscribe_to_logger()
+
+# File of a cassette directory containing recorded HTTP exchanges
+CASSETTE_FILE: str = "cassette.jsonl"
+# Methods which modify Jira, acknowledged without being sent when replaying
+WRITE_METHODS: List[str] = ["POST", "PUT", "DELETE", "PATCH"]
+# Response headers which are not recorded
+IGNORED_HEADERS: List[str] = ["set-cookie", "content-encoding", "transfer-encoding"]
+
+
+def _request_key(request: PreparedRequest) -> Tuple[str, str, str]:
+    """
+    Identify a request regardless of the Jira host and of the order of query
+    parameters
+
+    Arguments:
+        request - Prepared HTTP request
+
+    Returns:
+        key - Method, path with sorted query and hash of the body
+    """
+    url = urlsplit(request.url or "")
+    query = urlencode(sorted(parse_qsl(url.query, keep_blank_values=True)))
+    path = f"{url.path}?{query}" if query else url.path
+    body = request.body
+    if isinstance(body, str):
+        body = body.encode()
+    # Streamed bodies (attachments) are not read
+    digest = hashlib.sha256(body).hexdigest() if isinstance(body, bytes) else ""
+    return (request.method or "GET", path, digest)
+
+
+class Cassette:
+    """
+    HTTP exchanges recorded to a directory
+
+    Requests are matched by method, path, query and body, repeated requests
+    are served in the recorded order and the last recorded exchange is
+    repeated once exhausted. Requests with a different body (such as
+    comments containing execution times) fall back to matching by method,
+    path and query
+
+    Attributes:
+        path - Path of the cassette file
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.path = os.path.join(directory, CASSETTE_FILE)
+        self._lock = threading.Lock()
+        self._exchanges: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        self._served: Dict[int, bool] = {}
+
+    def load(self) -> None:
+        """
+        Load recorded exchanges
+        """
+        with self._lock, open(self.path) as f:
+            for line in f:
+                exchange = json.loads(line)
+                method, path, digest = exchange["request"]
+                for key in [(method, path, digest), (method, path)]:
+                    self._exchanges.setdefault(key, []).append(exchange)
+        jiav_logger.debug(f"Loaded recorded exchanges from '{self.path}'")
+
+    def reset(self) -> None:
+        """
+        Start recording to an empty cassette
+        """
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._lock, open(self.path, "w"):
+            pass
+
+    def record(self, request: PreparedRequest, response: Response) -> None:
+        """
+        Record an HTTP exchange
+
+        Arguments:
+            request  - Sent HTTP request
+            response - Received HTTP response
+        """
+        exchange = {
+            "request": list(_request_key(request)),
+            "response": {
+                "status_code": response.status_code,
+                "reason": response.reason,
+                "headers": {
+                    name: value
+                    for name, value in response.headers.items()
+                    if name.lower() not in IGNORED_HEADERS
+                },
+                "content": base64.b64encode(response.content).decode(),
+            },
+        }
+        with self._lock, open(self.path, "a") as f:
+            f.write(json.dumps(exchange) + "\n")
+
+    def _next(self, exchanges: List[Dict[str, Any]]) -> Union[Dict[str, Any], None]:
+        for exchange in exchanges:
+            if not self._served.get(id(exchange)):
+                self._served[id(exchange)] = True
+                return exchange
+        return None
+
+    def play(self, request: PreparedRequest) -> Union[Dict[str, Any], None]:
+        """
+        Find the recorded response of a request
+
+        Arguments:
+            request - HTTP request
+
+        Returns:
+            response - Recorded response, None if the request was not recorded
+        """
+        key = _request_key(request)
+        with self._lock:
+            exchange = self._next(self._exchanges.get(key, []))
+            if not exchange:
+                exchange = self._next(self._exchanges.get(key[:2], []))
+            if not exchange:
+                recorded = self._exchanges.get(key) or self._exchanges.get(key[:2])
+                exchange = recorded[-1] if recorded else None
+        return exchange["response"] if exchange else None
+
+
+def _build_response(
+    request: PreparedRequest, adapter: HTTPAdapter, recorded: Dict[str, Any]
+) -> Response:
+    """
+    Build a response from a recorded response
+    """
+    response = Response()
+    response.status_code = recorded["status_code"]
+    response.reason = recorded["reason"]
+    response.headers = CaseInsensitiveDict(recorded["headers"])
+    response._content = base64.b64decode(recorded["content"])
+    response.encoding = None
+    response.url = request.url or ""
+    response.request = request
+    response.connection = adapter
+    return response
+
+
+class RecordingAdapter(RateLimitedAdapter):
+    """
+    Transport adapter recording every exchange to a cassette
+
+    Attributes:
+        cassette - Cassette recorded to
+    """
+
+    def __init__(self, cassette: Cassette, limiter: RateLimiter, **kwargs: Any):
+        self.cassette = cassette
+        super().__init__(limiter, **kwargs)
+
+    def send(  # type: ignore[override]
+        self, request: PreparedRequest, **kwargs: Any
+    ) -> Response:
+        response = super().send(request, **kwargs)
+        self.cassette.record(request, response)
+        return response
+
+
+class ReplayAdapter(HTTPAdapter):
+    """
+    Transport adapter serving exchanges from a cassette without network
+    access, writes missing from the cassette are acknowledged without being
+    sent
+
+    Attributes:
+        cassette - Cassette replayed from
+    """
+
+    def __init__(self, cassette: Cassette, **kwargs: Any) -> None:
+        self.cassette = cassette
+        super().__init__(**kwargs)
+
+    def send(  # type: ignore[override]
+        self, request: PreparedRequest, **kwargs: Any
+    ) -> Response:
+        recorded = self.cassette.play(request)
+        if recorded is None:
+            if request.method not in WRITE_METHODS:
+                # Not a ConnectionError, those are retried by the jira client
+                raise exceptions.ExchangeNotRecorded(
+                    request.method or "GET", request.url or ""
+                )
+            jiav_logger.debug(f"Acknowledging {request.method} {request.url}")
+            # Uploaded attachments are acknowledged with a list of attachments
+            content = (
+                b"[{}]" if _request_key(request)[1].endswith("/attachments") else b"{}"
+            )
+            recorded = {
+                "status_code": 200,
+                "reason": "OK",
+                "headers": {"Content-Type": "application/json"},
+                "content": base64.b64encode(content).decode(),
+            }
+        return _build_response(request, self, recorded)
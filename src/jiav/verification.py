@@ -1,12 +1,17 @@
 #!/usr/bin/env python
 
 import importlib.metadata
-from typing import List, Tuple, Union
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from logging import LogRecord
+from typing import Callable, Deque, Iterable, Iterator, List, Tuple, Union
 
 from jira import Issue
+from jira.resources import Comment
 
-from jiav import content, exceptions, logger, manifest
+from jiav import content, exceptions, ledger, logger, manifest
 from jiav.jira import JiraConnection
+from jiav.step_results import StepResults
 
 jiav_logger = logger.subscribe_to_logger()
 
@@ -60,12 +65,26 @@ def prepare_jiav_comment(
 
 
 def process_comments(
-    comments: List, allow_public_comments: bool = False
-) -> Tuple[Union[manifest.Manifest, bool], str]:
+    comments: Iterable[Comment], allow_public_comments: bool = False
+) -> Tuple[Union[manifest.Manifest, bool], Union[Comment, str]]:
+    """
+    Looks for the latest comment containing a valid jiav manifest
+
+    Arguments:
+        comments              - Comments ordered from the newest to the
+                                oldest, consumed until a manifest is found
+
+        allow_public_comments - Allow manifest from public comments
+
+    Returns:
+        valid_manifest - jiav manifest, False if not found
+        jiav_comment   - Comment containing the manifest
+    """
     valid_manifest: Union[manifest.Manifest, bool] = False
-    jiav_comment: str = ""
-    # Iterate over comments in reverse order (from latest to oldest)
-    for idx, comment in reversed(list(enumerate(comments))):
+    jiav_comment: Union[Comment, str] = ""
+    # Iterate over comments from latest to oldest
+    for comment in comments:
+        idx = comment.id
         jiav_logger.debug(f"Looking at comment '#{idx}'")
         # Attempt to validate comment according to jiav manifest
         if not allow_public_comments:
@@ -86,19 +105,23 @@ def process_comments(
     return valid_manifest, jiav_comment
 
 
-def verify_issues(
+def verify_issue(
     jira_connection: JiraConnection,
-    issues: List[Issue] = [],
+    issue: Issue,
     upload_attachment: bool = False,
     allow_public_comments: bool = False,
     no_comment_on_failure: bool = False,
     dry_run: bool = False,
-) -> List[Issue]:
+    execution_ledger: Union[ledger.Ledger, None] = None,
+    force: bool = False,
+    manifest_timeout: float = 0,
+    step_results: Union[StepResults, None] = None,
+) -> bool:
     """
-    Attempts to verify issues
+    Attempts to verify an issue
 
     Arguments:
-        issues - List of issues from jiav.utils.jira.discover_valid_issues function
+        issue - Jira issue
 
         jira_connection - Jira connection object defined by
         jiav.utils.jira.JiraConnection
@@ -109,94 +132,279 @@ def verify_issues(
 
         dry_run - Do not update issues
 
-    Returns:
-        verified_issues - List of issues that were successfully verified
+        execution_ledger - Ledger of executed manifests, manifests recorded in
+        the ledger are not executed again
+
+        force - Execute manifests recorded in the ledger before it was opened
+
+        manifest_timeout - Seconds the manifest may execute for, 0 disables
+        the timeout
+
+        step_results - Results of steps executed during the run, reused by
+        identical steps
+
+    Returns True if the issue was successfully verified
     """
-    # Init variables
-    verified_issues: List[Issue] = []
-    # Iterate over issues
-    for issue in issues:
-        jiav_manifest: Union[manifest.Manifest, bool] = False
-        manifest_comment: str = ""
-        desired_status: str = ""
-        jiav_logger.info(f"Looking at issue '{issue}'")
-        jiav_manifest, manifest_comment = process_comments(
-            comments=issue.fields.comment.comments,
-            allow_public_comments=allow_public_comments,
+    jiav_manifest: Union[manifest.Manifest, bool] = False
+    manifest_comment: Union[Comment, str] = ""
+    desired_status: str = ""
+    jiav_logger.info(f"Looking at issue '{issue}'")
+    jiav_manifest, manifest_comment = process_comments(
+        comments=jira_connection.iter_comments(issue),
+        allow_public_comments=allow_public_comments,
+    )
+    # If valid manifest was not provided in comments
+    if not isinstance(jiav_manifest, manifest.Manifest):
+        jiav_logger.error(f"Valid manifest was not found in issue '{issue}'")
+        return False
+    jiav_logger.info(f"Valid manifest was found in issue '{issue}'")
+    # A manifest is executed again only if its comment was edited
+    comment_id: str = str(getattr(manifest_comment, "id", manifest_comment))
+    comment_updated: str = str(getattr(manifest_comment, "updated", ""))
+    if execution_ledger:
+        # Forced manifests are executed once per process, updates of the
+        # issue made by jiav itself do not execute them again
+        outcome = execution_ledger.get_outcome(
+            issue.key,
+            comment_id,
+            comment_updated,
+            since=execution_ledger.opened_at if force else 0,
         )
-        # If valid manifest was provided in comments
-        if isinstance(jiav_manifest, manifest.Manifest):
-            jiav_logger.info(f"Valid manifest was found in issue '{issue}'")
-            desired_status = jiav_manifest.verified_status
-            current_status: str = issue.fields.status.name
-            # If issue is already in the desired status, we skip it
-            if desired_status == current_status:
-                jiav_logger.info(
-                    " ".join(
-                        [
-                            f"Issue '{issue}' is already in the",
-                            f"desired status '{desired_status}'",
-                        ]
-                    )
+        if outcome is not None:
+            jiav_logger.info(
+                " ".join(
+                    [
+                        f"Manifest in comment '{comment_id}' was already executed",
+                        f"{'successfully' if outcome else 'unsuccessfully'},",
+                        f"skipping issue '{issue}'",
+                    ]
                 )
-                break
-            transition_id = jira_connection.check_if_status_is_valid(
-                issue=issue, desired_status=desired_status
             )
-            if not transition_id:
+            return False
+    desired_status = jiav_manifest.verified_status
+    current_status: str = issue.fields.status.name
+    # If issue is already in the desired status, we skip it
+    if desired_status == current_status:
+        jiav_logger.info(
+            " ".join(
+                [
+                    f"Issue '{issue}' is already in the",
+                    f"desired status '{desired_status}'",
+                ]
+            )
+        )
+        return False
+    transition_id = jira_connection.check_if_status_is_valid(
+        issue=issue, desired_status=desired_status
+    )
+    if not transition_id:
+        jiav_logger.error(
+            " ".join(
+                [
+                    f"Desired status '{desired_status}' is not valid in",
+                    "this instance or it can not be",
+                    "trasnsitioned from current status",
+                    f"'{current_status}'",
+                ]
+            )
+        )
+        return False
+    # Execute according to jiav request
+    try:
+        jiav_manifest.execute_manifest(
+            timeout=manifest_timeout,
+            step_results=step_results,
+            step_stats=execution_ledger,
+        )
+    except exceptions.BackendExecutionFailed as e:
+        jiav_logger.exception(e)
+    # Output is missing if the manifest failed to execute
+    execution_output: Union[content.OutputSink, None] = getattr(
+        jiav_manifest, "execution_output", None
+    )
+    try:
+        if dry_run:
+            return False
+        comment = prepare_jiav_comment(
+            successful=jiav_manifest.successful,
+            status=jiav_manifest.verified_status,
+            manifest_comment=str(manifest_comment),
+            upload_attachment=upload_attachment,
+        )
+        # Post comment with the execution when applicable
+        if not no_comment_on_failure or jiav_manifest.successful:
+            jira_connection.post_comment(issue=issue, comment=comment)
+
+        # Add attachment if requested by user
+        if upload_attachment:
+            # Upload the spooled jiav manifest execution output
+            if execution_output is None:
                 jiav_logger.error(
                     " ".join(
                         [
-                            f"Desired status '{desired_status}' is not valid in",
-                            "this instance or it can not be",
-                            "trasnsitioned from current status",
-                            f"'{current_status}'",
+                            "Failed to create attachment, no execution",
+                            "output in manifest execution",
                         ]
                     )
                 )
-                break
-            # Execute according to jiav request
-            try:
-                jiav_manifest.execute_manifest()
-            except exceptions.BackendExecutionFailed as e:
-                jiav_logger.exception(e)
-            if not dry_run:
-                comment = prepare_jiav_comment(
-                    successful=jiav_manifest.successful,
-                    status=jiav_manifest.verified_status,
-                    manifest_comment=manifest_comment,
-                    upload_attachment=upload_attachment,
+            else:
+                jira_connection.upload_attachment(
+                    issue=issue,
+                    attachment=execution_output.file(),
+                    filename=f"jiav_{content.get_current_timestamp()}.txt",
                 )
-                # Post comment with the execution when applicable
-                if not no_comment_on_failure or jiav_manifest.successful:
-                    jira_connection.post_comment(issue=issue, comment=comment)
-
-                # Add attachment if requested by user
-                if upload_attachment:
-                    # Generate tempfile with the jiav manifest execution output
-                    try:
-                        temp_file = content.write_content_to_tempfile(
-                            jiav_manifest.execution_output
-                        )
-                        jira_connection.upload_attachment(
-                            issue=issue, file_path=temp_file.name
-                        )
-                    except AttributeError:
-                        jiav_logger.error(
-                            " ".join(
-                                [
-                                    "Failed to create attachment, no execution",
-                                    "output in manifest execution",
-                                ]
-                            )
-                        )
-
-                # If manifest executed successfully
-                if jiav_manifest.successful:
-                    jira_connection.update_issue_status(
-                        issue=issue, transition_id=transition_id
-                    )
-                    verified_issues.append(issue)
-        else:
-            jiav_logger.error(f"Valid manifest was not found in issue '{issue}'")
+
+        # If manifest executed successfully
+        if jiav_manifest.successful:
+            jira_connection.update_issue_status(
+                issue=issue, transition_id=transition_id
+            )
+        # Record the manifest only once the issue was updated, a manifest is
+        # executed again if any of the updates failed
+        if execution_ledger:
+            execution_ledger.record(
+                issue.key, comment_id, comment_updated, jiav_manifest.successful
+            )
+        return jiav_manifest.successful
+    finally:
+        if execution_output is not None:
+            execution_output.close()
+
+
+def _verify_issue_buffered(
+    verify: Callable[[Issue], bool], issue: Issue
+) -> Tuple[bool, List[LogRecord], Union[Exception, None]]:
+    """
+    Verifies an issue while buffering its log records
+
+    Arguments:
+        verify - Function verifying a single issue
+        issue  - Jira issue
+
+    Returns:
+        verified - Whether the issue was verified
+        records  - Log records emitted during verification
+        error    - Exception raised during verification
+    """
+    with logger.buffer_records() as records:
+        try:
+            return verify(issue), records, None
+        except Exception as e:
+            return False, records, e
+
+
+def _verify_issues_concurrently(
+    verify: Callable[[Issue], bool], issues: Iterable[Issue], workers: int
+) -> Iterator[Tuple[Issue, bool]]:
+    """
+    Verifies issues using a bounded pool of workers
+
+    Results and log records are emitted in the order of the issues,
+    regardless of the order in which workers complete
+
+    Arguments:
+        verify  - Function verifying a single issue
+        issues  - Jira issues
+        workers - Amount of issues to verify concurrently
+
+    Returns:
+        results - Iterator over issues and whether they were verified
+    """
+    pending: Deque[
+        Tuple[Issue, Future[Tuple[bool, List[LogRecord], Union[Exception, None]]]]
+    ] = deque()
+
+    def collect() -> Tuple[Issue, bool]:
+        issue, future = pending.popleft()
+        verified, records, error = future.result()
+        logger.replay_records(records)
+        if error:
+            raise error
+        return issue, verified
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        try:
+            for issue in issues:
+                pending.append(
+                    (issue, executor.submit(_verify_issue_buffered, verify, issue))
+                )
+                # Bound the amount of issues held in memory
+                if len(pending) >= workers * 2:
+                    yield collect()
+            while pending:
+                yield collect()
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+
+def verify_issues(
+    jira_connection: JiraConnection,
+    issues: Iterable[Issue] = [],
+    upload_attachment: bool = False,
+    allow_public_comments: bool = False,
+    no_comment_on_failure: bool = False,
+    dry_run: bool = False,
+    workers: int = 1,
+    execution_ledger: Union[ledger.Ledger, None] = None,
+    force: bool = False,
+    manifest_timeout: float = 0,
+) -> List[Issue]:
+    """
+    Attempts to verify issues
+
+    Arguments:
+        issues - Issues from jiav.jira.JiraConnection.fetch_issues, issues are
+                 verified as they are received
+
+        jira_connection - Jira connection object defined by
+        jiav.utils.jira.JiraConnection
+
+        upload_attacment - Upload attachment if requested
+
+        public_comment_allowed - Allow manifest from public comments
+
+        dry_run - Do not update issues
+
+        workers - Amount of issues to verify concurrently
+
+        execution_ledger - Ledger of executed manifests, manifests recorded in
+        the ledger are not executed again
+
+        force - Execute manifests recorded in the ledger before it was opened
+
+        manifest_timeout - Seconds each manifest may execute for, 0 disables
+        the timeout
+
+    Returns:
+        verified_issues - List of issues that were successfully verified
+    """
+    # Init variables
+    verified_issues: List[Issue] = []
+    # Identical steps of different manifests are executed once per run
+    step_results = StepResults()
+
+    def verify(issue: Issue) -> bool:
+        return verify_issue(
+            jira_connection=jira_connection,
+            issue=issue,
+            upload_attachment=upload_attachment,
+            allow_public_comments=allow_public_comments,
+            no_comment_on_failure=no_comment_on_failure,
+            dry_run=dry_run,
+            execution_ledger=execution_ledger,
+            force=force,
+            manifest_timeout=manifest_timeout,
+            step_results=step_results,
+        )
+
+    results: Iterable[Tuple[Issue, bool]] = (
+        ((issue, verify(issue)) for issue in issues)
+        if workers <= 1
+        else _verify_issues_concurrently(verify, issues, workers)
+    )
+    # Iterate over issues
+    for issue, verified in results:
+        if verified:
+            verified_issues.append(issue)
     return verified_issues
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Union
+
+import requests
+from jira import Issue, JIRAError
+
+from jiav import exceptions
+from jiav import incremental as checkpoints
+from jiav import logger
+from jiav.jira import JQL_PAGE_SIZE, JiraConnection
+
+jiav_logger = logger.subscribe_to_logger()
+
+# Default seconds between polls of the query
+WATCH_INTERVAL: int = 300
+# Errors which do not stop a long running process, retried later
+TRANSIENT_EXCEPTIONS = (
+    exceptions.JQLError,
+    exceptions.InvalidKeyInJQL,
+    exceptions.JiraUnhandledException,
+    JIRAError,
+    requests.exceptions.RequestException,
+)
+
+
+def write_heartbeat(path: str, heartbeat: Dict[str, Any]) -> None:
+    """
+    Atomically write a heartbeat file, allows supervisors to detect a stuck
+    or dead watcher
+
+    Arguments:
+        path      - Path of the heartbeat file
+        heartbeat - Heartbeat content
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    try:
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".jiav_heartbeat_")
+        with os.fdopen(fd, "w") as f:
+            json.dump(heartbeat, f)
+        os.replace(temp_path, path)
+    except OSError as e:
+        jiav_logger.warning(f"Failed to write heartbeat file '{path}': {e}")
+
+
+def watch_query(
+    jira_connection: JiraConnection,
+    query: str,
+    verify: Callable[[Iterable[Issue]], List[Issue]],
+    stop: threading.Event,
+    interval: float = WATCH_INTERVAL,
+    page_size: int = JQL_PAGE_SIZE,
+    heartbeat_file: Union[str, None] = None,
+    persist_checkpoint: bool = True,
+    on_verified: Union[Callable[[List[Issue]], None], None] = None,
+) -> None:
+    """
+    Polls a query until stopped, verifying issues updated since the previous
+    successful poll
+
+    Arguments:
+        jira_connection    - Jira connection object defined by
+                             jiav.jira.JiraConnection
+        query              - Jira Query Language query
+        verify             - Function verifying issues, returns verified issues
+        stop               - Event stopping the watcher
+        interval           - Seconds between polls
+        page_size          - Amount of issues to fetch per page
+        heartbeat_file     - Path of a heartbeat file updated every poll
+        persist_checkpoint - Persist the checkpoint of the query, shared with
+                             'jiav verify --incremental'
+        on_verified        - Function called with issues verified by a poll
+    """
+    url = jira_connection.url
+    checkpoint = checkpoints.get_checkpoint(url, query)
+    heartbeat: Dict[str, Any] = {
+        "pid": os.getpid(),
+        "query": query,
+        "status": "running",
+        "polls": 0,
+        "failed_polls": 0,
+        "verified_issues": 0,
+    }
+    jiav_logger.info(f"Watching query '{query}' every {interval} seconds")
+    while not stop.is_set():
+        poll_started = time.time()
+        jql = (
+            checkpoints.build_query(query, checkpoint, poll_started)
+            if checkpoint
+            else query
+        )
+        heartbeat["polls"] += 1
+        try:
+            issues = jira_connection.fetch_issues(
+                issues=[], jql=jql, page_size=page_size
+            )
+            verified_issues = verify(issues)
+        except (exceptions.JQLReturnedNothing, exceptions.NoIssuesFound):
+            jiav_logger.debug("No issues were updated since last poll")
+            verified_issues = []
+        except TRANSIENT_EXCEPTIONS as e:
+            jiav_logger.exception(e)
+            jiav_logger.error("Poll failed, retrying on next poll")
+            heartbeat["failed_polls"] += 1
+            verified_issues = None
+        # Unexpected errors do not stop the watch either, so a single issue
+        # can not break it for all other issues
+        except Exception as e:
+            jiav_logger.exception(e)
+            jiav_logger.error("Poll failed unexpectedly, retrying on next poll")
+            heartbeat["failed_polls"] += 1
+            verified_issues = None
+        if verified_issues is not None:
+            checkpoint = poll_started
+            if persist_checkpoint:
+                checkpoints.set_checkpoint(url, query, checkpoint)
+            if verified_issues:
+                heartbeat["verified_issues"] += len(verified_issues)
+                if on_verified:
+                    on_verified(verified_issues)
+        heartbeat.update(
+            {
+                "timestamp": time.time(),
+                "last_poll_started": poll_started,
+                "last_poll_duration": time.time() - poll_started,
+                "requests": jira_connection.rate_limiter.stats(),
+            }
+        )
+        if heartbeat_file:
+            write_heartbeat(heartbeat_file, heartbeat)
+        stop.wait(interval)
+    jiav_logger.info("Stopped watching query")
+    heartbeat.update({"status": "stopped", "timestamp": time.time()})
+    if heartbeat_file:
+        write_heartbeat(heartbeat_file, heartbeat)
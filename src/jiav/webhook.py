@@ -0,0 +1,253 @@
+#!/usr/bin/env python
+
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, List, Set, Tuple, Union
+
+from jira import Issue
+
+from jiav import exceptions, logger
+from jiav.jira import JiraConnection
+from jiav.watch import TRANSIENT_EXCEPTIONS
+
+jiav_logger = logger.subscribe_to_logger()
+
+# Webhook events which may add or change a manifest
+WEBHOOK_EVENTS: List[str] = ["comment_created", "comment_updated"]
+# Default seconds to wait for more events of an issue before verifying it
+WEBHOOK_DEBOUNCE: float = 5
+# Largest accepted webhook payload
+WEBHOOK_MAX_PAYLOAD: int = 10 * 1024 * 1024
+
+COMMENT_URL_REGEX = re.compile(r"/issue/([^/]+)/comment/")
+
+
+def get_issue_from_payload(payload: Dict[str, Any]) -> Union[str, None]:
+    """
+    Get the issue affected by a webhook event
+
+    Arguments:
+        payload - Webhook payload
+
+    Returns:
+        issue - Jira issue key (or ID if the payload lacks the issue), None if
+                the event does not affect manifests
+    """
+    if payload.get("webhookEvent") not in WEBHOOK_EVENTS:
+        return None
+    issue = payload.get("issue")
+    if isinstance(issue, dict) and issue.get("key"):
+        return str(issue["key"])
+    # Some Jira versions only include the comment in the payload
+    comment = payload.get("comment")
+    if isinstance(comment, dict):
+        match = COMMENT_URL_REGEX.search(str(comment.get("self", "")))
+        if match:
+            return match.group(1)
+    return None
+
+
+class IssueQueue:
+    """
+    Queue of issues to verify
+
+    An issue is released once no event arrived for it during the debounce
+    period, a burst of events results in a single verification. An issue is
+    not released again until its verification is done
+
+    Attributes:
+        debounce - Seconds to wait for more events of an issue
+    """
+
+    def __init__(self, debounce: float = WEBHOOK_DEBOUNCE) -> None:
+        self.debounce = debounce
+        self._pending: Dict[str, float] = {}
+        self._active: Set[str] = set()
+        self._condition = threading.Condition()
+
+    def put(self, issue: str) -> None:
+        """
+        Queue an issue, postpones an already queued issue
+
+        Arguments:
+            issue - Jira issue key
+        """
+        with self._condition:
+            self._pending[issue] = time.monotonic() + self.debounce
+            self._condition.notify()
+
+    def get(self, timeout: float) -> Union[str, None]:
+        """
+        Get the next issue to verify
+
+        Arguments:
+            timeout - Seconds to wait for an issue
+
+        Returns:
+            issue - Jira issue key, None if no issue was released in time
+        """
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                wait = deadline - now
+                releasable = [
+                    (ready_at, issue)
+                    for issue, ready_at in self._pending.items()
+                    if issue not in self._active
+                ]
+                if releasable:
+                    ready_at, issue = min(releasable)
+                    if ready_at <= now:
+                        del self._pending[issue]
+                        self._active.add(issue)
+                        return issue
+                    wait = min(ready_at - now, wait)
+                if wait <= 0:
+                    return None
+                self._condition.wait(wait)
+
+    def done(self, issue: str) -> None:
+        """
+        Mark the verification of an issue as done
+
+        Arguments:
+            issue - Jira issue key
+        """
+        with self._condition:
+            self._active.discard(issue)
+            self._condition.notify_all()
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._pending)
+
+
+class WebhookHandler(BaseHTTPRequestHandler):
+    """
+    Handles webhooks sent by Jira
+    """
+
+    server: "WebhookServer"
+
+    def do_POST(self) -> None:
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            length = -1
+        if length < 0 or length > WEBHOOK_MAX_PAYLOAD:
+            self.send_error(413)
+            return
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self.send_error(400, "Payload is not valid JSON")
+            return
+        issue = get_issue_from_payload(payload) if isinstance(payload, dict) else None
+        if issue:
+            jiav_logger.debug(
+                f"Received '{payload.get('webhookEvent')}' event of issue '{issue}'"
+            )
+            self.server.issue_queue.put(issue)
+            self.send_response(202)
+        else:
+            self.send_response(204)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        jiav_logger.debug(f"{self.address_string()} - {format % args}")
+
+
+class WebhookServer(ThreadingHTTPServer):
+    """
+    HTTP server receiving webhooks sent by Jira
+
+    Attributes:
+        issue_queue - Queue of issues affected by received events
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], issue_queue: IssueQueue) -> None:
+        self.issue_queue = issue_queue
+        super().__init__(address, WebhookHandler)
+
+
+def serve(
+    jira_connection: JiraConnection,
+    verify: Callable[[Iterable[Issue]], List[Issue]],
+    stop: threading.Event,
+    host: str = "127.0.0.1",
+    port: int = 8080,
+    debounce: float = WEBHOOK_DEBOUNCE,
+    workers: int = 1,
+    on_verified: Union[Callable[[List[Issue]], None], None] = None,
+    on_listening: Union[Callable[[WebhookServer], None], None] = None,
+) -> None:
+    """
+    Receives webhooks until stopped, verifying issues affected by events
+
+    Arguments:
+        jira_connection - Jira connection object defined by
+                          jiav.jira.JiraConnection
+        verify          - Function verifying issues, returns verified issues
+        stop            - Event stopping the server
+        host            - Address to listen on
+        port            - Port to listen on, 0 picks a free port
+        debounce        - Seconds to wait for more events of an issue
+        workers         - Amount of issues to verify concurrently
+        on_verified     - Function called with verified issues
+        on_listening    - Function called once the server is listening
+    """
+    issue_queue = IssueQueue(debounce=debounce)
+    server = WebhookServer((host, port), issue_queue)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    jiav_logger.info(f"Listening for webhooks on {host}:{server.server_port}")
+
+    def _verify_queued_issues() -> None:
+        while not stop.is_set():
+            issue = issue_queue.get(timeout=1)
+            if not issue:
+                continue
+            try:
+                issues = jira_connection.fetch_issues(issues=[issue], jql="")
+                verified_issues = verify(issues)
+                if verified_issues and on_verified:
+                    on_verified(verified_issues)
+            except exceptions.NoIssuesFound:
+                jiav_logger.warning(f"Issue '{issue}' was not found")
+            except TRANSIENT_EXCEPTIONS as e:
+                jiav_logger.exception(e)
+                jiav_logger.error(f"Failed to verify issue '{issue}'")
+            # Any other error would stop the consumer for the rest of the run
+            except Exception as e:
+                jiav_logger.error(
+                    f"Unexpected error while verifying issue '{issue}': {e}",
+                    exc_info=True,
+                )
+            finally:
+                issue_queue.done(issue)
+
+    consumers = [
+        threading.Thread(target=_verify_queued_issues, daemon=True)
+        for _ in range(workers)
+    ]
+    for consumer in consumers:
+        consumer.start()
+    if on_listening:
+        on_listening(server)
+    try:
+        while not stop.wait(1):
+            pass
+    finally:
+        stop.set()
+        server.shutdown()
+        server.server_close()
+        # Let running verifications finish
+        for consumer in consumers:
+            consumer.join()
+        jiav_logger.info("Stopped listening for webhooks")
@@ -23,6 +23,10 @@ class JiraIssueBackend(BaseBackend):
         step   - Backend excution instructions
     """
 
+    ISSUE_FIELDS = ["status"]
+    # Issues are transitioned by jiav during the run, their status is checked
+    # every time a step is executed
+    IDEMPOTENT = False
     MOCK_STEP = {"issue": "TEST-1", "status": "Done"}
     SCHEMA = {
         "type": "object",
@@ -51,13 +55,15 @@ class JiraIssueBackend(BaseBackend):
         errors: List = []
         successful: bool = False
         # Reusing the original JiraConnection object since the class is a singleton
-        jira_connection: JiraConnection = JiraConnection()  # type: ignore
+        jira_connection: JiraConnection = JiraConnection()
         remote_issue: Union[Issue, None] = None
         remote_issue_status: str = ""
         jiav_logger.debug(f"Issue: {issue}")
         jiav_logger.debug(f"Status: {issue_status}")
         try:
-            remote_issue = jira_connection.jira.issue(id=issue)
+            remote_issue = jira_connection.jira.issue(
+                id=issue, fields=",".join(self.ISSUE_FIELDS)
+            )
             remote_issue_status = str(remote_issue.get_field("status"))
             if remote_issue_status != issue_status:
                 jiav_logger.error(
@@ -69,9 +75,11 @@ class JiraIssueBackend(BaseBackend):
                     )
                 )
                 errors.append(
-                    (
-                        f"Issue '{issue}' status '{remote_issue_status}' does",
-                        f"not match the desired status '{issue_status}'",
+                    " ".join(
+                        [
+                            f"Issue '{issue}' status '{remote_issue_status}' does",
+                            f"not match the desired status '{issue_status}'",
+                        ]
                     )
                 )
             else:
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 
 import os
-from typing import List
+from typing import List, Union
 
 from jiav import logger
 from jiav.backend import BaseBackend, Result
@@ -27,9 +27,16 @@ class LineInFileBackend(BaseBackend):
     SCHEMA = {
         "type": "object",
         "required": ["path", "line"],
-        "properties": {"path": {"type": "string"}, "line": {"type": "string"}},
+        "properties": {
+            "path": {"type": "string"},
+            "line": {"type": "string"},
+            "encoding": {"type": "string"},
+        },
         "additionalProperties": False,
     }
+    # Bytes of the file read at once
+    CHUNK_SIZE: int = 1024 * 1024
+    ENCODING: str = "utf-8"
 
     def __init__(self) -> None:
         self.name = "lineinfile"
@@ -37,6 +44,86 @@ class LineInFileBackend(BaseBackend):
         self.step = self.MOCK_STEP
         super().__init__(name=self.name, schema=self.schema, step=self.step)
 
+    def encode_line(self, line: str, encoding: str) -> Union[bytes, None]:
+        """
+        Encodes line to look for it in the bytes of a file
+
+        Lines spanning several lines of the file may be separated by any
+        newline convention, and encodings which do not encode newlines as a
+        single byte (such as UTF-16) may match in the middle of a character,
+        those can only be looked for in the decoded file
+
+        Arguments:
+            line     - Line to look for
+            encoding - Encoding of the file
+
+        Returns:
+            content - Encoded line without a byte order mark, None if the
+                      line must be looked for in the decoded file
+        """
+        if "\n" in line or "\r" in line:
+            return None
+        # Some encodings prepend a byte order mark to the encoded text
+        bom = "".encode(encoding)
+        if "\n".encode(encoding)[len(bom) :] != b"\n":
+            return None
+        return line.encode(encoding)[len(bom) :]
+
+    def file_contains(self, file: str, content: bytes) -> bool:
+        """
+        Checks if file contains content, the file is read in chunks
+        overlapping by the length of content so memory usage is bounded
+
+        Arguments:
+            file    - Path of the file
+            content - Encoded content to look for
+
+        Returns True if content is in file
+        """
+        if not content:
+            return True
+        overlap = len(content) - 1
+        previous_chunk = b""
+        with open(file, "rb") as f:
+            while True:
+                chunk = f.read(self.CHUNK_SIZE)
+                if not chunk:
+                    return False
+                window = previous_chunk + chunk
+                if content in window:
+                    return True
+                # Keep the end of the window in case content spans chunks
+                previous_chunk = window[-overlap:] if overlap else b""
+
+    def decoded_file_contains(self, file: str, content: str, encoding: str) -> bool:
+        """
+        Checks if the decoded file contains content, newlines of the file are
+        normalized regardless of the platform that wrote it, the file is read
+        in chunks overlapping by the length of content so memory usage is
+        bounded
+
+        Arguments:
+            file     - Path of the file
+            content  - Content to look for
+            encoding - Encoding of the file
+
+        Returns True if content is in file
+        """
+        if not content:
+            return True
+        overlap = len(content) - 1
+        previous_chunk = ""
+        with open(file, encoding=encoding) as f:
+            while True:
+                chunk = f.read(self.CHUNK_SIZE)
+                if not chunk:
+                    return False
+                window = previous_chunk + chunk
+                if content in window:
+                    return True
+                # Keep the end of the window in case content spans chunks
+                previous_chunk = window[-overlap:] if overlap else ""
+
     # Overrdie method of BaseBackend
     def execute_backend(self) -> None:
         """
@@ -47,6 +134,7 @@ class LineInFileBackend(BaseBackend):
         # Parse required arugments
         file: str = self.step["path"]
         line: str = self.step["line"]
+        encoding: str = self.step.get("encoding", self.ENCODING)
         output: List[str] = []
         errors: List[str] = []
         successful = False
@@ -58,17 +146,18 @@ class LineInFileBackend(BaseBackend):
             jiav_logger.error(f"File '{file}' does not exist")
         else:
             try:
-                with open(file) as f:
-                    file_content = f.read()
-                    if line not in file_content:
-                        errors.append(f"Line '{line}' is not present in file '{file}'")
-                        jiav_logger.error(
-                            f"Line '{line}' is not present in file '{file}'"
-                        )
-                    else:
-                        successful = True
-                        output.append(f"Line '{line}' found in '{file}'")
-                        jiav_logger.debug(f"Line '{line}' found in '{file}'")
+                content = self.encode_line(line, encoding)
+                if content is not None:
+                    found = self.file_contains(file, content)
+                else:
+                    found = self.decoded_file_contains(file, line, encoding)
+                if not found:
+                    errors.append(f"Line '{line}' is not present in file '{file}'")
+                    jiav_logger.error(f"Line '{line}' is not present in file '{file}'")
+                else:
+                    successful = True
+                    output.append(f"Line '{line}' found in '{file}'")
+                    jiav_logger.debug(f"Line '{line}' found in '{file}'")
             except Exception as e:
                 errors.append(f"OS exception: {str(e)}")
         self.result = Result(successful, output, errors)
@@ -1,7 +1,9 @@
 #!/usr/bin/env python
 
+import mmap
 import os
 import re
+from typing import Union
 
 from jiav import logger
 from jiav.backend import BaseBackend, Result
@@ -10,9 +12,23 @@ MOCK_STEP = {"path": "/path/to/file", "regex": r"^.*$"}
 SCHEMA = {
     "type": "object",
     "required": ["path", "regex"],
-    "properties": {"path": {"type": "string"}, "regex": {"type": "string"}},
+    "properties": {
+        "path": {"type": "string"},
+        "regex": {"type": "string"},
+        "mmap": {"type": "boolean"},
+        "flags": {
+            "type": "array",
+            "items": {"enum": ["MULTILINE", "IGNORECASE", "DOTALL"]},
+        },
+    },
     "additionalProperties": False,
 }
+# Flags which can be supplied to the regex
+FLAGS = {
+    "MULTILINE": re.MULTILINE,
+    "IGNORECASE": re.IGNORECASE,
+    "DOTALL": re.DOTALL,
+}
 
 # Subscribe to logger
 jiav_logger = logger.subscribe_to_logger()
@@ -37,6 +53,24 @@ class RegexInFileBackend(BaseBackend):
         self.step = MOCK_STEP
         super().__init__(name=self.name, schema=self.schema, step=self.step)
 
+    def file_matches(self, file: str, regex: "re.Pattern[bytes]") -> bool:
+        """
+        Checks if a memory-mapped file matches a bytes regex, the file is not
+        read into memory nor decoded
+
+        Arguments:
+            file  - Path of the file
+            regex - Compiled bytes regex
+
+        Returns True if regex is in file
+        """
+        with open(file, "rb") as f:
+            # Empty files can not be mapped
+            if os.fstat(f.fileno()).st_size == 0:
+                return regex.search(b"") is not None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                return regex.search(mapped_file) is not None
+
     # Override method of BaseBackend
     def execute_backend(self) -> None:
         """
@@ -50,24 +84,33 @@ class RegexInFileBackend(BaseBackend):
         output = list()
         errors = list()
         successful = False
-        compiled_regex = re.compile(rf"{regex}")
+        flags = 0
+        for flag in self.step.get("flags", []):
+            flags |= FLAGS[flag]
+        use_mmap: bool = self.step.get("mmap", False)
+        compiled_regex: Union["re.Pattern[str]", "re.Pattern[bytes]"] = (
+            re.compile(regex.encode(), flags)
+            if use_mmap
+            else re.compile(rf"{regex}", flags)
+        )
         if not os.path.exists(file):
             errors.append(f"File {file} does not exist")
         else:
             try:
-                with open(file) as f:
-                    file_content = f.read()
-                    if not compiled_regex.search(file_content):
-                        errors.append(
-                            f"Regex '{regex}' is not present in file '{file}'"
-                        )
-                        jiav_logger.error(
-                            f"Regex '{regex}' is not present in file '{file}'"
-                        )
-                    else:
-                        successful = True
-                        output.append(f"Regex '{regex}' found in '{file}'")
-                        jiav_logger.debug(f"Regex '{regex}' found in '{file}'")
+                if isinstance(compiled_regex.pattern, bytes):
+                    found = self.file_matches(file, compiled_regex)
+                else:
+                    with open(file) as f:
+                        found = bool(compiled_regex.search(f.read()))
+                if not found:
+                    errors.append(f"Regex '{regex}' is not present in file '{file}'")
+                    jiav_logger.error(
+                        f"Regex '{regex}' is not present in file '{file}'"
+                    )
+                else:
+                    successful = True
+                    output.append(f"Regex '{regex}' found in '{file}'")
+                    jiav_logger.debug(f"Regex '{regex}' found in '{file}'")
             except Exception as e:
                 errors.append(f"OS exception: {str(e)}")
         self.result = Result(successful, output, errors)
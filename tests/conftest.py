@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+
+from typing import Any, Iterator
+
+import pytest
+
+from jiav.jira import JiraConnection
+from tests.fake_jira import MANIFEST, FakeJira
+
+
+@pytest.fixture
+def fake_jira(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch, tmp_path: Any
+) -> Iterator[FakeJira]:
+    """
+    Fake Jira server serving issues with a manifest that verifies
+    successfully, arguments of FakeJira (such as 'issues' or
+    'deployment_type') are provided by indirect parametrization
+    """
+    verified_file = tmp_path / "verified.txt"
+    verified_file.write_text("jiav\n")
+    monkeypatch.setenv("JIAV_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(JiraConnection, "_instance", None)
+    fake_jira = FakeJira(
+        manifest=MANIFEST.format(path=verified_file),
+        **getattr(request, "param", {}),
+    ).start()
+    yield fake_jira
+    fake_jira.stop()
+
+
+@pytest.fixture
+def connection(fake_jira: FakeJira) -> JiraConnection:
+    return JiraConnection(
+        fake_jira.url,
+        username="bench" if fake_jira.deployment_type == "Cloud" else "",
+        access_token="token",
+    )
@@ -0,0 +1,286 @@
+#!/usr/bin/env python
+
+import json
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+
+API = "/rest/api/2"
+# Manifest verified by checking the file at {path} contains 'jiav'
+MANIFEST = """jiav:
+  verified_status: Done
+  verification_steps:
+    - name: Check for line
+      backend: lineinfile
+      path: {path}
+      line: jiav
+"""
+DONE_TRANSITION: Dict[str, Any] = {
+    "id": "31",
+    "name": "Done",
+    "to": {"id": "3", "name": "Done"},
+}
+KEY_IN_REGEX = re.compile(r"key\s+in\s+\(([^)]*)\)", re.IGNORECASE)
+ISSUE_PATH_REGEX = re.compile(
+    rf"^{API}/issue/([^/]+)(?:/(comment|transitions|attachments))?$"
+)
+
+
+class FakeJira:
+    """
+    In-process fake of the Jira REST API, serves issues containing a jiav
+    manifest in their oldest (private) comment
+
+    Attributes:
+        manifest        - Manifest posted in the oldest comment of every issue
+        deployment_type - 'Server' or 'Cloud'
+        latency         - Seconds added to every response
+        calls           - Amount of requests per method and endpoint
+        errors          - HTTP status codes to respond with per method and
+                          endpoint
+    """
+
+    def __init__(
+        self,
+        manifest: str,
+        issues: int = 10,
+        comments: int = 1,
+        comment_size: int = 100,
+        latency: float = 0,
+        deployment_type: str = "Server",
+    ) -> None:
+        self.manifest = manifest
+        self.deployment_type = deployment_type
+        self.latency = latency
+        self.calls: Counter = Counter()
+        self.errors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._comment_id = 0
+        self.issues: Dict[str, Dict[str, Any]] = {}
+        self.comments: Dict[str, List[Dict[str, Any]]] = {}
+        for number in range(1, issues + 1):
+            key = f"BENCH-{number}"
+            self.issues[key] = {
+                "id": str(10000 + number),
+                "key": key,
+                "fields": {
+                    "summary": f"Benchmark issue {number}",
+                    "status": {"id": "1", "name": "To Do"},
+                    "assignee": None,
+                    "reporter": {"name": "bench", "displayName": "Bench"},
+                    "project": {"id": "1", "key": "BENCH", "name": "Bench"},
+                    "issuetype": {"id": "1", "name": "Task"},
+                },
+            }
+            self.comments[key] = [self._comment(key, self.manifest, private=True)]
+            for _ in range(comments - 1):
+                self.comments[key].append(self._comment(key, "x" * comment_size))
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def start(self) -> "FakeJira":
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _comment(self, key: str, body: str, private: bool = False) -> Dict[str, Any]:
+        with self._lock:
+            self._comment_id += 1
+            comment_id = str(self._comment_id)
+        timestamp = f"2024-01-01T00:00:{int(comment_id) % 60:02d}.000+0000"
+        comment: Dict[str, Any] = {
+            "id": comment_id,
+            "self": f"{API}/issue/{key}/comment/{comment_id}",
+            "author": {"name": "bench", "displayName": "Bench"},
+            "body": body,
+            "created": timestamp,
+            "updated": timestamp,
+        }
+        if private:
+            comment["visibility"] = {"type": "role", "value": "Developers"}
+        return comment
+
+    def _search(self, query: Dict[str, List[str]]) -> Tuple[int, Dict[str, Any]]:
+        jql = query.get("jql", [""])[0]
+        start_at = int(query.get("startAt", ["0"])[0])
+        max_results = int(query.get("maxResults", ["50"])[0])
+        keys = KEY_IN_REGEX.search(jql)
+        if keys:
+            requested = [key.strip().strip("\"'") for key in keys.group(1).split(",")]
+            # Jira fails the entire query when one of the keys is invalid
+            for key in requested:
+                if key not in self.issues:
+                    return 400, {
+                        "errorMessages": [
+                            f"An issue with key '{key}' does not exist for field 'key'."
+                        ]
+                    }
+            issues = [self.issues[key] for key in requested]
+        else:
+            issues = list(self.issues.values())
+        return 200, {
+            "startAt": start_at,
+            "maxResults": max_results,
+            "total": len(issues),
+            "issues": issues[start_at : start_at + max_results],
+        }
+
+    def _search_jql(self, query: Dict[str, List[str]]) -> Tuple[int, Dict[str, Any]]:
+        # Cloud instances paginate using tokens instead of offsets
+        token = query.pop("nextPageToken", ["0"])[0]
+        status, result = self._search(dict(query, startAt=[token]))
+        if status != 200:
+            return status, result
+        received = int(token) + len(result["issues"])
+        page: Dict[str, Any] = {
+            "issues": result["issues"],
+            "isLast": received >= result["total"],
+        }
+        if not page["isLast"]:
+            page["nextPageToken"] = str(received)
+        return status, page
+
+    def _comments(self, key: str, query: Dict[str, List[str]]) -> Dict[str, Any]:
+        comments = list(self.comments[key])
+        if query.get("orderBy", [""])[0] == "-created":
+            comments.reverse()
+        start_at = int(query.get("startAt", ["0"])[0])
+        max_results = int(query.get("maxResults", ["50"])[0])
+        return {
+            "startAt": start_at,
+            "maxResults": max_results,
+            "total": len(comments),
+            "comments": comments[start_at : start_at + max_results],
+        }
+
+    def handle(
+        self, method: str, url: str, body: bytes
+    ) -> Tuple[int, Union[Dict[str, Any], List[Any], None]]:
+        """
+        Handle a request
+
+        Returns:
+            status  - HTTP status code
+            content - JSON content
+        """
+        parsed = urlsplit(url)
+        query = parse_qs(parsed.query)
+        path = parsed.path
+        match = ISSUE_PATH_REGEX.match(path)
+        if match:
+            endpoint = f"issue/{match.group(2)}" if match.group(2) else "issue"
+        else:
+            endpoint = path[len(API) + 1 :]
+        with self._lock:
+            self.calls[f"{method} {endpoint}"] += 1
+        if f"{method} {endpoint}" in self.errors:
+            return self.errors[f"{method} {endpoint}"], {"errorMessages": ["Error"]}
+        response: Tuple[int, Any]
+        if path == f"{API}/serverInfo":
+            response = (
+                200,
+                {
+                    "baseUrl": self.url,
+                    "deploymentType": self.deployment_type,
+                    "version": "9.4.0",
+                    "versionNumbers": [9, 4, 0],
+                },
+            )
+        elif path == f"{API}/myself":
+            response = (200, {"name": "bench"})
+        elif path == f"{API}/field":
+            response = (
+                200,
+                [
+                    {"id": field, "name": field.capitalize(), "custom": False}
+                    for field in ["summary", "status", "comment", "assignee"]
+                ],
+            )
+        elif path == f"{API}/search":
+            response = self._search(query)
+        elif path == f"{API}/search/jql":
+            response = self._search_jql(query)
+        else:
+            if not match or match.group(1) not in self.issues:
+                return 404, {"errorMessages": ["Issue Does Not Exist"]}
+            key, resource = match.groups()
+            issue = self.issues[key]
+            if not resource:
+                fields = ",".join(query.get("fields", []))
+                if "comment" in fields.split(","):
+                    comments = self.comments[key]
+                    issue = dict(issue, fields=dict(issue["fields"]))
+                    issue["fields"]["comment"] = {
+                        "comments": comments,
+                        "startAt": 0,
+                        "maxResults": len(comments),
+                        "total": len(comments),
+                    }
+                response = (200, issue)
+            elif resource == "comment" and method == "GET":
+                response = (200, self._comments(key, query))
+            elif resource == "comment":
+                comment = self._comment(key, json.loads(body).get("body", ""))
+                with self._lock:
+                    self.comments[key].append(comment)
+                response = (201, comment)
+            elif resource == "transitions" and method == "GET":
+                response = (200, {"transitions": [DONE_TRANSITION]})
+            elif resource == "transitions":
+                transition = json.loads(body).get("transition", {}).get("id")
+                if str(transition) != DONE_TRANSITION["id"]:
+                    return 400, {"errorMessages": ["Transition is not valid"]}
+                with self._lock:
+                    issue["fields"]["status"] = dict(DONE_TRANSITION["to"])
+                response = (204, None)
+            else:
+                response = (
+                    200,
+                    [{"id": "1", "filename": "attachment", "size": len(body)}],
+                )
+        return response
+
+    def _handler(self) -> type:
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Avoid delayed acknowledgements of responses written in parts
+            disable_nagle_algorithm = True
+
+            def _respond(self) -> None:
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length)
+                if fake.latency:
+                    time.sleep(fake.latency)
+                status, content = fake.handle(self.command, self.path, body)
+                payload = json.dumps(content).encode() if content is not None else b""
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = _respond
+            do_POST = _respond
+            do_PUT = _respond
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+
+from typing import Any, List
+
+import importlib_metadata
+import pytest
+
+import jiav.exceptions
+from jiav import backend
+from jiav_lineinfile import LineInFileBackend
+
+
+def test_backend_registry(monkeypatch: pytest.MonkeyPatch) -> None:
+    scans: List[Any] = []
+    entry_points = importlib_metadata.entry_points
+
+    def counting_entry_points(**kwargs: Any) -> Any:
+        scans.append(kwargs)
+        return entry_points(**kwargs)
+
+    monkeypatch.setattr(backend, "entry_points", counting_entry_points)
+    monkeypatch.setattr(backend, "_backends", None)
+    monkeypatch.setattr(backend, "_backend_classes", {})
+    assert "lineinfile" in backend.import_backends()
+    assert "lineinfile" in backend.import_backends()
+    assert backend.load_backend("lineinfile") is LineInFileBackend
+    assert backend.load_backend("lineinfile") is LineInFileBackend
+    assert len(scans) == 1
+    with pytest.raises(jiav.exceptions.InvalidBackend):
+        backend.load_backend("missing")
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+
+import json
+import math
+import os
+import resource
+import sys
+import time
+from typing import Any, Dict, List
+
+import pytest
+from click.testing import CliRunner
+
+from jiav import cli, verification
+from tests.fake_jira import FakeJira
+
+# Upper bound of requests sent to Jira per verified issue
+MAX_HTTP_CALLS_PER_ISSUE: float = 5
+# Upper bound of seconds spent verifying an issue on top of the latency of the
+# fake Jira, loose enough to not fail on slow machines
+MAX_ISSUE_OVERHEAD_SECONDS: float = 0.25
+
+
+def _percentile(values: List[float], percentile: float) -> float:
+    ordered = sorted(values)
+    index = max(0, math.ceil(percentile / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def _peak_rss_kib() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS, KiB on Linux
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _setting(name: str, default: float) -> float:
+    return float(os.environ.get(f"JIAV_BENCHMARK_{name}", default))
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("workers", [1, 4])
+@pytest.mark.parametrize(
+    "fake_jira",
+    [
+        {
+            "issues": int(_setting("ISSUES", 60)),
+            "comments": int(_setting("COMMENTS", 5)),
+            "comment_size": int(_setting("COMMENT_SIZE", 1024)),
+            "latency": _setting("LATENCY", 0.002),
+        }
+    ],
+    indirect=True,
+)
+def test_verify_benchmark(
+    workers: int, fake_jira: FakeJira, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    issues = len(fake_jira.issues)
+    # Measure every issue passing through the fetch, parse, execute and write
+    # phases
+    latencies: List[float] = []
+    verify_issue = verification.verify_issue
+
+    def timed_verify_issue(*args: Any, **kwargs: Any) -> bool:
+        started = time.perf_counter()
+        try:
+            return verify_issue(*args, **kwargs)
+        finally:
+            latencies.append(time.perf_counter() - started)
+
+    monkeypatch.setattr(verification, "verify_issue", timed_verify_issue)
+    started = time.perf_counter()
+    result = CliRunner().invoke(
+        cli.jiav,
+        [
+            "verify",
+            "--jira",
+            fake_jira.url,
+            "--access-token",
+            "token",
+            "--query",
+            "project = BENCH",
+            "--workers",
+            str(workers),
+            "--format",
+            "json",
+        ],
+    )
+    elapsed = time.perf_counter() - started
+    assert result.exit_code == 0, result.output
+    assert fake_jira.calls["POST issue/transitions"] == issues
+
+    report: Dict[str, Any] = {
+        "workers": workers,
+        "issues": issues,
+        "seconds": round(elapsed, 3),
+        "issues_per_second": round(issues / elapsed, 1),
+        "http_calls_per_issue": round(fake_jira.total_calls / issues, 2),
+        "p50_issue_seconds": round(_percentile(latencies, 50), 4),
+        "p99_issue_seconds": round(_percentile(latencies, 99), 4),
+        "peak_rss_kib": _peak_rss_kib(),
+        "http_calls": dict(fake_jira.calls),
+    }
+    print(json.dumps(report, indent=2))
+    report_file = os.environ.get("JIAV_BENCHMARK_REPORT")
+    if report_file:
+        with open(report_file, "a") as f:
+            f.write(json.dumps(report) + "\n")
+    assert report["http_calls_per_issue"] <= MAX_HTTP_CALLS_PER_ISSUE
+    # Catches delays not caused by requests, such as backoff or slow parsing
+    assert (
+        report["p50_issue_seconds"]
+        <= MAX_HTTP_CALLS_PER_ISSUE * fake_jira.latency + MAX_ISSUE_OVERHEAD_SECONDS
+    )
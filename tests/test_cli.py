@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+
+import json
+from typing import Any, Dict, List, Tuple
+
+import pytest
+from click.testing import CliRunner, Result
+
+from jiav import cli
+from jiav.jira import JiraConnection
+from jiav.transport import CASSETTE_FILE
+from tests.fake_jira import FakeJira
+
+
+def _verify(fake_jira: FakeJira, *args: str) -> Result:
+    return CliRunner().invoke(
+        cli.jiav,
+        ["verify", "--jira", fake_jira.url, "--access-token", "token", *args],
+    )
+
+
+def _fail_following_pages(
+    fake_jira: FakeJira,
+    monkeypatch: pytest.MonkeyPatch,
+    status: int,
+    content: Dict[str, Any],
+) -> None:
+    search = fake_jira._search
+
+    def failing_search(query: Dict[str, List[str]]) -> Tuple[int, Dict[str, Any]]:
+        if query.get("startAt", ["0"])[0] != "0":
+            return status, content
+        return search(query)
+
+    monkeypatch.setattr(fake_jira, "_search", failing_search)
+
+
+def test_verify(fake_jira: FakeJira) -> None:
+    result = _verify(fake_jira, "--query", "project = BENCH")
+    assert result.exit_code == 0, result.output
+    assert fake_jira.calls["POST issue/transitions"] == 10
+
+
+@pytest.mark.parametrize(
+    "status, message, exit_code",
+    [
+        (400, "Error in the JQL Query: The quoted string has not completed.", 3),
+        (403, "Forbidden", 2),
+    ],
+)
+def test_following_pages_errors(
+    fake_jira: FakeJira,
+    monkeypatch: pytest.MonkeyPatch,
+    status: int,
+    message: str,
+    exit_code: int,
+) -> None:
+    _fail_following_pages(fake_jira, monkeypatch, status, {"errorMessages": [message]})
+    result = _verify(fake_jira, "--query", "project = BENCH", "--page-size", "4")
+    assert result.exit_code == exit_code, result.output
+    assert fake_jira.calls["GET search"] == 2
+
+
+def test_rejected_credentials_after_cached_handshake(
+    fake_jira: FakeJira, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    result = _verify(fake_jira, "--issue", "BENCH-1")
+    assert result.exit_code == 0, result.output
+    monkeypatch.setattr(JiraConnection, "_instance", None)
+    fake_jira.errors.update({"GET field": 401, "GET search": 401, "GET myself": 401})
+    result = _verify(fake_jira, "--issue", "BENCH-1")
+    assert result.exit_code == 2, result.output
+    assert fake_jira.calls["GET serverInfo"] == 2
+
+
+@pytest.mark.parametrize("option", ["--record", "--incremental"])
+def test_replay_is_mutually_exclusive(
+    fake_jira: FakeJira, tmp_path: Any, option: str
+) -> None:
+    args = ["--query", "project = BENCH", "--replay", str(tmp_path), option]
+    if option == "--record":
+        args.append(str(tmp_path / "recording"))
+    result = _verify(fake_jira, *args)
+    assert result.exit_code == 2
+    assert "mutually exclusive" in result.output
+    assert fake_jira.total_calls == 0
+
+
+def test_replayed_request_was_not_recorded(
+    fake_jira: FakeJira, monkeypatch: pytest.MonkeyPatch, tmp_path: Any
+) -> None:
+    cassette_dir = tmp_path / "cassette"
+    result = _verify(fake_jira, "--issue", "BENCH-1", "--record", str(cassette_dir))
+    assert result.exit_code == 0, result.output
+    # Drop the recorded comments of the issue
+    cassette = cassette_dir / CASSETTE_FILE
+    exchanges = cassette.read_text().splitlines()
+    cassette.write_text(
+        "".join(
+            f"{exchange}\n"
+            for exchange in exchanges
+            if "/comment" not in json.loads(exchange)["request"][1]
+        )
+    )
+    assert len(cassette.read_text().splitlines()) < len(exchanges)
+    monkeypatch.setattr(JiraConnection, "_instance", None)
+    total_calls = fake_jira.total_calls
+    result = _verify(fake_jira, "--issue", "BENCH-1", "--replay", str(cassette_dir))
+    assert result.exit_code == 7, result.output
+    assert fake_jira.total_calls == total_calls
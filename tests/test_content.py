@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+
+from jiav.content import TRUNCATION_MARKER, OutputSink
+
+
+def test_output_is_spooled_to_disk() -> None:
+    output = OutputSink(spool_size=16)
+    output.write_lines(["first", "second\n"])
+    assert not output.file()._rolled  # type: ignore[attr-defined]
+    output.write_lines(["x" * 16])
+    assert output.file()._rolled  # type: ignore[attr-defined]
+    assert output.getvalue() == f"first\nsecond\n{'x' * 16}\n"
+    output.close()
+
+
+def test_output_is_truncated() -> None:
+    max_size = len(TRUNCATION_MARKER) + 10
+    output = OutputSink(max_size=max_size)
+    output.write("0123456789abcdef")
+    output.write("dropped")
+    assert output.truncated
+    assert output.size == max_size
+    assert output.getvalue() == f"0123456789{TRUNCATION_MARKER}"
+    output.close()
+
+
+def test_truncation_does_not_split_characters() -> None:
+    output = OutputSink(max_size=len(TRUNCATION_MARKER) + 3)
+    output.write("aé€")
+    assert output.getvalue() == f"aé{TRUNCATION_MARKER}"
+    output.close()
+
+
+def test_output_is_appended_after_read() -> None:
+    output = OutputSink()
+    output.write("first\n")
+    assert output.file().read() == b"first\n"
+    output.write("second\n")
+    assert output.getvalue() == "first\nsecond\n"
+    output.close()
+
+
+def test_output_is_appended_from_output() -> None:
+    step_output = OutputSink(spool_size=16)
+    step_output.write_lines(["é" * 16])
+    output = OutputSink(max_size=len(TRUNCATION_MARKER) + 44)
+    output.write("first\n")
+    output.append(step_output)
+    output.append(step_output)
+    assert output.truncated
+    assert output.getvalue() == f"first\n{'é' * 16}\n{'é' * 2}{TRUNCATION_MARKER}"
+    step_output.close()
+    output.close()
@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+
+import pytest
+
+from jiav import incremental
+
+
+@pytest.mark.parametrize(
+    "jql, elapsed, incremental_jql",
+    [
+        ("project = TEST", 600, '(project = TEST) AND updated >= "-12m"'),
+        (
+            "project = TEST ORDER BY created DESC",
+            61,
+            '(project = TEST) AND updated >= "-4m" ORDER BY created DESC',
+        ),
+        ("ORDER BY key", 0, 'updated >= "-2m" ORDER BY key'),
+        ("a = b OR c = d", 30, '(a = b OR c = d) AND updated >= "-3m"'),
+    ],
+)
+def test_build_query(jql: str, elapsed: float, incremental_jql: str) -> None:
+    assert incremental.build_query(jql, 1000, now=1000 + elapsed) == incremental_jql
+
+
+def test_checkpoint(tmp_path: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("JIAV_CACHE_DIR", str(tmp_path))
+    assert incremental.get_checkpoint("https://jira", "project = TEST") is None
+    incremental.set_checkpoint("https://jira/", "project = TEST", 1000)
+    assert incremental.get_checkpoint("https://jira", "project = TEST") == 1000
+    assert incremental.get_checkpoint("https://jira", "project = OTHER") is None
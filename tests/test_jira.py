@@ -0,0 +1,253 @@
+#!/usr/bin/env python
+
+from typing import Any, List, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from jira import Issue
+
+from jiav import exceptions, jira, storage, verification
+from jiav.jira import JiraConnection
+from jiav_jira_issue.backend import JiraIssueBackend
+from tests.fake_jira import FakeJira
+
+DEPLOYMENT_TYPES = [
+    pytest.param({"deployment_type": deployment_type}, id=deployment_type)
+    for deployment_type in ["Server", "Cloud"]
+]
+
+
+def _search_endpoints(fake_jira: FakeJira) -> Tuple[str, str]:
+    """
+    Get the search endpoint used by the deployment type, and the one which
+    must not be used
+    """
+    if fake_jira.deployment_type == "Cloud":
+        return "GET search/jql", "GET search"
+    return "GET search", "GET search/jql"
+
+
+@pytest.mark.parametrize("fake_jira", DEPLOYMENT_TYPES, indirect=True)
+def test_issue_keys_are_chunked(
+    fake_jira: FakeJira, connection: JiraConnection, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(jira, "ISSUE_KEYS_CHUNK_SIZE", 4)
+    keys = [f"BENCH-{number}" for number in range(1, 11)]
+    remote_issues = connection.fetch_issues_by_key(keys + ["BENCH-1"])
+    assert [remote_issue.key for remote_issue in remote_issues] == keys
+    endpoint, unused_endpoint = _search_endpoints(fake_jira)
+    assert fake_jira.calls[endpoint] == 3
+    assert fake_jira.calls[unused_endpoint] == 0
+    assert fake_jira.calls["GET issue"] == 0
+
+
+@pytest.mark.parametrize("fake_jira", DEPLOYMENT_TYPES, indirect=True)
+def test_invalid_issue_keys_are_bisected(
+    fake_jira: FakeJira, connection: JiraConnection, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(jira, "ISSUE_KEYS_CHUNK_SIZE", 4)
+    keys = ["BENCH-1", "BENCH-2", "MISSING-1", "BENCH-3"]
+    remote_issues = connection.fetch_issues_by_key(keys)
+    assert [remote_issue.key for remote_issue in remote_issues] == [
+        "BENCH-1",
+        "BENCH-2",
+        "BENCH-3",
+    ]
+    # [1, 2, M, 3] -> [1, 2] + [M, 3] -> [M] + [3]
+    endpoint, unused_endpoint = _search_endpoints(fake_jira)
+    assert fake_jira.calls[endpoint] == 5
+    assert fake_jira.calls[unused_endpoint] == 0
+    # The invalid key is requested individually to report why
+    assert fake_jira.calls["GET issue"] == 1
+
+
+def test_failed_issue_keys_query_is_not_bisected(
+    fake_jira: FakeJira, connection: JiraConnection
+) -> None:
+    fake_jira.errors["GET search"] = 403
+    with pytest.raises(exceptions.JiraUnhandledException):
+        connection.fetch_issues_by_key(["BENCH-1", "BENCH-2"])
+    assert fake_jira.calls["GET search"] == 1
+
+
+@pytest.mark.parametrize("fake_jira", DEPLOYMENT_TYPES, indirect=True)
+def test_query_results_are_paged(
+    fake_jira: FakeJira, connection: JiraConnection
+) -> None:
+    remote_issues = connection.fetch_issues([], "project = BENCH", page_size=4)
+    assert [remote_issue.key for remote_issue in remote_issues] == [
+        f"BENCH-{number}" for number in range(1, 11)
+    ]
+    endpoint, unused_endpoint = _search_endpoints(fake_jira)
+    assert fake_jira.calls[endpoint] == 3
+    assert fake_jira.calls[unused_endpoint] == 0
+
+
+def _reconnect(fake_jira: FakeJira, monkeypatch: pytest.MonkeyPatch) -> JiraConnection:
+    monkeypatch.setattr(JiraConnection, "_instance", None)
+    return JiraConnection(fake_jira.url, access_token="token")
+
+
+def test_cached_handshake_is_reused(
+    fake_jira: FakeJira, connection: JiraConnection, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    connection = _reconnect(fake_jira, monkeypatch)
+    connection.fetch_issues(["BENCH-1"], "")
+    assert fake_jira.calls["GET serverInfo"] == 1
+    assert fake_jira.calls["GET myself"] == 1
+
+
+def test_rejected_cached_handshake_falls_back_to_handshake(
+    fake_jira: FakeJira, connection: JiraConnection, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    handle = fake_jira.handle
+    rejected: List[str] = []
+
+    def rejecting_handle(method: str, url: str, body: bytes) -> Tuple[int, Any]:
+        if not rejected:
+            rejected.append(url)
+            return 401, {"errorMessages": ["Unauthorized"]}
+        return handle(method, url, body)
+
+    connection = _reconnect(fake_jira, monkeypatch)
+    monkeypatch.setattr(fake_jira, "handle", rejecting_handle)
+    remote_issues = list(connection.fetch_issues(["BENCH-1"], ""))
+    assert [remote_issue.key for remote_issue in remote_issues] == ["BENCH-1"]
+    assert len(rejected) == 1
+    assert fake_jira.calls["GET serverInfo"] == 2
+    assert fake_jira.calls["GET myself"] == 2
+
+
+def test_rejected_credentials_after_cached_handshake(
+    fake_jira: FakeJira, connection: JiraConnection, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    connection = _reconnect(fake_jira, monkeypatch)
+    fake_jira.errors.update({"GET field": 401, "GET search": 401, "GET myself": 401})
+    with pytest.raises(exceptions.JiraAuthenticationFailed):
+        connection.fetch_issues(["BENCH-1"], "")
+    assert (
+        storage.get_cached(
+            jira.HANDSHAKE_CACHE_FILE, connection._handshake_cache_key, 60
+        )
+        is None
+    )
+
+
+def test_throttled_requests_are_retried_by_adapter(connection: JiraConnection) -> None:
+    assert connection.jira._session.max_retries == 0
+
+
+def test_comments_are_paged_from_newest(
+    fake_jira: FakeJira, connection: JiraConnection
+) -> None:
+    issue = connection.fetch_issue("BENCH-1")
+    for number in range(6):
+        fake_jira.comments["BENCH-1"].append(
+            fake_jira._comment("BENCH-1", f"comment {number}")
+        )
+    comments = list(connection.iter_comments(issue, page_size=3))  # type: ignore
+    assert [comment.body for comment in comments] == [
+        f"comment {number}" for number in reversed(range(6))
+    ] + [fake_jira.manifest]
+    assert fake_jira.calls["GET issue/comment"] == 3
+
+
+def test_comments_paging_stops_at_manifest(
+    fake_jira: FakeJira, connection: JiraConnection
+) -> None:
+    issue = connection.fetch_issue("BENCH-1")
+    comments = fake_jira.comments["BENCH-1"]
+    for number in range(6):
+        comments.append(fake_jira._comment("BENCH-1", f"comment {number}"))
+    comments.append(fake_jira._comment("BENCH-1", fake_jira.manifest, private=True))
+    for number in range(4):
+        comments.append(fake_jira._comment("BENCH-1", f"comment {number}"))
+    valid_manifest, jiav_comment = verification.process_comments(
+        connection.iter_comments(issue, page_size=3)  # type: ignore
+    )
+    assert valid_manifest
+    assert jiav_comment.id == comments[7]["id"]  # type: ignore
+    # The manifest is the fifth newest comment, older comments are not fetched
+    assert fake_jira.calls["GET issue/comment"] == 2
+
+
+def test_only_issue_fields_are_requested(
+    fake_jira: FakeJira, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(JiraIssueBackend, "ISSUE_FIELDS", ["status", "labels"])
+    handle = fake_jira.handle
+    requested_fields: List[List[str]] = []
+
+    def recording_handle(method: str, url: str, body: bytes) -> Tuple[int, Any]:
+        if urlsplit(url).path.endswith("/search"):
+            fields = parse_qs(urlsplit(url).query)["fields"]
+            requested_fields.append(",".join(fields).split(","))
+        return handle(method, url, body)
+
+    monkeypatch.setattr(fake_jira, "handle", recording_handle)
+    connection = JiraConnection(fake_jira.url, access_token="token")
+    connection.fetch_issues(["BENCH-1"], "")
+    # Fields declared by backends are requested along with jiav's own fields
+    assert requested_fields == [jira.ISSUE_FIELDS + ["labels"]]
+
+
+# Project, issue type and status of the issues served by FakeJira
+WORKFLOW_CACHE_KEY = "BENCH/1/1"
+
+
+def _fetch_issue(connection: JiraConnection, key: str) -> Issue:
+    issue = connection.fetch_issue(key)
+    assert issue
+    return issue
+
+
+def test_transitions_are_cached_per_workflow(
+    fake_jira: FakeJira, connection: JiraConnection
+) -> None:
+    for key in ["BENCH-1", "BENCH-2"]:
+        issue = _fetch_issue(connection, key)
+        assert connection.check_if_status_is_valid(issue, "Done") == "31"
+        assert connection.check_if_status_is_valid(issue, "Closed") is None
+    assert fake_jira.calls["GET issue/transitions"] == 1
+
+
+def test_transitions_cache_is_persisted(
+    fake_jira: FakeJira, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    for key in ["BENCH-1", "BENCH-2"]:
+        monkeypatch.setattr(JiraConnection, "_instance", None)
+        connection = JiraConnection(
+            fake_jira.url, access_token="token", transitions_cache_ttl=60
+        )
+        issue = _fetch_issue(connection, key)
+        assert connection.get_transitions(issue) == {"Done": "31"}
+    assert fake_jira.calls["GET issue/transitions"] == 1
+
+
+def test_stale_transition_is_refreshed(fake_jira: FakeJira) -> None:
+    connection = JiraConnection(
+        fake_jira.url, access_token="token", transitions_cache_ttl=60
+    )
+    issue = _fetch_issue(connection, "BENCH-1")
+    # Transitions cached before the workflow was changed
+    connection._transitions[WORKFLOW_CACHE_KEY] = {"Done": "99"}
+    connection.update_issue_status(issue, "99")
+    assert issue.fields.status.name == "Done"
+    assert connection._transitions[WORKFLOW_CACHE_KEY] == {"Done": "31"}
+    assert fake_jira.calls["POST issue/transitions"] == 2
+
+
+def test_failed_transition_invalidates_cached_transitions(fake_jira: FakeJira) -> None:
+    connection = JiraConnection(
+        fake_jira.url, access_token="token", transitions_cache_ttl=60
+    )
+    issue = _fetch_issue(connection, "BENCH-1")
+    persisted_key = f"{connection._handshake_cache_key}/{WORKFLOW_CACHE_KEY}"
+    connection.get_transitions(issue)
+    assert storage.get_cached(jira.TRANSITIONS_CACHE_FILE, persisted_key, 60)
+    fake_jira.errors["POST issue/transitions"] = 500
+    fake_jira.errors["GET issue/transitions"] = 500
+    with pytest.raises(exceptions.JiraUnhandledException):
+        connection.update_issue_status(issue, "31")
+    assert WORKFLOW_CACHE_KEY not in connection._transitions
+    assert storage.get_cached(jira.TRANSITIONS_CACHE_FILE, persisted_key, 60) is None
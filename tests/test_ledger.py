@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+
+import os
+import time
+
+from jiav.ledger import Ledger, StepStats
+
+
+def test_ledger(tmp_path: str) -> None:
+    ledger = Ledger(path=os.path.join(tmp_path, "ledger.sqlite3"))
+    assert ledger.get_outcome("TEST-1", "10000", "2024-01-01T00:00:00") is None
+    ledger.record("TEST-1", "10000", "2024-01-01T00:00:00", False)
+    assert ledger.get_outcome("TEST-1", "10000", "2024-01-01T00:00:00") is False
+    # An edited comment is a new manifest
+    assert ledger.get_outcome("TEST-1", "10000", "2024-01-02T00:00:00") is None
+    ledger.record("TEST-1", "10000", "2024-01-01T00:00:00", True)
+    assert ledger.get_outcome("TEST-1", "10000", "2024-01-01T00:00:00") is True
+    ledger.close()
+
+
+def test_step_stats(tmp_path: str) -> None:
+    ledger = Ledger(path=os.path.join(tmp_path, "ledger.sqlite3"))
+    assert ledger.get_step_stats(["step"]) == {}
+    ledger.record_step("step", 1.5, True)
+    ledger.record_step("step", 0.5, False)
+    ledger.record_step("other", 2, True)
+    assert ledger.get_step_stats(["step", "missing"]) == {
+        "step": StepStats(executions=2, failures=1, seconds=2.0)
+    }
+    ledger.close()
+
+
+def test_outcomes_recorded_before(tmp_path: str) -> None:
+    ledger = Ledger(path=os.path.join(tmp_path, "ledger.sqlite3"))
+    ledger.record("TEST-1", "10000", "2024-01-01T00:00:00", True)
+    assert ledger.get_outcome("TEST-1", "10000", "2024-01-01T00:00:00", since=0)
+    assert (
+        ledger.get_outcome(
+            "TEST-1", "10000", "2024-01-01T00:00:00", since=time.time() + 60
+        )
+        is None
+    )
+    ledger.close()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+
+import os
+
+import pytest
+
+from jiav_lineinfile.backend import LineInFileBackend
+
+
+def _execute(step: dict) -> LineInFileBackend:
+    backend = LineInFileBackend()
+    backend.step = step
+    backend.validate_schema()
+    backend.execute_backend()
+    return backend
+
+
+@pytest.mark.parametrize("offset", range(8))
+def test_line_spanning_chunks(
+    offset: int, tmp_path: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(LineInFileBackend, "CHUNK_SIZE", 4)
+    path = os.path.join(tmp_path, "file.log")
+    with open(path, "w") as f:
+        f.write("x" * offset + "needle" + "x" * 8)
+    backend = _execute({"path": path, "line": "needle"})
+    assert backend.result.successful
+    assert backend.result.output == [f"Line 'needle' found in '{path}'"]
+
+
+def test_missing_line(tmp_path: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(LineInFileBackend, "CHUNK_SIZE", 4)
+    path = os.path.join(tmp_path, "file.log")
+    with open(path, "w") as f:
+        f.write("needl" + "x" * 8 + "eedle")
+    backend = _execute({"path": path, "line": "needle"})
+    assert not backend.result.successful
+    assert backend.result.errors == [f"Line 'needle' is not present in file '{path}'"]
+
+
+def test_missing_file(tmp_path: str) -> None:
+    path = os.path.join(tmp_path, "missing.log")
+    backend = _execute({"path": path, "line": "needle"})
+    assert backend.result.errors == [f"File '{path}' does not exist"]
+
+
+def test_encoding(tmp_path: str) -> None:
+    path = os.path.join(tmp_path, "file.log")
+    with open(path, "w", encoding="latin-1") as f:
+        f.write("résumé\n")
+    backend = _execute({"path": path, "line": "résumé", "encoding": "latin-1"})
+    assert backend.result.successful
+    assert not _execute({"path": path, "line": "résumé"}).result.successful
+
+
+@pytest.mark.parametrize("newline", ["\r\n", "\r", "\n"])
+@pytest.mark.parametrize("chunk_size", [3, 1024])
+def test_multiple_lines(
+    newline: str, chunk_size: int, tmp_path: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(LineInFileBackend, "CHUNK_SIZE", chunk_size)
+    path = os.path.join(tmp_path, "file.log")
+    with open(path, "w", newline="") as f:
+        f.write(newline.join(["first", "alpha", "beta", "last"]))
+    assert _execute({"path": path, "line": "alpha\nbeta"}).result.successful
+    assert _execute({"path": path, "line": "beta"}).result.successful
+    assert not _execute({"path": path, "line": "alpha\nlast"}).result.successful
+
+
+@pytest.mark.parametrize("encoding", ["utf-16", "utf-16-be", "utf-8-sig"])
+def test_byte_order_mark_encodings(encoding: str, tmp_path: str) -> None:
+    path = os.path.join(tmp_path, "file.log")
+    with open(path, "w", encoding=encoding) as f:
+        f.write("first\nrésumé\nlast\n")
+    for line in ["first", "résumé", "résumé\nlast"]:
+        backend = _execute({"path": path, "line": line, "encoding": encoding})
+        assert backend.result.successful, line
+    backend = _execute({"path": path, "line": "missing", "encoding": encoding})
+    assert not backend.result.successful
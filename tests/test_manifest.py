@@ -1,9 +1,75 @@
 #!/usr/bin/env python
 
+import os
+import threading
+from typing import List, Sequence, Union
+
 import pytest
 
 import jiav.exceptions
-from jiav.manifest import Manifest
+from jiav.backend import BaseBackend, Result
+from jiav.ledger import Ledger
+from jiav.manifest import Manifest, extract_manifest_text
+from jiav.step_results import step_key
+
+
+class FakeBackend(BaseBackend):
+    def __init__(
+        self,
+        name: str,
+        successful: bool = True,
+        barrier: Union[threading.Barrier, None] = None,
+        release: Union[threading.Event, None] = None,
+    ) -> None:
+        super().__init__(name=name, schema={}, step={"name": name})
+        self.successful = successful
+        self.barrier = barrier
+        self.release = release
+        self.executed = False
+
+    def execute_backend(self) -> None:
+        # Steps sharing a barrier only pass it when executed concurrently
+        if self.barrier:
+            self.barrier.wait()
+        if self.release:
+            self.release.wait(timeout=5)
+        self.executed = True
+        self.result = Result(self.successful, [f"{self.name} output"], [])
+
+
+def _manifest_with_steps(
+    steps: Sequence[BaseBackend],
+    depends_on: Sequence[Union[List[str], None]],
+    order_independent: bool = False,
+) -> Manifest:
+    manifest = Manifest(
+        manifest_text="\n".join(
+            [
+                "jiav:",
+                "  verified_status: Done",
+                f"  order_independent: {str(order_independent).lower()}",
+                "  verification_steps:",
+            ]
+            + [
+                "\n".join(
+                    [
+                        f"    - name: {step.name}",
+                        "      backend: lineinfile",
+                        "      path: /tmp",
+                        "      line: jiav",
+                    ]
+                    + (
+                        []
+                        if dependencies is None
+                        else [f"      depends_on: {dependencies}"]
+                    )
+                )
+                for step, dependencies in zip(steps, depends_on)
+            ]
+        )
+    )
+    manifest.backend_steps = list(steps)
+    return manifest
 
 
 @pytest.mark.parametrize(
@@ -22,6 +88,10 @@ from jiav.manifest import Manifest
             "tests/files/manifests/valid_multiple_steps.yml",
             True,
         ),
+        (
+            "tests/files/manifests/valid_parallel_steps.yml",
+            True,
+        ),
     ],
 )
 def test_validate_manifest(manifest_file: str, valid_manifest: bool) -> None:
@@ -51,6 +121,14 @@ def test_validate_manifest(manifest_file: str, valid_manifest: bool) -> None:
             "tests/files/manifests/valid_multiple_steps.yml",
             True,
         ),
+        (
+            "tests/files/manifests/valid_multiple_steps_failed_execution.yml",
+            False,
+        ),
+        (
+            "tests/files/manifests/valid_parallel_steps.yml",
+            True,
+        ),
     ],
 )
 def test_manifest_execution(manifest_file: str, successful_execution: bool) -> None:
@@ -59,3 +137,188 @@ def test_manifest_execution(manifest_file: str, successful_execution: bool) -> N
         manifest = Manifest(manifest_text=content)
         manifest.execute_manifest()
         assert manifest.successful == successful_execution
+
+
+@pytest.mark.parametrize(
+    "text, manifest_text",
+    [
+        ("Looks good to me", None),
+        ("Please add a jiav manifest", None),
+        ("jiav is great\n", None),
+        # Nested keys are rejected when parsing
+        ("steps:\n  jiav: true\n", "steps:\n  jiav: true\n"),
+        ("jiav:\n  verified_status: Done\n", "jiav:\n  verified_status: Done\n"),
+        (
+            "  jiav:\n    verified_status: Done\n",
+            "  jiav:\n    verified_status: Done\n",
+        ),
+        ("? jiav\n: {}\n", "? jiav\n: {}\n"),
+        (
+            "{code:yaml}\r\njiav:\r\n  verified_status: Done\r\n{code}",
+            "\njiav:\r\n  verified_status: Done\r\n",
+        ),
+        ("{noformat}\njiav: {}\n{noformat}\n", "\njiav: {}\n\n"),
+        ('{"jiav": {}}', '{"jiav": {}}'),
+    ],
+)
+def test_extract_manifest_text(text: str, manifest_text: str) -> None:
+    assert extract_manifest_text(text) == manifest_text
+
+
+def test_indented_manifest() -> None:
+    manifest = Manifest(
+        manifest_text="\n".join(
+            [
+                "{code:yaml}",
+                "  jiav:",
+                "    verified_status: Done",
+                "    verification_steps:",
+                "      - name: Check for line",
+                "        backend: lineinfile",
+                "        path: tests/files/manifests/valid_single_lineinfile.yml",
+                "        line: jiav",
+                "{code}",
+            ]
+        )
+    )
+    assert manifest.verified_status == "Done"
+
+
+def test_manifest_in_code_block() -> None:
+    with open("tests/files/manifests/valid_single_lineinfile.yml") as f:
+        content = f.read()
+    manifest = Manifest(manifest_text=f"{{code:yaml}}\n{content}{{code}}")
+    assert manifest.verified_status == "Done"
+
+
+def test_independent_steps_are_executed_concurrently() -> None:
+    barrier = threading.Barrier(2, timeout=5)
+    steps: List[BaseBackend] = [
+        FakeBackend("first", barrier=barrier),
+        FakeBackend("second", barrier=barrier),
+        FakeBackend("third"),
+    ]
+    manifest = _manifest_with_steps(steps, [[], [], ["first", "second"]])
+    manifest.execute_manifest()
+    assert manifest.successful
+    assert manifest.execution_output.getvalue() == "".join(
+        [
+            "Output of backend 'first':\n",
+            "first output\n",
+            "Output of backend 'second':\n",
+            "second output\n",
+            "Output of backend 'third':\n",
+            "third output\n",
+        ]
+    )
+
+
+def test_output_is_written_in_declaration_order() -> None:
+    release = threading.Event()
+
+    class ReleasingBackend(FakeBackend):
+        def execute_backend(self) -> None:
+            super().execute_backend()
+            release.set()
+
+    # The second step completes before the first one
+    steps = [FakeBackend("first", release=release), ReleasingBackend("second")]
+    manifest = _manifest_with_steps(steps, [[], []])
+    manifest.execute_manifest()
+    assert manifest.execution_output.getvalue() == (
+        "Output of backend 'first':\nfirst output\n"
+        "Output of backend 'second':\nsecond output\n"
+    )
+
+
+def test_steps_depending_on_failed_step_are_not_executed() -> None:
+    steps = [
+        FakeBackend("first", successful=False),
+        FakeBackend("second"),
+        FakeBackend("third"),
+    ]
+    manifest = _manifest_with_steps(steps, [[], ["first"], ["second"]])
+    manifest.execute_manifest()
+    assert not manifest.successful
+    assert [step.executed for step in steps] == [True, False, False]
+    assert manifest.execution_output.getvalue() == (
+        "Output of backend 'first':\nfirst output\n"
+    )
+
+
+def test_depends_on_undeclared_step() -> None:
+    with open("tests/files/manifests/valid_parallel_steps.yml") as f:
+        content = f.read()
+    with pytest.raises(jiav.exceptions.InvalidManifestException):
+        Manifest(manifest_text=content.replace("- Check regexinfile", "- Missing"))
+
+
+@pytest.mark.parametrize("step_timeout, manifest_timeout", [(0.1, 0), (0, 0.1)])
+def test_timed_out_step_is_abandoned(
+    step_timeout: float, manifest_timeout: float
+) -> None:
+    release = threading.Event()
+    steps = [FakeBackend("first", release=release), FakeBackend("second")]
+    manifest = _manifest_with_steps(steps, [[], ["first"]])
+    manifest.step_timeouts = [step_timeout, 0]
+    try:
+        manifest.execute_manifest(timeout=manifest_timeout)
+    finally:
+        release.set()
+    assert not manifest.successful
+    assert manifest.timed_out
+    assert not steps[1].executed
+    output = manifest.execution_output.getvalue().splitlines()
+    assert output[0] == "Output of backend 'first':"
+    assert "timed out" in output[1]
+
+
+@pytest.mark.parametrize("order_independent", [True, False])
+def test_order_independent_steps_are_ordered_by_cost(
+    order_independent: bool, tmp_path: str
+) -> None:
+    steps = [
+        FakeBackend("slow"),
+        FakeBackend("failing", successful=False),
+        FakeBackend("cheap"),
+    ]
+    step_stats = Ledger(path=os.path.join(tmp_path, "ledger.sqlite3"))
+    # The slow step rarely fails, the failing step is cheap and often fails
+    for _ in range(4):
+        step_stats.record_step(step_key(steps[0]), 10, True)
+        step_stats.record_step(step_key(steps[1]), 0.1, False)
+    manifest = _manifest_with_steps(
+        steps, [None, None, None], order_independent=order_independent
+    )
+    if order_independent:
+        # Steps without timings are executed first
+        assert manifest.execution_order(step_stats) == [2, 1, 0]
+    else:
+        assert manifest.execution_order(step_stats) == [0, 1, 2]
+    manifest.execute_manifest(step_stats=step_stats)
+    assert not manifest.successful
+    assert [step.executed for step in steps] == [
+        not order_independent,
+        True,
+        order_independent,
+    ]
+    # Output keeps the declaration order
+    assert manifest.execution_output.getvalue().startswith(
+        "Output of backend 'slow':\n"
+        if not order_independent
+        else "Output of backend 'failing':\n"
+    )
+    assert (
+        step_stats.get_step_stats([step_key(steps[1])])[step_key(steps[1])].executions
+        == 5
+    )
+    step_stats.close()
+
+
+def test_order_respects_depends_on(tmp_path: str) -> None:
+    steps = [FakeBackend("slow"), FakeBackend("dependent")]
+    step_stats = Ledger(path=os.path.join(tmp_path, "ledger.sqlite3"))
+    step_stats.record_step(step_key(steps[0]), 10, True)
+    manifest = _manifest_with_steps(steps, [None, ["slow"]], order_independent=True)
+    assert manifest.execution_order(step_stats) == [0, 1]
+    step_stats.close()
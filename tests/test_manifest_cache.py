@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+
+from typing import Any
+
+import pytest
+
+from jiav import exceptions, storage
+from jiav.manifest import Manifest
+from jiav.manifest_cache import INVALID, MANIFESTS_CACHE_FILE, VALID, ManifestCache
+
+MANIFEST = """jiav:
+  verified_status: Done
+  verification_steps:
+    - name: Check for line
+      backend: lineinfile
+      path: /tmp/file
+      line: jiav
+"""
+INVALID_MANIFEST = """jiav:
+  verified_status: Done
+  verification_steps:
+    - name: Check for line
+      backend: lineinfile
+      path: /tmp/file
+"""
+
+
+@pytest.fixture(autouse=True)
+def cache(monkeypatch: pytest.MonkeyPatch, tmp_path: Any) -> ManifestCache:
+    monkeypatch.setenv("JIAV_CACHE_DIR", str(tmp_path))
+    cache = ManifestCache()
+    monkeypatch.setattr("jiav.manifest.manifest_cache", cache)
+    return cache
+
+
+def test_least_recently_used_is_evicted() -> None:
+    cache = ManifestCache(maxsize=2)
+    cache.set("a", VALID, {})
+    cache.set("b", VALID, {})
+    cache.get("a")
+    cache.set("c", VALID, {})
+    assert cache.get("b") is None
+    assert cache.get("a") == (VALID, {})
+    assert cache.get("c") == (VALID, {})
+
+
+def test_key_depends_on_content() -> None:
+    cache = ManifestCache()
+    assert cache.key(MANIFEST) == cache.key(MANIFEST)
+    assert cache.key(MANIFEST) != cache.key(MANIFEST + "\n")
+
+
+def test_cached_manifest_is_not_parsed_again(
+    cache: ManifestCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    first = Manifest(MANIFEST)
+    monkeypatch.setattr(
+        Manifest,
+        "validiate_text_contains_manifest",
+        lambda *args: pytest.fail("manifest was parsed again"),
+    )
+    second = Manifest(MANIFEST)
+    assert second.manifest == first.manifest
+    assert second.verified_status == "Done"
+    assert [step.step for step in second.backend_steps] == [
+        step.step for step in first.backend_steps
+    ]
+    # Steps of a cached manifest do not share state
+    assert second.backend_steps[0].step is not first.backend_steps[0].step
+
+
+def test_cached_invalid_manifest_raises_same_error(cache: ManifestCache) -> None:
+    with pytest.raises(exceptions.InvalidManifestException) as parsed:
+        Manifest(INVALID_MANIFEST)
+    assert cache.get(cache.key(INVALID_MANIFEST))[0] == INVALID  # type: ignore
+    with pytest.raises(exceptions.InvalidManifestException) as cached:
+        Manifest(INVALID_MANIFEST)
+    assert str(cached.value) == str(parsed.value)
+
+
+def test_plain_comment_is_not_cached(cache: ManifestCache) -> None:
+    text = "Verified manually, no jiav manifest needed"
+    with pytest.raises(exceptions.InvalidManifestException):
+        Manifest(text)
+    assert cache.get(cache.key(text)) is None
+    assert not cache._entries
+
+
+def test_manifest_in_code_block_shares_entry(cache: ManifestCache) -> None:
+    Manifest(f"{{code:yaml}}\n{MANIFEST}{{code}}")
+    Manifest(f"{{noformat}}\n{MANIFEST}{{noformat}}")
+    assert len(cache._entries) == 1
+
+
+def test_cached_invalid_backend_raises_same_error() -> None:
+    text = MANIFEST.replace("lineinfile", "missing")
+    with pytest.raises(exceptions.InvalidBackend) as parsed:
+        Manifest(text)
+    with pytest.raises(exceptions.InvalidBackend) as cached:
+        Manifest(text)
+    assert str(cached.value) == str(parsed.value)
+
+
+def test_cache_is_persisted_between_runs(cache: ManifestCache) -> None:
+    # Not persisted unless loaded with a TTL
+    Manifest(MANIFEST)
+    cache.save()
+    assert storage.read_json(MANIFESTS_CACHE_FILE) == {}
+    cache.load(60)
+    cache.save()
+    persisted = ManifestCache()
+    persisted.load(60)
+    assert persisted.get(persisted.key(MANIFEST)) == cache.get(cache.key(MANIFEST))
+
+
+def test_expired_entries_are_not_loaded(cache: ManifestCache) -> None:
+    cache.load(60)
+    cache.set(cache.key(MANIFEST), VALID, {}, timestamp=1)
+    cache.save()
+    persisted = ManifestCache()
+    persisted.load(60)
+    assert persisted.get(persisted.key(MANIFEST)) is None
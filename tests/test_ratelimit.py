@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+
+import io
+from typing import Any, Dict, List, Union
+
+import pytest
+import requests
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+
+from jiav import ratelimit
+from jiav.ratelimit import RateLimitedAdapter, RateLimiter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: List[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr("jiav.ratelimit.time.monotonic", clock.monotonic)
+    monkeypatch.setattr("jiav.ratelimit.time.sleep", clock.sleep)
+    # Drop the jitter applied to requested delays
+    monkeypatch.setattr("jiav.ratelimit.random.uniform", lambda a, b: 0)
+    return clock
+
+
+def _response(
+    status_code: int, headers: Union[Dict[str, str], None] = None
+) -> Response:
+    response = Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response.url = "https://jira/rest/api/2/search"
+    response.raw = io.BytesIO()
+    return response
+
+
+def _send(
+    monkeypatch: pytest.MonkeyPatch, limiter: RateLimiter, responses: List[Response]
+) -> Response:
+    sent = iter(responses)
+
+    def send(self: HTTPAdapter, request: PreparedRequest, **kwargs: Any) -> Response:
+        return next(sent)
+
+    monkeypatch.setattr(HTTPAdapter, "send", send)
+    request = requests.Request("GET", "https://jira/rest/api/2/search").prepare()
+    return RateLimitedAdapter(limiter).send(request)
+
+
+def test_requests_are_paced(clock: FakeClock) -> None:
+    limiter = RateLimiter(rate=4)
+    for _ in range(12):
+        limiter.acquire()
+    # A burst of 4 requests is allowed, the rest are sent 0.25s apart
+    assert clock.now == pytest.approx(1002.0)
+    assert limiter.stats()["requests"] == 12
+
+
+def test_unlimited_requests_are_not_paced(clock: FakeClock) -> None:
+    limiter = RateLimiter()
+    for _ in range(100):
+        limiter.acquire()
+    assert clock.sleeps == []
+
+
+def test_retry_after_is_respected(
+    clock: FakeClock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    limiter = RateLimiter(rate=10)
+    response = _send(
+        monkeypatch,
+        limiter,
+        [_response(429, {"Retry-After": "7"}), _response(200)],
+    )
+    assert response.status_code == 200
+    assert sum(clock.sleeps) == pytest.approx(7)
+    stats = limiter.stats()
+    assert stats["throttled"] == 1
+    # The request rate is halved after being throttled
+    assert stats["current_rate"] < 10
+
+
+@pytest.mark.parametrize(
+    "reset",
+    [
+        "1030",
+        "Thu, 01 Jan 1970 00:17:10 GMT",
+        "1970-01-01T00:17:10Z",
+    ],
+)
+def test_rate_limit_reset(monkeypatch: pytest.MonkeyPatch, reset: str) -> None:
+    monkeypatch.setattr("jiav.ratelimit.time.time", lambda: 1000.0)
+    delay = RateLimiter()._requested_delay(_response(429, {"X-RateLimit-Reset": reset}))
+    assert delay == pytest.approx(30)
+
+
+def test_retries_are_capped(clock: FakeClock, monkeypatch: pytest.MonkeyPatch) -> None:
+    limiter = RateLimiter()
+    responses = [_response(429) for _ in range(ratelimit.MAX_RETRIES + 2)]
+    response = _send(monkeypatch, limiter, responses)
+    assert response.status_code == 429
+    assert limiter.stats()["requests"] == ratelimit.MAX_RETRIES + 1
+    assert limiter.stats()["retries"] == ratelimit.MAX_RETRIES
+
+
+def test_outage_is_not_retried(
+    clock: FakeClock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    limiter = RateLimiter()
+    response = _send(monkeypatch, limiter, [_response(503), _response(200)])
+    assert response.status_code == 503
+    assert limiter.stats()["retries"] == 0
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+
+import os
+from typing import Any, Dict, List
+
+import pytest
+
+import jiav.exceptions
+from jiav_regexinfile.backend import RegexInFileBackend
+
+
+def _execute(step: Dict[str, Any]) -> RegexInFileBackend:
+    backend = RegexInFileBackend()
+    backend.step = step
+    backend.validate_schema()
+    backend.execute_backend()
+    return backend
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+@pytest.mark.parametrize(
+    "regex, flags, successful",
+    [
+        ('failures="0"', [], True),
+        ("^<testsuite", [], False),
+        ("^<testsuite", ["MULTILINE"], True),
+        ("FAILURES", [], False),
+        ("FAILURES", ["IGNORECASE"], True),
+        ("xml.*testsuite", [], False),
+        ("xml.*testsuite", ["DOTALL"], True),
+    ],
+)
+def test_regex_in_file(
+    use_mmap: bool, regex: str, flags: List[str], successful: bool, tmp_path: str
+) -> None:
+    path = os.path.join(tmp_path, "junit.xml")
+    with open(path, "w") as f:
+        f.write('<?xml version="1.0"?>\n<testsuite failures="0">\n</testsuite>\n')
+    backend = _execute({"path": path, "regex": regex, "mmap": use_mmap, "flags": flags})
+    assert backend.result.successful == successful
+    if successful:
+        assert backend.result.output == [f"Regex '{regex}' found in '{path}'"]
+    else:
+        assert backend.result.errors == [
+            f"Regex '{regex}' is not present in file '{path}'"
+        ]
+
+
+def test_mmap_empty_file(tmp_path: str) -> None:
+    path = os.path.join(tmp_path, "empty.log")
+    open(path, "w").close()
+    assert _execute({"path": path, "regex": "^$", "mmap": True}).result.successful
+    assert not _execute({"path": path, "regex": "x", "mmap": True}).result.successful
+
+
+def test_invalid_flag() -> None:
+    with pytest.raises(jiav.exceptions.InvalidManifestException):
+        _execute({"path": "/tmp", "regex": "x", "flags": ["VERBOSE"]})
@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+
+from typing import Any
+
+import jsonschema
+import jsonschema.exceptions
+import pytest
+
+from jiav import schema
+from jiav.manifest import Manifest
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        {},
+        {"jiav": []},
+        {"jiav": {"verified_status": "Done"}},
+        {"jiav": {"verified_status": 1, "verification_steps": "step"}},
+    ],
+)
+def test_validate_errors_match_jsonschema(instance: Any) -> None:
+    with pytest.raises(jsonschema.exceptions.ValidationError) as expected:
+        jsonschema.validate(instance=instance, schema=Manifest.ROOT_JIAV_SCHEMA)
+    with pytest.raises(jsonschema.exceptions.ValidationError) as raised:
+        schema.validate(instance=instance, schema=Manifest.ROOT_JIAV_SCHEMA)
+    assert str(raised.value) == str(expected.value)
+
+
+def test_validator_is_reused() -> None:
+    validator = schema.get_validator(Manifest.STEP_SCHEMA)
+    assert schema.get_validator(Manifest.STEP_SCHEMA) is validator
+    assert schema.get_validator(dict(Manifest.STEP_SCHEMA)) is not validator
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+
+import threading
+from typing import Any, Dict, List
+
+import pytest
+
+from jiav.backend import BaseBackend, Result
+from jiav.step_results import StepResults
+from jiav_jira_issue.backend import JiraIssueBackend
+
+
+class CountingBackend(BaseBackend):
+    def __init__(self, step: Dict[str, Any], executions: List[str]) -> None:
+        super().__init__(name="counting", schema={}, step=step)
+        self.executions = executions
+
+    def execute_backend(self) -> None:
+        self.executions.append(self.step["path"])
+        self.result = Result(True, [f"{self.step['path']} exists"], [])
+
+
+class NonIdempotentBackend(CountingBackend):
+    IDEMPOTENT = False
+
+
+class FailingBackend(CountingBackend):
+    def execute_backend(self) -> None:
+        super().execute_backend()
+        raise OSError("backend crashed")
+
+
+def test_identical_steps_are_executed_once() -> None:
+    executions: List[str] = []
+    step_results = StepResults()
+    first = CountingBackend({"path": "/tmp", "line": "a"}, executions)
+    second = CountingBackend({"line": "a", "path": "/tmp"}, executions)
+    assert step_results.execute(first)
+    assert not step_results.execute(second)
+    assert second.result == first.result
+    assert executions == ["/tmp"]
+
+
+def test_different_steps_are_executed() -> None:
+    executions: List[str] = []
+    step_results = StepResults()
+    step_results.execute(CountingBackend({"path": "/tmp"}, executions))
+    step_results.execute(CountingBackend({"path": "/var"}, executions))
+    assert executions == ["/tmp", "/var"]
+
+
+def test_non_idempotent_steps_are_always_executed() -> None:
+    executions: List[str] = []
+    step_results = StepResults()
+    for _ in range(2):
+        step_results.execute(NonIdempotentBackend({"path": "/tmp"}, executions))
+    assert executions == ["/tmp", "/tmp"]
+
+
+def test_concurrent_identical_steps_are_executed_once() -> None:
+    executions: List[str] = []
+    step_results = StepResults()
+    steps = [CountingBackend({"path": "/tmp"}, executions) for _ in range(8)]
+    threads = [
+        threading.Thread(target=step_results.execute, args=(step,)) for step in steps
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert executions == ["/tmp"]
+    assert all(step.result.successful for step in steps)
+
+
+def test_error_is_shared_with_identical_steps() -> None:
+    executions: List[str] = []
+    step_results = StepResults()
+    for _ in range(2):
+        with pytest.raises(OSError, match="backend crashed"):
+            step_results.execute(FailingBackend({"path": "/tmp"}, executions))
+    assert executions == ["/tmp"]
+
+
+def test_jira_issue_steps_are_always_executed(monkeypatch: pytest.MonkeyPatch) -> None:
+    executions: List[str] = []
+
+    def execute_backend(self: JiraIssueBackend) -> None:
+        executions.append(self.step["issue"])
+        self.result = Result(True, [], [])
+
+    monkeypatch.setattr(JiraIssueBackend, "execute_backend", execute_backend)
+    step_results = StepResults()
+    for _ in range(2):
+        jira_issue = JiraIssueBackend()
+        jira_issue.step = {"issue": "TEST-1", "status": "Done"}
+        assert step_results.execute(jira_issue)
+    assert executions == ["TEST-1", "TEST-1"]
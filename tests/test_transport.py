@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator
+
+import pytest
+import requests
+
+from jiav import exceptions
+from jiav.ratelimit import RateLimiter
+from jiav.transport import Cassette, RecordingAdapter, ReplayAdapter
+
+
+class CountingHandler(BaseHTTPRequestHandler):
+    requests = 0
+
+    def _respond(self) -> None:
+        CountingHandler.requests += 1
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.dumps(
+            {
+                "path": self.path,
+                "request": CountingHandler.requests,
+                "body": self.rfile.read(length).decode(),
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _respond
+    do_POST = _respond
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CountingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def _session(adapter: requests.adapters.HTTPAdapter) -> requests.Session:
+    session = requests.Session()
+    session.mount("http://", adapter)
+    return session
+
+
+def test_record_replay(url: str, tmp_path: Any) -> None:
+    cassette = Cassette(str(tmp_path))
+    cassette.reset()
+    session = _session(RecordingAdapter(cassette, RateLimiter()))
+    recorded = [
+        session.get(f"{url}/issue?b=2&a=1").json(),
+        session.get(f"{url}/issue?a=1&b=2").json(),
+        session.post(f"{url}/comment", data="first").json(),
+    ]
+    requests_sent = CountingHandler.requests
+
+    cassette = Cassette(str(tmp_path))
+    cassette.load()
+    session = _session(ReplayAdapter(cassette))
+    # Repeated requests are replayed in order, regardless of the query order
+    assert session.get(f"{url}/issue?a=1&b=2").json() == recorded[0]
+    assert session.get(f"{url}/issue?b=2&a=1").json() == recorded[1]
+    assert session.get(f"{url}/issue?a=1&b=2").json() == recorded[1]
+    # Requests with a different body fall back to the same method and path
+    assert session.post(f"{url}/comment", data="second").json() == recorded[2]
+    # Writes which were not recorded are acknowledged
+    assert session.post(f"{url}/transitions", data="{}").json() == {}
+    with pytest.raises(exceptions.ExchangeNotRecorded):
+        session.get(f"{url}/myself")
+    assert CountingHandler.requests == requests_sent
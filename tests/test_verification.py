@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+
+import logging
+import time
+from typing import Any, List
+
+import pytest
+from jira import Issue
+
+from jiav import content, exceptions, verification
+from jiav.jira import JiraConnection
+from jiav.ledger import Ledger
+from tests.fake_jira import FakeJira
+
+
+def test_executed_manifest_is_recorded(
+    fake_jira: FakeJira, connection: JiraConnection
+) -> None:
+    execution_ledger = Ledger(":memory:")
+    issue = connection.fetch_issue("BENCH-1")
+    assert verification.verify_issue(
+        connection, issue, execution_ledger=execution_ledger  # type: ignore
+    )
+    comment = fake_jira.comments["BENCH-1"][0]
+    assert execution_ledger.get_outcome("BENCH-1", comment["id"], comment["updated"])
+    execution_ledger.close()
+
+
+def test_manifest_is_executed_again_after_failed_transition(
+    fake_jira: FakeJira, connection: JiraConnection
+) -> None:
+    execution_ledger = Ledger(":memory:")
+    issue = connection.fetch_issue("BENCH-1")
+    fake_jira.errors["POST issue/transitions"] = 500
+    with pytest.raises(exceptions.JiraUnhandledException):
+        verification.verify_issue(
+            connection, issue, execution_ledger=execution_ledger  # type: ignore
+        )
+    comment = fake_jira.comments["BENCH-1"][0]
+    assert (
+        execution_ledger.get_outcome("BENCH-1", comment["id"], comment["updated"])
+        is None
+    )
+    del fake_jira.errors["POST issue/transitions"]
+    assert verification.verify_issue(
+        connection, issue, execution_ledger=execution_ledger  # type: ignore
+    )
+    assert fake_jira.issues["BENCH-1"]["fields"]["status"]["name"] == "Done"
+    execution_ledger.close()
+
+
+def test_forced_manifest_is_executed_once_per_process(
+    fake_jira: FakeJira, connection: JiraConnection, tmp_path: Any
+) -> None:
+    (tmp_path / "verified.txt").write_text("")
+    path = str(tmp_path / "ledger.sqlite3")
+    previous_ledger = Ledger(path)
+    issue = connection.fetch_issue("BENCH-1")
+    assert not verification.verify_issue(
+        connection, issue, execution_ledger=previous_ledger  # type: ignore
+    )
+    previous_ledger.close()
+    assert fake_jira.calls["POST issue/comment"] == 1
+    execution_ledger = Ledger(path)
+    # Manifests executed by previous processes are executed again, while the
+    # failure comment posted by jiav does not execute the manifest once more
+    for _ in range(2):
+        assert not verification.verify_issue(
+            connection,
+            issue,  # type: ignore
+            execution_ledger=execution_ledger,
+            force=True,
+        )
+    assert fake_jira.calls["POST issue/comment"] == 2
+    execution_ledger.close()
+
+
+@pytest.mark.parametrize("dry_run", [True, False])
+def test_execution_output_is_closed(
+    fake_jira: FakeJira,
+    connection: JiraConnection,
+    monkeypatch: pytest.MonkeyPatch,
+    dry_run: bool,
+) -> None:
+    outputs: List[content.OutputSink] = []
+    init = content.OutputSink.__init__
+
+    def recording_init(self: content.OutputSink, *args: Any, **kwargs: Any) -> None:
+        init(self, *args, **kwargs)
+        outputs.append(self)
+
+    monkeypatch.setattr(content.OutputSink, "__init__", recording_init)
+    issue = connection.fetch_issue("BENCH-1")
+    assert (
+        verification.verify_issue(connection, issue, dry_run=dry_run)  # type: ignore
+        is not dry_run
+    )
+    assert outputs
+    assert all(output._file.closed for output in outputs)
+
+
+def _verify_out_of_order(
+    monkeypatch: pytest.MonkeyPatch, issues: int, failing_key: str = ""
+) -> None:
+    verify_issue = verification.verify_issue
+
+    def delayed_verify_issue(issue: Issue, **kwargs: Any) -> bool:
+        verification.jiav_logger.info(f"Verifying {issue.key}")
+        # Issues declared first complete last
+        time.sleep(0.05 * (issues - int(issue.key.split("-")[1])))
+        if issue.key == failing_key:
+            raise RuntimeError(f"Failed to verify {issue.key}")
+        return verify_issue(issue=issue, **kwargs)
+
+    monkeypatch.setattr(verification, "verify_issue", delayed_verify_issue)
+
+
+def _replayed_keys(caplog: pytest.LogCaptureFixture) -> List[str]:
+    return [
+        record.getMessage().split()[1]
+        for record in caplog.records
+        if record.getMessage().startswith("Verifying ")
+    ]
+
+
+@pytest.mark.parametrize("fake_jira", [{"issues": 4, "latency": 0.01}], indirect=True)
+def test_concurrent_verification_keeps_issue_order(
+    fake_jira: FakeJira,
+    connection: JiraConnection,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    keys = [f"BENCH-{i}" for i in range(1, 5)]
+    _verify_out_of_order(monkeypatch, len(keys))
+    caplog.set_level(logging.INFO)
+    verified_issues = verification.verify_issues(
+        connection,
+        issues=[connection.fetch_issue(key) for key in keys],  # type: ignore
+        workers=4,
+    )
+    assert [issue.key for issue in verified_issues] == keys
+    assert _replayed_keys(caplog) == keys
+
+
+@pytest.mark.parametrize("fake_jira", [{"issues": 4, "latency": 0.01}], indirect=True)
+def test_concurrent_verification_error_is_raised_in_order(
+    fake_jira: FakeJira,
+    connection: JiraConnection,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    keys = [f"BENCH-{i}" for i in range(1, 5)]
+    _verify_out_of_order(monkeypatch, len(keys), failing_key="BENCH-2")
+    caplog.set_level(logging.INFO)
+    with pytest.raises(RuntimeError, match="BENCH-2"):
+        verification.verify_issues(
+            connection,
+            issues=[connection.fetch_issue(key) for key in keys],  # type: ignore
+            workers=4,
+        )
+    # Records of issues following the failed issue are not replayed, even
+    # though they completed before it
+    assert _replayed_keys(caplog) == ["BENCH-1", "BENCH-2"]
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+
+import json
+import threading
+from typing import Any, Iterable, List
+
+import pytest
+
+from jiav import exceptions, incremental, watch
+from jiav.ratelimit import RateLimiter
+
+
+class FakeConnection:
+    url = "https://jira"
+
+    def __init__(self, stop: threading.Event, error: Exception) -> None:
+        self.rate_limiter = RateLimiter()
+        self.queries: List[str] = []
+        self.stop = stop
+        self.error = error
+
+    def fetch_issues(self, issues: List[str], jql: str, page_size: int) -> Any:
+        self.queries.append(jql)
+        if len(self.queries) == 1:
+            raise self.error
+        if len(self.queries) == 3:
+            self.stop.set()
+        return iter(["TEST-1"])
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        pytest.param(exceptions.JQLError("project = TEST", "Query failed"), id="jql"),
+        pytest.param(KeyError("fields"), id="unexpected"),
+    ],
+)
+def test_watch_query(
+    tmp_path: Any, monkeypatch: pytest.MonkeyPatch, error: Exception
+) -> None:
+    monkeypatch.setenv("JIAV_CACHE_DIR", str(tmp_path))
+    stop = threading.Event()
+    connection = FakeConnection(stop, error)
+    verified: List[Any] = []
+
+    def verify(issues: Iterable[Any]) -> List[Any]:
+        return list(issues)
+
+    watch.watch_query(
+        jira_connection=connection,  # type: ignore
+        query="project = TEST",
+        verify=verify,
+        stop=stop,
+        interval=0,
+        heartbeat_file=str(tmp_path / "heartbeat.json"),
+        on_verified=verified.extend,
+    )
+    # A failed poll does not advance the checkpoint
+    assert connection.queries[:2] == ["project = TEST", "project = TEST"]
+    assert connection.queries[2].startswith('(project = TEST) AND updated >= "-')
+    assert verified == ["TEST-1", "TEST-1"]
+    assert incremental.get_checkpoint("https://jira", "project = TEST")
+    with open(tmp_path / "heartbeat.json") as f:
+        heartbeat = json.load(f)
+    assert heartbeat["status"] == "stopped"
+    assert heartbeat["polls"] == 3
+    assert heartbeat["failed_polls"] == 1
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+
+import json
+import threading
+import urllib.request
+from typing import Any, Iterable, List
+
+import pytest
+
+from jiav import webhook
+
+
+@pytest.mark.parametrize(
+    "payload_file, issue",
+    [
+        ("tests/files/webhooks/comment_created.json", "TEST-1"),
+        ("tests/files/webhooks/comment_updated.json", "10002"),
+        ("tests/files/webhooks/issue_updated.json", None),
+    ],
+)
+def test_get_issue_from_payload(payload_file: str, issue: str) -> None:
+    with open(payload_file) as f:
+        assert webhook.get_issue_from_payload(json.load(f)) == issue
+
+
+def test_issue_queue_debounce() -> None:
+    issue_queue = webhook.IssueQueue(debounce=0.2)
+    issue_queue.put("TEST-1")
+    issue_queue.put("TEST-1")
+    assert issue_queue.get(timeout=0) is None
+    assert issue_queue.get(timeout=1) == "TEST-1"
+    # An issue is not released while it is being verified
+    issue_queue.put("TEST-1")
+    assert issue_queue.get(timeout=0.3) is None
+    issue_queue.done("TEST-1")
+    assert issue_queue.get(timeout=0) == "TEST-1"
+    assert len(issue_queue) == 0
+
+
+class FakeConnection:
+    def fetch_issues(self, issues: List[str], jql: str) -> Any:
+        return iter(issues)
+
+
+def _post(url: str, payload_file: str) -> int:
+    with open(payload_file, "rb") as f:
+        request = urllib.request.Request(
+            url, data=f.read(), headers={"Content-Type": "application/json"}
+        )
+    with urllib.request.urlopen(request) as response:
+        return int(response.status)
+
+
+def test_serve() -> None:
+    stop = threading.Event()
+    verified: List[Any] = []
+    responses: List[int] = []
+
+    def verify(issues: Iterable[Any]) -> List[Any]:
+        verified.extend(issues)
+        if len(verified) == 2:
+            stop.set()
+        return list(issues)
+
+    def post_payloads(server: webhook.WebhookServer) -> None:
+        url = f"http://127.0.0.1:{server.server_port}/"
+        for payload_file in [
+            "tests/files/webhooks/comment_created.json",
+            "tests/files/webhooks/comment_created.json",
+            "tests/files/webhooks/issue_updated.json",
+            "tests/files/webhooks/comment_updated.json",
+            "tests/files/webhooks/comment_created.json",
+        ]:
+            responses.append(_post(url, payload_file))
+
+    timer = threading.Timer(10, stop.set)
+    timer.start()
+    try:
+        webhook.serve(
+            jira_connection=FakeConnection(),  # type: ignore
+            verify=verify,
+            stop=stop,
+            port=0,
+            debounce=0.5,
+            on_listening=post_payloads,
+        )
+    finally:
+        timer.cancel()
+    assert responses == [202, 202, 204, 202, 202]
+    # Bursts of events of an issue are verified once
+    assert sorted(verified) == ["10002", "TEST-1"]
+
+
+def test_serve_continues_after_failed_verification() -> None:
+    stop = threading.Event()
+    verified: List[Any] = []
+
+    def verify(issues: Iterable[Any]) -> List[Any]:
+        issues = list(issues)
+        if issues == ["TEST-1"]:
+            raise RuntimeError("backend crashed")
+        verified.extend(issues)
+        stop.set()
+        return issues
+
+    def post_payloads(server: webhook.WebhookServer) -> None:
+        url = f"http://127.0.0.1:{server.server_port}/"
+        _post(url, "tests/files/webhooks/comment_created.json")
+        _post(url, "tests/files/webhooks/comment_updated.json")
+
+    timer = threading.Timer(10, stop.set)
+    timer.start()
+    try:
+        webhook.serve(
+            jira_connection=FakeConnection(),  # type: ignore
+            verify=verify,
+            stop=stop,
+            port=0,
+            debounce=0.1,
+            on_listening=post_payloads,
+        )
+    finally:
+        timer.cancel()
+    # The single consumer keeps verifying issues after a failure
+    assert verified == ["10002"]